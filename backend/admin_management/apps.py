@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class AdminManagementConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'admin_management'
\ No newline at end of file
+    name = 'admin_management'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
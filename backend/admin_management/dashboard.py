@@ -0,0 +1,129 @@
+"""
+Admin dashboard statistics.
+
+STATS lists, per model, the counters shown on the admin home: a total and
+conditional counts on one field. compute_stats() runs a single conditional
+aggregate per table. With ADMIN_STATS_SNAPSHOT enabled the figures are
+kept in the one-row DashboardStatsSnapshot table: signals apply +1/-1
+deltas as rows are created, deleted or change the counted field, so the
+dashboard reads a single row by primary key. Writes that bypass signals
+(queryset.update(), raw SQL) make the snapshot drift; it is recomputed
+when older than ADMIN_STATS_MAX_AGE seconds or on ?refresh=true.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from authentication.models import User
+from recruiter.models import JobPost
+from .models import (
+    AdmissionPost, AdmissionRegistration, DashboardStatsSnapshot, Webinar, WebinarRegistration
+)
+
+SNAPSHOT_PK = 1
+
+# model -> (total counter, {conditional counter: (field, value)})
+STATS = {
+    User: ('total_users', {
+        'total_candidates': ('role', 'candidate'),
+        'total_recruiters': ('role', 'recruiter'),
+        'total_admins': ('role', 'admin'),
+    }),
+    JobPost: ('total_jobs', {'published_jobs': ('is_published', True)}),
+    Webinar: ('total_webinars', {'active_webinars': ('is_active', True)}),
+    AdmissionPost: ('total_admissions', {'active_admissions': ('is_active', True)}),
+    WebinarRegistration: ('total_webinar_registrations', {}),
+    AdmissionRegistration: ('total_admission_applications', {}),
+}
+
+STAT_NAMES = [
+    name for total, conditions in STATS.values() for name in [total, *conditions]
+]
+
+
+def snapshot_enabled():
+    return getattr(settings, 'ADMIN_STATS_SNAPSHOT', True)
+
+
+def get_max_age():
+    return getattr(settings, 'ADMIN_STATS_MAX_AGE', 24 * 60 * 60)
+
+
+def compute_stats():
+    """Count every dashboard figure, one aggregate query per table"""
+    stats = {}
+    for model, (total, conditions) in STATS.items():
+        aggregates = {total: Count('pk')}
+        for name, (field, value) in conditions.items():
+            aggregates[name] = Count('pk', filter=Q(**{field: value}))
+        stats.update(model.objects.aggregate(**aggregates))
+    return stats
+
+
+def recompute_snapshot():
+    """Rebuild the snapshot row from COUNT queries and return it"""
+    now = timezone.now()
+    snapshot, _ = DashboardStatsSnapshot.objects.update_or_create(
+        pk=SNAPSHOT_PK,
+        defaults={**compute_stats(), 'computed_at': now, 'updated_at': now},
+    )
+    return snapshot
+
+
+def get_dashboard_stats(refresh=False):
+    """
+    Return (stats, computed_at, updated_at). Reads the snapshot row when
+    enabled, recomputing it when missing, stale or when refresh is set.
+    """
+    if not snapshot_enabled():
+        now = timezone.now()
+        return compute_stats(), now, now
+
+    snapshot = None if refresh else DashboardStatsSnapshot.objects.filter(pk=SNAPSHOT_PK).first()
+    if snapshot is None or snapshot.computed_at < timezone.now() - timedelta(seconds=get_max_age()):
+        snapshot = recompute_snapshot()
+    stats = {name: getattr(snapshot, name) for name in STAT_NAMES}
+    return stats, snapshot.computed_at, snapshot.updated_at
+
+
+def apply_deltas(deltas):
+    """Add {counter: delta} to the snapshot row, if there is one"""
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas or not snapshot_enabled():
+        return
+    DashboardStatsSnapshot.objects.filter(pk=SNAPSHOT_PK).update(
+        updated_at=timezone.now(),
+        **{name: F(name) + delta for name, delta in deltas.items()}
+    )
+
+
+def row_deltas(model, instance, sign, values=None):
+    """Counter deltas for a row entering (sign=1) or leaving (sign=-1) the counts"""
+    total, conditions = STATS[model]
+    values = values or {}
+    deltas = {total: sign}
+    for name, (field, value) in conditions.items():
+        if values.get(field, getattr(instance, field)) == value:
+            deltas[name] = sign
+    return deltas
+
+
+def change_deltas(model, instance, update_fields=None):
+    """Counter deltas for a saved row whose counted field changed since it was loaded"""
+    deltas = {}
+    for name, (field, value) in STATS[model][1].items():
+        if update_fields is not None and field not in update_fields:
+            continue
+        old = getattr(instance, f'_loaded_{field}', None)
+        new = getattr(instance, field)
+        if old is None or old == new:
+            continue
+        deltas[name] = (new == value) - (old == value)
+    return deltas
+
+
+def remember_loaded(model, instance):
+    """Record the counted field values just saved, as from_db does on load"""
+    for field, _ in STATS[model][1].values():
+        setattr(instance, f'_loaded_{field}', getattr(instance, field))
@@ -0,0 +1,176 @@
+"""
+Admin exports of users, webinar registrations, admission applications and
+college applications.
+
+Each dataset reuses the search filters of its admin list endpoint. Small
+exports are streamed straight to the client (see job_portal/exports.py);
+exports over ADMIN_EXPORT_STREAM_LIMIT rows, or requested with
+?background=true, become ExportJob rows that the background job runner
+(`manage.py run_background_jobs`) writes to MEDIA_ROOT/exports/, so a
+long export never holds a gunicorn worker. Finished files are downloaded through an admin-only
+endpoint rather than a public media URL.
+"""
+import os
+import secrets
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+from admissions.filters import filter_college_applications
+from job_portal.exports import export_rows, write_export
+from .filters import filter_admission_applications, filter_users, filter_webinar_registrations
+from .models import ExportJob
+
+EXPORT_DIR = 'exports'
+
+# Jobs still running after this long are assumed lost with their worker
+CLAIM_TIMEOUT = timedelta(hours=1)
+
+USER_COLUMNS = {
+    'id': 'id',
+    'email': 'email',
+    'first_name': 'first_name',
+    'last_name': 'last_name',
+    'role': 'role',
+    'phone': 'phone',
+    'city': 'city',
+    'state': 'state',
+    'is_active': 'is_active',
+    'approval_status': 'approval_status',
+    'profile_completion': 'profile_completion',
+    'experience_years': 'experience_years',
+    'created_at': 'created_at',
+}
+
+WEBINAR_REGISTRATION_COLUMNS = {
+    'id': 'id',
+    'registered_at': 'registered_at',
+    'status': 'status',
+    'webinar_id': 'webinar_id',
+    'webinar_title': 'webinar__title',
+    'webinar_date': 'webinar__date',
+    'user_id': 'user_id',
+    'user_name': Concat('user__first_name', Value(' '), 'user__last_name'),
+    'user_email': 'user__email',
+    'user_phone': 'user__phone',
+}
+
+ADMISSION_APPLICATION_COLUMNS = {
+    'id': 'id',
+    'applied_at': 'applied_at',
+    'status': 'status',
+    'admission_id': 'admission_id',
+    'college_name': 'admission__college_name',
+    'user_id': 'user_id',
+    'user_name': Concat('user__first_name', Value(' '), 'user__last_name'),
+    'user_email': 'user__email',
+    'user_phone': 'user__phone',
+    'documents_submitted': 'documents_submitted',
+    'notes': 'notes',
+}
+
+COLLEGE_APPLICATION_COLUMNS = {
+    'id': 'id',
+    'applied_at': 'applied_at',
+    'status': 'status',
+    'user_id': 'user_id',
+    'college_name': 'college_name',
+    'full_name': 'full_name',
+    'email': 'email',
+    'phone': 'phone',
+    'gender': 'gender',
+    'city': 'city',
+    'state': 'state',
+    'pincode': 'pincode',
+    'qualification': 'qualification',
+    'percentage': 'percentage',
+    'course': 'course',
+    'branch': 'branch',
+    'message': 'message',
+    'admin_notes': 'admin_notes',
+}
+
+# Dataset name -> (filter function taking query parameters, exported columns)
+EXPORTS = {
+    'users': (filter_users, USER_COLUMNS),
+    'webinar_registrations': (filter_webinar_registrations, WEBINAR_REGISTRATION_COLUMNS),
+    'admission_applications': (filter_admission_applications, ADMISSION_APPLICATION_COLUMNS),
+    'college_applications': (filter_college_applications, COLLEGE_APPLICATION_COLUMNS),
+}
+
+
+def get_stream_limit():
+    return getattr(settings, 'ADMIN_EXPORT_STREAM_LIMIT', 10000)
+
+
+def export_queryset(dataset, params):
+    filter_rows, _ = EXPORTS[dataset]
+    return filter_rows(params).order_by('-pk')
+
+
+def dataset_rows(dataset, params):
+    """Export rows of a dataset filtered by query parameters"""
+    return export_rows(export_queryset(dataset, params), EXPORTS[dataset][1])
+
+
+def export_filename(dataset):
+    return f'{dataset}-{timezone.now():%Y%m%d-%H%M%S}'
+
+
+def queue_export(user, dataset, export_format, params):
+    """Record an export for the background worker"""
+    return ExportJob.objects.create(
+        requested_by=user,
+        dataset=dataset,
+        export_format=export_format,
+        params=params,
+    )
+
+
+def run_export_job(job):
+    """
+    Write a pending export to MEDIA_ROOT/exports/. Returns False when another
+    worker claimed the job first.
+    """
+    claimed = ExportJob.objects.filter(pk=job.pk, status='pending').update(
+        status='running', started_at=timezone.now()
+    )
+    if not claimed:
+        return False
+
+    # Unguessable name: the directory may be served as media in development
+    name = f'{EXPORT_DIR}/{export_filename(job.dataset)}-{secrets.token_hex(8)}.{job.export_format}'
+    path = os.path.join(settings.MEDIA_ROOT, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        job.row_count = write_export(
+            path, job.export_format, EXPORTS[job.dataset][1], dataset_rows(job.dataset, job.params)
+        )
+    except Exception as e:
+        job.status = 'failed'
+        job.error = str(e)
+        if os.path.exists(path):
+            os.remove(path)
+    else:
+        job.status = 'done'
+        job.file.name = name
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'error', 'file', 'row_count', 'finished_at'])
+    return True
+
+
+def requeue_stale_exports():
+    """Return jobs claimed by a worker that died mid-export to the queue"""
+    return ExportJob.objects.filter(
+        status='running', started_at__lt=timezone.now() - CLAIM_TIMEOUT
+    ).update(status='pending', started_at=None)
+
+
+def process_pending_exports(limit=None):
+    """Run pending export jobs, oldest first. Returns the number run."""
+    pending = ExportJob.objects.filter(status='pending').order_by('created_at')
+    if limit:
+        pending = pending[:limit]
+    return sum(run_export_job(job) for job in pending)
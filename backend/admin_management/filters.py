@@ -0,0 +1,69 @@
+"""
+Search filters shared by the admin list endpoints and their exports.
+"""
+from django.db.models import Q
+
+from authentication.models import User
+from .models import AdmissionRegistration, WebinarRegistration
+
+
+def filter_users(params):
+    """
+    Users matching query parameters:
+      search=X    first name, last name or email containing X
+      role=X      users with role X
+    """
+    users = User.objects.all()
+    search = params.get('search', '')
+    if search:
+        users = users.filter(
+            Q(first_name__icontains=search) |
+            Q(last_name__icontains=search) |
+            Q(email__icontains=search)
+        )
+    role = params.get('role', '')
+    if role:
+        users = users.filter(role=role)
+    return users
+
+
+def filter_webinar_registrations(params):
+    """
+    Webinar registrations matching query parameters:
+      webinar_id=N   registrations for one webinar
+      search=X       user name, user email or webinar title containing X
+    """
+    registrations = WebinarRegistration.objects.all()
+    webinar_id = params.get('webinar_id')
+    if webinar_id:
+        registrations = registrations.filter(webinar_id=webinar_id)
+    search = params.get('search', '')
+    if search:
+        registrations = registrations.filter(
+            Q(user__first_name__icontains=search) |
+            Q(user__last_name__icontains=search) |
+            Q(user__email__icontains=search) |
+            Q(webinar__title__icontains=search)
+        )
+    return registrations
+
+
+def filter_admission_applications(params):
+    """
+    Admission applications matching query parameters:
+      admission_id=N   applications to one admission post
+      search=X         user name, user email or college name containing X
+    """
+    applications = AdmissionRegistration.objects.all()
+    admission_id = params.get('admission_id')
+    if admission_id:
+        applications = applications.filter(admission_id=admission_id)
+    search = params.get('search', '')
+    if search:
+        applications = applications.filter(
+            Q(user__first_name__icontains=search) |
+            Q(user__last_name__icontains=search) |
+            Q(user__email__icontains=search) |
+            Q(admission__college_name__icontains=search)
+        )
+    return applications
@@ -0,0 +1,88 @@
+import statistics
+import time
+from io import BytesIO
+from urllib.parse import urlsplit
+from wsgiref.util import setup_testing_defaults
+
+from django.core.cache import cache
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+DEFAULT_PATHS = [
+    '/api/jobs/public',
+    '/api/jobs/public?facets=true',
+    '/api/jobs/search?q=developer',
+    '/api/webinars/public',
+    '/api/admissions/public',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure request latency of read endpoints against the configured database. '
+        'Requests go through the WSGI handler, so connection setup and CONN_MAX_AGE '
+        'behave as under gunicorn.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help='Paths to request (default: the public listings)')
+        parser.add_argument('--requests', type=int, default=200, help='Timed requests per path (default: 200)')
+        parser.add_argument('--warmup', type=int, default=10, help='Untimed requests per path first (default: 10)')
+        parser.add_argument(
+            '--use-cache',
+            action='store_true',
+            help='Keep the public response cache (by default it is cleared before each request)'
+        )
+
+    def request(self, handler, path):
+        url = urlsplit(path)
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': url.path,
+            'QUERY_STRING': url.query,
+            'wsgi.input': BytesIO(),
+        }
+        setup_testing_defaults(environ)
+        response = handler(environ, lambda status, headers: None)
+        status = response.status_code
+        # Closing the response fires request_finished, which closes the
+        # database connection unless CONN_MAX_AGE keeps it open
+        response.close()
+        return status
+
+    def handle(self, *args, **options):
+        handler = WSGIHandler()
+        paths = options['paths'] or DEFAULT_PATHS
+        settings_dict = connection.settings_dict
+
+        description = f"Database: {connection.vendor} | CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}"
+        if connection.vendor == 'postgresql':
+            pooled = settings_dict.get('DISABLE_SERVER_SIDE_CURSORS')
+            description += f" | {'pooler mode' if pooled else 'direct'}"
+        self.stdout.write(f"{description} | {options['requests']} requests per path")
+        self.stdout.write(f"{'path':<40} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}  (ms)")
+
+        for path in paths:
+            for _ in range(options['warmup']):
+                self.request(handler, path)
+
+            timings = []
+            for _ in range(options['requests']):
+                if not options['use_cache']:
+                    cache.clear()
+                started = time.perf_counter()
+                status = self.request(handler, path)
+                timings.append((time.perf_counter() - started) * 1000)
+                if status != 200:
+                    self.stderr.write(f'{path} returned {status}')
+                    break
+
+            if not timings:
+                continue
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(
+                f'{path:<40} {statistics.mean(timings):>8.2f} {statistics.median(timings):>8.2f} '
+                f'{p95:>8.2f} {timings[-1]:>8.2f}'
+            )
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from admin_management.exports import process_pending_exports, requeue_stale_exports
+
+
+class Command(BaseCommand):
+    help = (
+        'Write queued admin exports to MEDIA_ROOT/exports/. Runs the pending jobs once, '
+        'or keeps polling for new ones with --poll.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll',
+            type=float,
+            default=0,
+            help='Seconds to wait between queue checks; 0 runs the pending jobs once and exits (default: 0)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            requeued = requeue_stale_exports()
+            if requeued:
+                self.stdout.write(self.style.WARNING(f'Requeued {requeued} abandoned export jobs'))
+            processed = process_pending_exports()
+            if processed:
+                self.stdout.write(self.style.SUCCESS(f'Processed {processed} export jobs'))
+            if not options['poll']:
+                break
+            close_old_connections()
+            time.sleep(options['poll'])
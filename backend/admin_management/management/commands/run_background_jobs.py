@@ -0,0 +1,93 @@
+import time
+import traceback
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from admin_management.exports import process_pending_exports, requeue_stale_exports
+from authentication.notifications import send_due_digests
+from authentication.outbox import requeue_stale_claims, send_batch
+from authentication.revocation import purge_expired_tokens
+
+
+def run_exports():
+    lines = []
+    requeued = requeue_stale_exports()
+    if requeued:
+        lines.append(f'Requeued {requeued} abandoned export jobs')
+    processed = process_pending_exports()
+    if processed:
+        lines.append(f'Processed {processed} export jobs')
+    return '\n'.join(lines)
+
+
+def run_outbox():
+    lines = []
+    requeued = requeue_stale_claims()
+    if requeued:
+        lines.append(f'Requeued {requeued} abandoned messages')
+    sent = failed = 0
+    while True:
+        # Failed messages are rescheduled, so the queue of due ones drains
+        batch_sent, batch_failed = send_batch()
+        if not (batch_sent or batch_failed):
+            break
+        sent += batch_sent
+        failed += batch_failed
+    if sent or failed:
+        lines.append(f'Sent {sent} messages, {failed} failed')
+    return '\n'.join(lines)
+
+
+def run_digests():
+    emails, covered = send_due_digests()
+    return f'Queued {emails} digest emails covering {covered} notifications' if emails else ''
+
+
+def run_token_purge():
+    deleted = purge_expired_tokens()
+    return f'Deleted {deleted} expired tokens' if deleted else ''
+
+
+# (name, seconds between runs, job returning a summary line or '')
+JOBS = [
+    ('exports', 5, run_exports),
+    ('outbox', 5, run_outbox),
+    ('digests', 60, run_digests),
+    ('tokens', 3600, run_token_purge),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Run every background job in one process: queued admin exports, the email outbox, '
+        'notification digests and the expired token purge. Each job runs on its own '
+        'interval until stopped, or once with --once.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run every job once and exit'
+        )
+
+    def handle(self, *args, **options):
+        due = {name: 0 for name, _, _ in JOBS}
+        while True:
+            for name, interval, job in JOBS:
+                if time.monotonic() < due[name]:
+                    continue
+                due[name] = time.monotonic() + interval
+                try:
+                    summary = job()
+                except Exception:
+                    # One failing job must not stop the others
+                    self.stderr.write(f'{name} failed:\n{traceback.format_exc()}')
+                    continue
+                if summary:
+                    self.stdout.write(self.style.SUCCESS(summary))
+            if options['once']:
+                break
+            close_old_connections()
+            time.sleep(max(0, min(due.values()) - time.monotonic()))
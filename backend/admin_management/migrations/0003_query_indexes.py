@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_management', '0002_webinarregistration_admissionregistration'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='admissionpost',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='admission_posts_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webinar',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='webinars_active_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_management', '0003_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStatsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_users', models.IntegerField(default=0)),
+                ('total_candidates', models.IntegerField(default=0)),
+                ('total_recruiters', models.IntegerField(default=0)),
+                ('total_admins', models.IntegerField(default=0)),
+                ('total_jobs', models.IntegerField(default=0)),
+                ('published_jobs', models.IntegerField(default=0)),
+                ('total_webinars', models.IntegerField(default=0)),
+                ('active_webinars', models.IntegerField(default=0)),
+                ('total_admissions', models.IntegerField(default=0)),
+                ('active_admissions', models.IntegerField(default=0)),
+                ('total_webinar_registrations', models.IntegerField(default=0)),
+                ('total_admission_applications', models.IntegerField(default=0)),
+                ('computed_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'dashboard_stats',
+            },
+        ),
+    ]
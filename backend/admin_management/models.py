@@ -39,6 +39,19 @@ class Webinar(models.Model):
     class Meta:
         db_table = 'webinars'
         ordering = ['-created_at']
+        indexes = [
+            # Public listing: active rows only, newest first
+            models.Index(fields=['-created_at'], condition=models.Q(is_active=True), name='webinars_active_idx'),
+        ]
+    
+    # is_active as loaded from the database, to detect changes on save
+    _loaded_is_active = None
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_is_active = instance.__dict__.get('is_active')
+        return instance
     
     def __str__(self):
         return self.title
@@ -65,6 +78,19 @@ class AdmissionPost(models.Model):
     class Meta:
         db_table = 'admission_posts'
         ordering = ['-created_at']
+        indexes = [
+            # Public listing: active rows only, newest first
+            models.Index(fields=['-created_at'], condition=models.Q(is_active=True), name='admission_posts_active_idx'),
+        ]
+    
+    # is_active as loaded from the database, to detect changes on save
+    _loaded_is_active = None
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_is_active = instance.__dict__.get('is_active')
+        return instance
     
     def __str__(self):
         return self.college_name
@@ -119,4 +145,72 @@ class AdmissionRegistration(models.Model):
         ordering = ['-applied_at']
     
     def __str__(self):
-        return f"{self.user.email} - {self.admission.college_name}"
\ No newline at end of file
+        return f"{self.user.email} - {self.admission.college_name}"
+
+class DashboardStatsSnapshot(models.Model):
+    """
+    Single-row table holding the admin dashboard counters.
+    Signals in admin_management/signals.py keep it current by deltas; it is
+    rebuilt from COUNT queries when stale or on request.
+    """
+    
+    total_users = models.IntegerField(default=0)
+    total_candidates = models.IntegerField(default=0)
+    total_recruiters = models.IntegerField(default=0)
+    total_admins = models.IntegerField(default=0)
+    total_jobs = models.IntegerField(default=0)
+    published_jobs = models.IntegerField(default=0)
+    total_webinars = models.IntegerField(default=0)
+    active_webinars = models.IntegerField(default=0)
+    total_admissions = models.IntegerField(default=0)
+    active_admissions = models.IntegerField(default=0)
+    total_webinar_registrations = models.IntegerField(default=0)
+    total_admission_applications = models.IntegerField(default=0)
+    
+    # Last full recompute, and last change of any counter
+    computed_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'dashboard_stats'
+    
+    def __str__(self):
+        return f"Dashboard stats computed at {self.computed_at}"
+
+
+class ExportJob(models.Model):
+    """
+    Admin export written to a file under MEDIA_ROOT by the
+    background job runner instead of inside a web request.
+    """
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
+    requested_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='export_jobs')
+    dataset = models.CharField(max_length=50)
+    export_format = models.CharField(max_length=10)
+    params = models.JSONField(default=dict, blank=True, help_text="Filters the export was requested with")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    file = models.FileField(upload_to='exports/', blank=True)
+    row_count = models.IntegerField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'export_jobs'
+        ordering = ['-created_at']
+        indexes = [
+            # Worker queue scan and per-admin job list
+            models.Index(fields=['status', 'created_at'], name='export_jobs_queue_idx'),
+            models.Index(fields=['requested_by', '-created_at'], name='export_jobs_user_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.dataset}.{self.export_format} ({self.status})"
@@ -0,0 +1,157 @@
+"""
+Response cache for public (anonymous) listing endpoints.
+
+Cached entries hold the rendered JSON body and a gzip-compressed copy, so
+a hit skips the queries, the serializer and compression. Entries are keyed
+on the endpoint namespace, the namespace generation and the normalized
+query parameters. Saving or deleting a model bumps the generation of the
+namespaces that show it once the change commits (see
+admin_management/signals.py), which makes every older entry unreachable
+at once.
+
+Hit/miss counters are kept in the cache and exposed to admins through
+/api/admin/cache-stats/.
+"""
+import gzip
+import hashlib
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+KEY_PREFIX = 'public_cache'
+
+# Namespaces served by cache_public_response, listed for the stats endpoint
+NAMESPACES = ['jobs', 'webinars', 'admissions', 'all_webinars', 'all_admissions']
+
+
+def get_timeout():
+    return getattr(settings, 'PUBLIC_RESPONSE_CACHE_TIMEOUT', 300)
+
+
+def generation_key(namespace):
+    return f'{KEY_PREFIX}:{namespace}:generation'
+
+
+def stats_key(namespace, kind):
+    return f'{KEY_PREFIX}:{namespace}:{kind}'
+
+
+def get_generation(namespace):
+    generation = cache.get(generation_key(namespace))
+    if generation is None:
+        cache.add(generation_key(namespace), 1, timeout=None)
+        generation = cache.get(generation_key(namespace), 1)
+    return generation
+
+
+def increment(key):
+    """Increment a counter key, creating it on first use"""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key)
+
+
+def invalidate(*namespaces):
+    """Drop every cached response in the given namespaces"""
+    for namespace in namespaces:
+        increment(generation_key(namespace))
+
+
+def normalized_params(request):
+    """Query parameters in a canonical order, so ?a=1&b=2 and ?b=2&a=1 share an entry"""
+    items = []
+    for key in sorted(request.GET.keys()):
+        for value in sorted(request.GET.getlist(key)):
+            items.append((key, value))
+    return urlencode(items)
+
+
+def entry_key(namespace, request):
+    digest = hashlib.md5(normalized_params(request).encode()).hexdigest()
+    return f'{KEY_PREFIX}:{namespace}:{get_generation(namespace)}:{digest}'
+
+
+def accepts_gzip(request):
+    return 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+
+
+def build_response(entry, request):
+    """Build the HTTP response for a cached entry, gzipped when the client accepts it"""
+    body, compressed, content_type = entry
+    if accepts_gzip(request):
+        response = HttpResponse(compressed, content_type=content_type)
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(body, content_type=content_type)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def cache_public_response(namespace):
+    """
+    Cache successful anonymous GET responses of a public DRF view.
+    Apply it above @api_view so hits bypass DRF entirely.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            # Only anonymous GETs are cached; a request carrying credentials goes
+            # through DRF so authentication errors are still reported.
+            if request.method != 'GET' or 'HTTP_AUTHORIZATION' in request.META:
+                return view_func(request, *args, **kwargs)
+
+            key = entry_key(namespace, request)
+            entry = cache.get(key)
+            if entry is not None:
+                increment(stats_key(namespace, 'hits'))
+                response = build_response(entry, request)
+                response['X-Cache'] = 'HIT'
+                return response
+
+            increment(stats_key(namespace, 'misses'))
+            response = view_func(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+            if hasattr(response, 'render'):
+                response.render()
+            body = response.content
+            entry = (body, gzip.compress(body), response['Content-Type'])
+            cache.set(key, entry, timeout=get_timeout())
+
+            if accepts_gzip(request):
+                response = build_response(entry, request)
+            else:
+                patch_vary_headers(response, ('Accept-Encoding',))
+            response['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+
+def get_stats():
+    """Hit/miss counters for every cached namespace"""
+    stats = {}
+    for namespace in NAMESPACES:
+        hits = cache.get(stats_key(namespace, 'hits'), 0)
+        misses = cache.get(stats_key(namespace, 'misses'), 0)
+        total = hits + misses
+        stats[namespace] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total * 100, 1) if total else 0.0,
+            'generation': get_generation(namespace),
+        }
+    return stats
+
+
+def reset_stats():
+    cache.delete_many(
+        [stats_key(namespace, kind) for namespace in NAMESPACES for kind in ('hits', 'misses')]
+    )
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.urls import reverse
 from authentication.models import User
-from recruiter.models import JobPost
-from .models import Webinar, AdmissionPost, WebinarRegistration, AdmissionRegistration
+from recruiter.models import JobPost, get_application_counts
+from .models import Webinar, AdmissionPost, WebinarRegistration, AdmissionRegistration, ExportJob
 
 class UserManagementSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=False)
@@ -36,14 +37,19 @@ class UserManagementSerializer(serializers.ModelSerializer):
 class JobPostSerializer(serializers.ModelSerializer):
     recruiter_name = serializers.CharField(source='recruiter.get_full_name', read_only=True)
     company_name = serializers.CharField(source='recruiter.company_profile.company_name', read_only=True)
+    application_counts = serializers.SerializerMethodField()
     
     class Meta:
         model = JobPost
         fields = [
             'id', 'job_title', 'location', 'job_type', 'work_mode', 
             'experience_level', 'min_salary', 'max_salary', 'job_description',
-            'is_published', 'created_at', 'updated_at', 'recruiter_name', 'company_name'
+            'is_published', 'created_at', 'updated_at', 'recruiter_name', 'company_name',
+            'applications_count', 'application_counts'
         ]
+    
+    def get_application_counts(self, obj):
+        return get_application_counts(obj)
 
 class WebinarSerializer(serializers.ModelSerializer):
     created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
@@ -108,4 +114,24 @@ class AdmissionRegistrationSerializer(serializers.ModelSerializer):
             'documents_submitted', 'notes', 'admission_college', 'admission_location',
             'admission_deadline', 'user_name', 'user_email', 'user_phone'
         ]
-        read_only_fields = ['applied_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['applied_at', 'updated_at']
+
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    download_url = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ExportJob
+        fields = [
+            'id', 'dataset', 'export_format', 'params', 'status', 'row_count', 'error',
+            'created_at', 'started_at', 'finished_at', 'download_url'
+        ]
+        read_only_fields = fields
+    
+    def get_download_url(self, obj):
+        """Admin-only download link once the file is written"""
+        if obj.status != 'done':
+            return None
+        url = reverse('admin_export_download', args=[obj.id])
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
@@ -0,0 +1,52 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from recruiter.models import JobPost, RecruiterCompanyProfile
+from .models import Webinar, AdmissionPost
+from .dashboard import STATS, apply_deltas, change_deltas, remember_loaded, row_deltas
+from .response_cache import invalidate
+
+# Cached public namespaces that display each model
+INVALIDATES = {
+    JobPost: ['jobs'],
+    # Company names are shown on every job row
+    RecruiterCompanyProfile: ['jobs'],
+    Webinar: ['webinars', 'all_webinars'],
+    AdmissionPost: ['admissions', 'all_admissions'],
+}
+
+
+def invalidate_public_cache(sender, **kwargs):
+    """Drop cached public listings when a model they display changes"""
+    # After commit: bumped earlier, a request could cache the old rows under
+    # the new generation
+    namespaces = INVALIDATES[sender]
+    transaction.on_commit(lambda: invalidate(*namespaces))
+
+
+for model in INVALIDATES:
+    post_save.connect(invalidate_public_cache, sender=model, dispatch_uid=f'public_cache_save_{model.__name__}')
+    post_delete.connect(invalidate_public_cache, sender=model, dispatch_uid=f'public_cache_delete_{model.__name__}')
+
+
+def count_dashboard_save(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """Move the dashboard snapshot counters when a counted row is created or changes"""
+    if raw:
+        return
+    if created:
+        apply_deltas(row_deltas(sender, instance, 1))
+    else:
+        apply_deltas(change_deltas(sender, instance, update_fields))
+    remember_loaded(sender, instance)
+
+
+def count_dashboard_delete(sender, instance, **kwargs):
+    loaded = {
+        field: getattr(instance, f'_loaded_{field}', None)
+        for field, _ in STATS[sender][1].values()
+    }
+    apply_deltas(row_deltas(sender, instance, -1, {k: v for k, v in loaded.items() if v is not None}))
+
+
+for model in STATS:
+    post_save.connect(count_dashboard_save, sender=model, dispatch_uid=f'dashboard_stats_save_{model.__name__}')
+    post_delete.connect(count_dashboard_delete, sender=model, dispatch_uid=f'dashboard_stats_delete_{model.__name__}')
@@ -0,0 +1,247 @@
+import csv
+import gzip
+import json
+import shutil
+import tempfile
+from datetime import date, time, timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from authentication.models import User
+from job_portal.query_plans import QueryPlanTestMixin
+from .dashboard import STATS, compute_stats
+from .models import ExportJob, Webinar, WebinarRegistration
+
+
+def create_admin(email='admin@example.com'):
+    return User.objects.create_user(
+        email=email, password='testpass123', first_name='Ada', last_name='Admin', role='admin'
+    )
+
+
+def create_webinar(admin, **extra_fields):
+    fields = {
+        'title': 'Intro to Django',
+        'speaker': 'Sam Speaker',
+        'organization': 'MytechZ',
+        'date': date(2026, 12, 1),
+        'time': time(10, 0),
+        'platform': 'Zoom',
+        'description': 'Basics',
+    }
+    fields.update(extra_fields)
+    return Webinar.objects.create(created_by=admin, **fields)
+
+
+class PublicResponseCacheTests(TestCase):
+    """Signal-invalidated cache on the public listing endpoints"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin = create_admin()
+        self.webinar = create_webinar(self.admin)
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get('/api/webinars/public')
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/webinars/public')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(json.loads(second.content), first.data)
+
+    def test_query_parameter_order_is_normalized(self):
+        self.client.get('/api/jobs/public?limit=5&job_type=Contract')
+        response = self.client.get('/api/jobs/public?job_type=Contract&limit=5')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_save_and_delete_invalidate(self):
+        self.client.get('/api/webinars/public')
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.webinar.title = 'Advanced Django'
+            self.webinar.save()
+            # Until the change commits, other requests still see the old rows
+            self.assertEqual(self.client.get('/api/webinars/public')['X-Cache'], 'HIT')
+        for callback in callbacks:
+            callback()
+        response = self.client.get('/api/webinars/public')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['webinars'][0]['title'], 'Advanced Django')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.webinar.delete()
+        response = self.client.get('/api/webinars/public')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['total'], 0)
+
+    def test_precompressed_body(self):
+        self.client.get('/api/webinars/public')
+        response = self.client.get('/api/webinars/public', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content))['total'], 1)
+
+    def test_stats_visible_to_admins(self):
+        self.client.get('/api/webinars/public')
+        self.client.get('/api/webinars/public')
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get('/api/admin/cache-stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['cache']['webinars']['hits'], 1)
+        self.assertEqual(response.data['cache']['webinars']['misses'], 1)
+
+
+class DashboardStatsTests(TestCase):
+    """Admin dashboard counters and their snapshot row"""
+
+    def setUp(self):
+        self.admin = create_admin()
+        self.webinar = create_webinar(self.admin)
+        User.objects.create_user(email='cara@example.com', password='testpass123', role='candidate')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def get_stats(self, **params):
+        response = self.client.get('/api/admin/stats/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data['stats']
+
+    def test_live_counts_use_one_query_per_table(self):
+        with override_settings(ADMIN_STATS_SNAPSHOT=False):
+            with self.assertNumQueries(len(STATS)):
+                stats = self.get_stats()
+        self.assertEqual(stats['total_users'], 2)
+        self.assertEqual(stats['total_candidates'], 1)
+        self.assertEqual(stats['total_admins'], 1)
+        self.assertEqual(stats['active_webinars'], 1)
+
+    def test_snapshot_follows_changes(self):
+        self.get_stats()
+        candidate = User.objects.get(email='cara@example.com')
+        candidate.role = 'recruiter'
+        candidate.save()
+        self.webinar.is_active = False
+        self.webinar.save()
+        create_webinar(self.admin)
+        User.objects.create_user(email='carl@example.com', password='testpass123', role='candidate').delete()
+
+        with self.assertNumQueries(1):
+            stats = self.get_stats()
+        self.assertEqual(stats, compute_stats())
+        self.assertEqual(stats['total_recruiters'], 1)
+        self.assertEqual(stats['active_webinars'], 1)
+        self.assertEqual(stats['total_webinars'], 2)
+
+    def test_refresh_recomputes_drifted_counters(self):
+        self.get_stats()
+        Webinar.objects.update(is_active=False)
+        self.assertEqual(self.get_stats()['active_webinars'], 1)
+        self.assertEqual(self.get_stats(refresh='true')['active_webinars'], 0)
+
+
+class AdminExportTests(TestCase):
+    """Streaming and background admin exports"""
+
+    def setUp(self):
+        self.admin = create_admin()
+        self.webinar = create_webinar(self.admin)
+        self.cara = User.objects.create_user(
+            email='cara@example.com', password='testpass123', first_name='Cara', role='candidate'
+        )
+        User.objects.create_user(email='rita@example.com', password='testpass123', role='recruiter')
+        WebinarRegistration.objects.create(webinar=self.webinar, user=self.cara)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+    def read_csv(self, content):
+        return list(csv.DictReader(StringIO(content.decode('utf-8-sig'))))
+
+    def test_streams_filtered_csv(self):
+        response = self.client.get('/api/admin/exports/users.csv', {'role': 'candidate'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = self.read_csv(b''.join(response.streaming_content))
+        self.assertEqual([row['email'] for row in rows], ['cara@example.com'])
+
+    def test_streams_ndjson_with_search(self):
+        response = self.client.get('/api/admin/exports/webinar_registrations.ndjson', {'search': 'Django'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['user_email'], 'cara@example.com')
+        self.assertEqual(rows[0]['webinar_title'], 'Intro to Django')
+
+    def test_background_export(self):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            response = self.client.get('/api/admin/exports/users.csv', {'background': 'true', 'role': 'recruiter'})
+            self.assertEqual(response.status_code, 202)
+            job_id = response.data['job']['id']
+            self.assertEqual(response.data['job']['status'], 'pending')
+
+            call_command('process_export_jobs', stdout=StringIO())
+
+            job = self.client.get(f'/api/admin/exports/{job_id}/').data['job']
+            self.assertEqual(job['status'], 'done')
+            self.assertEqual(job['row_count'], 1)
+            self.assertTrue(job['download_url'].endswith(f'/api/admin/exports/{job_id}/download/'))
+
+            response = self.client.get(f'/api/admin/exports/{job_id}/download/')
+            rows = self.read_csv(b''.join(response.streaming_content))
+            self.assertEqual([row['email'] for row in rows], ['rita@example.com'])
+
+    def test_background_job_runner_processes_exports(self):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            self.client.get('/api/admin/exports/users.csv', {'background': 'true'})
+            out = StringIO()
+            call_command('run_background_jobs', '--once', stdout=out)
+        self.assertEqual(ExportJob.objects.get().status, 'done')
+        self.assertIn('Processed 1 export jobs', out.getvalue())
+
+    def test_abandoned_export_is_requeued(self):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            self.client.get('/api/admin/exports/users.csv', {'background': 'true'})
+            # Claimed by a worker that died two hours ago
+            ExportJob.objects.update(status='running', started_at=timezone.now() - timedelta(hours=2))
+            out = StringIO()
+            call_command('run_background_jobs', '--once', stdout=out)
+        self.assertEqual(ExportJob.objects.get().status, 'done')
+        self.assertIn('Requeued 1 abandoned export jobs', out.getvalue())
+
+    def test_large_export_is_queued(self):
+        with override_settings(ADMIN_EXPORT_STREAM_LIMIT=1):
+            response = self.client.get('/api/admin/exports/users.csv')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(ExportJob.objects.get().params, {})
+
+    def test_unknown_dataset(self):
+        response = self.client.get('/api/admin/exports/passwords.csv')
+        self.assertEqual(response.status_code, 400)
+
+    def test_admin_only(self):
+        self.client.force_authenticate(self.cara)
+        response = self.client.get('/api/admin/exports/users.csv')
+        self.assertEqual(response.status_code, 403)
+
+
+class QueryPlanTests(QueryPlanTestMixin, TestCase):
+    """The main queries of the public listings and admin lists use an index"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin = create_admin()
+        create_webinar(self.admin)
+        create_webinar(self.admin, is_active=False)
+
+    def test_public_webinars(self):
+        self.assertIndexedQueries('webinars', self.client.get, '/api/webinars/public')
+
+    def test_public_admissions(self):
+        self.assertIndexedQueries('admission_posts', self.client.get, '/api/admissions/public')
+
+    def test_admin_users(self):
+        self.client.force_authenticate(self.admin)
+        self.assertIndexedQueries('users', self.client.get, '/api/admin/users/')
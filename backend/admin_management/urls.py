@@ -4,6 +4,7 @@ from . import views
 urlpatterns = [
     # Dashboard
     path('stats/', views.dashboard_stats, name='admin_dashboard_stats'),
+    path('cache-stats/', views.public_cache_stats, name='admin_cache_stats'),
     
     # User Management
     path('users/', views.manage_users, name='admin_manage_users'),
@@ -26,6 +27,12 @@ urlpatterns = [
     path('admission-applications/', views.manage_admission_applications, name='admin_admission_applications'),
     path('webinar-registrations/<int:registration_id>/status/', views.update_registration_status, name='update_registration_status'),
     path('admission-applications/<int:application_id>/status/', views.update_application_status, name='update_application_status'),
+    
+    # Exports
+    path('exports/', views.export_jobs, name='admin_export_jobs'),
+    path('exports/<int:job_id>/', views.export_job_detail, name='admin_export_job_detail'),
+    path('exports/<int:job_id>/download/', views.export_job_download, name='admin_export_download'),
+    path('exports/<str:dataset>.<str:export_format>', views.admin_export, name='admin_export'),
 ]
 
 # Public endpoints (no admin required)
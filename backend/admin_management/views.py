@@ -2,15 +2,24 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from django.http import FileResponse
 from django.shortcuts import get_object_or_404
 from django.db.models import Q
 from authentication.models import User
 from recruiter.models import JobPost
-from .models import Webinar, AdmissionPost, WebinarRegistration, AdmissionRegistration
+from job_portal.exports import CONTENT_TYPES, streaming_export
+from .models import Webinar, AdmissionPost, WebinarRegistration, AdmissionRegistration, ExportJob
+from .exports import (
+    EXPORTS, dataset_rows, export_filename, export_queryset, get_stream_limit, queue_export
+)
+from .dashboard import get_dashboard_stats
+from .filters import filter_admission_applications, filter_users, filter_webinar_registrations
+from .response_cache import cache_public_response, get_stats, reset_stats
 from .serializers import (
     UserManagementSerializer, JobPostSerializer, 
     WebinarSerializer, AdmissionPostSerializer,
-    WebinarRegistrationSerializer, AdmissionRegistrationSerializer
+    WebinarRegistrationSerializer, AdmissionRegistrationSerializer,
+    ExportJobSerializer
 )
 
 def require_admin(view_func):
@@ -32,21 +41,7 @@ def manage_users(request):
     """List all users or create a new user"""
     
     if request.method == 'GET':
-        users = User.objects.all().order_by('-created_at')
-        
-        # Search functionality
-        search = request.GET.get('search', '')
-        if search:
-            users = users.filter(
-                Q(first_name__icontains=search) |
-                Q(last_name__icontains=search) |
-                Q(email__icontains=search)
-            )
-        
-        # Role filter
-        role = request.GET.get('role', '')
-        if role:
-            users = users.filter(role=role)
+        users = filter_users(request.GET).order_by('-created_at')
         
         serializer = UserManagementSerializer(users, many=True)
         return Response({
@@ -123,7 +118,7 @@ def manage_user_detail(request, user_id):
 def manage_jobs(request):
     """List all job posts"""
     
-    jobs = JobPost.objects.select_related('recruiter').order_by('-created_at')
+    jobs = JobPost.objects.with_company().order_by('-created_at')
     
     # Search functionality
     search = request.GET.get('search', '')
@@ -323,26 +318,32 @@ def manage_admission_detail(request, admission_id):
 @permission_classes([IsAuthenticated])
 @require_admin
 def dashboard_stats(request):
-    """Get dashboard statistics"""
-    
-    stats = {
-        'total_users': User.objects.count(),
-        'total_candidates': User.objects.filter(role='candidate').count(),
-        'total_recruiters': User.objects.filter(role='recruiter').count(),
-        'total_admins': User.objects.filter(role='admin').count(),
-        'total_jobs': JobPost.objects.count(),
-        'published_jobs': JobPost.objects.filter(is_published=True).count(),
-        'total_webinars': Webinar.objects.count(),
-        'active_webinars': Webinar.objects.filter(is_active=True).count(),
-        'total_admissions': AdmissionPost.objects.count(),
-        'active_admissions': AdmissionPost.objects.filter(is_active=True).count(),
-        'total_webinar_registrations': WebinarRegistration.objects.count(),
-        'total_admission_applications': AdmissionRegistration.objects.count(),
-    }
+    """
+    Get dashboard statistics
+      ?refresh=true   recompute the counters instead of reading the snapshot
+    """
+    refresh = request.GET.get('refresh', '').lower() in ('1', 'true')
+    stats, computed_at, updated_at = get_dashboard_stats(refresh=refresh)
+    
+    return Response({
+        'success': True,
+        'stats': stats,
+        'computed_at': computed_at,
+        'updated_at': updated_at
+    })
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAuthenticated])
+@require_admin
+def public_cache_stats(request):
+    """Get (or reset, with DELETE) hit/miss counters of the public response cache"""
+    
+    if request.method == 'DELETE':
+        reset_stats()
     
     return Response({
         'success': True,
-        'stats': stats
+        'cache': get_stats()
     })
 
 # Registration Management Views
@@ -434,31 +435,89 @@ def apply_admission(request):
         'application': serializer.data
     }, status=status.HTTP_201_CREATED)
 
+# Exports
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@require_admin
+def admin_export(request, dataset, export_format):
+    """
+    Export users, webinar_registrations, admission_applications or
+    college_applications as CSV or NDJSON, e.g. /api/admin/exports/users.csv.
+    Accepts the search filters of the matching list endpoint. Exports over
+    ADMIN_EXPORT_STREAM_LIMIT rows, or with ?background=true, are queued
+    and answered with 202 and the export job to poll.
+    """
+    if dataset not in EXPORTS or export_format not in CONTENT_TYPES:
+        return Response({
+            'success': False,
+            'message': f'Unknown export. Datasets: {", ".join(EXPORTS)}; formats: csv, ndjson'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    params = {key: value for key, value in request.GET.items() if key != 'background'}
+    background = request.GET.get('background', '').lower() in ('1', 'true')
+    if background or export_queryset(dataset, params).count() > get_stream_limit():
+        job = queue_export(request.user, dataset, export_format, params)
+        return Response({
+            'success': True,
+            'message': 'Export queued',
+            'job': ExportJobSerializer(job, context={'request': request}).data
+        }, status=status.HTTP_202_ACCEPTED)
+    
+    return streaming_export(
+        export_format,
+        EXPORTS[dataset][1],
+        dataset_rows(dataset, params),
+        filename=export_filename(dataset)
+    )
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@require_admin
+def export_jobs(request):
+    """List the requesting admin's recent export jobs"""
+    
+    jobs = ExportJob.objects.filter(requested_by=request.user)[:50]
+    return Response({
+        'success': True,
+        'jobs': ExportJobSerializer(jobs, many=True, context={'request': request}).data
+    })
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@require_admin
+def export_job_detail(request, job_id):
+    """Status of an export job, with its download link once finished"""
+    
+    job = get_object_or_404(ExportJob, id=job_id)
+    return Response({
+        'success': True,
+        'job': ExportJobSerializer(job, context={'request': request}).data
+    })
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@require_admin
+def export_job_download(request, job_id):
+    """Download the file written by a finished export job"""
+    
+    job = get_object_or_404(ExportJob, id=job_id, status='done')
+    return FileResponse(
+        job.file.open('rb'),
+        as_attachment=True,
+        filename=f'{export_filename(job.dataset)}.{job.export_format}',
+        content_type=CONTENT_TYPES[job.export_format]
+    )
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 @require_admin
 def manage_webinar_registrations(request):
     """List all webinar registrations for admin"""
     
-    registrations = WebinarRegistration.objects.select_related(
+    registrations = filter_webinar_registrations(request.GET).select_related(
         'webinar', 'user'
     ).order_by('-registered_at')
     
-    # Filter by webinar if specified
-    webinar_id = request.GET.get('webinar_id')
-    if webinar_id:
-        registrations = registrations.filter(webinar_id=webinar_id)
-    
-    # Search functionality
-    search = request.GET.get('search', '')
-    if search:
-        registrations = registrations.filter(
-            Q(user__first_name__icontains=search) |
-            Q(user__last_name__icontains=search) |
-            Q(user__email__icontains=search) |
-            Q(webinar__title__icontains=search)
-        )
-    
     serializer = WebinarRegistrationSerializer(registrations, many=True)
     return Response({
         'success': True,
@@ -472,25 +531,10 @@ def manage_webinar_registrations(request):
 def manage_admission_applications(request):
     """List all admission applications for admin"""
     
-    applications = AdmissionRegistration.objects.select_related(
+    applications = filter_admission_applications(request.GET).select_related(
         'admission', 'user'
     ).order_by('-applied_at')
     
-    # Filter by admission if specified
-    admission_id = request.GET.get('admission_id')
-    if admission_id:
-        applications = applications.filter(admission_id=admission_id)
-    
-    # Search functionality
-    search = request.GET.get('search', '')
-    if search:
-        applications = applications.filter(
-            Q(user__first_name__icontains=search) |
-            Q(user__last_name__icontains=search) |
-            Q(user__email__icontains=search) |
-            Q(admission__college_name__icontains=search)
-        )
-    
     serializer = AdmissionRegistrationSerializer(applications, many=True)
     return Response({
         'success': True,
@@ -557,7 +601,9 @@ def update_application_status(request, application_id):
         'success': True,
         'message': 'Application status updated successfully',
         'application': serializer.data
-    })@api_view(['GET'])
+    })
+
+@api_view(['GET'])
 @permission_classes([AllowAny])  # Public endpoint for share links
 def webinar_share_detail(request, webinar_id):
     """
@@ -576,6 +622,7 @@ def webinar_share_detail(request, webinar_id):
             'message': 'Webinar not found'
         }, status=status.HTTP_404_NOT_FOUND)
 
+@cache_public_response('all_webinars')
 @api_view(['GET'])
 @permission_classes([AllowAny])  # Public endpoint
 def public_webinars(request):
@@ -590,6 +637,7 @@ def public_webinars(request):
         'total': webinars.count()
     })
 
+@cache_public_response('all_admissions')
 @api_view(['GET'])
 @permission_classes([AllowAny])  # Public endpoint
 def public_admissions(request):
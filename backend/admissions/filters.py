@@ -0,0 +1,20 @@
+"""
+Filters for the admin college application list and its export.
+"""
+from .models import CollegeApplication
+
+
+def filter_college_applications(params):
+    """
+    College applications matching query parameters:
+      status=X     applications in status X
+      college=X    college name containing X
+    """
+    applications = CollegeApplication.objects.all()
+    status_filter = params.get('status')
+    college_filter = params.get('college')
+    if status_filter:
+        applications = applications.filter(status=status_filter)
+    if college_filter:
+        applications = applications.filter(college_name__icontains=college_filter)
+    return applications
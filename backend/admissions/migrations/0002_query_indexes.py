@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admissions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collegeapplication',
+            index=models.Index(fields=['user', '-applied_at'], name='college_apps_user_idx'),
+        ),
+    ]
@@ -64,6 +64,10 @@ class CollegeApplication(models.Model):
         verbose_name_plural = 'College Applications'
         ordering = ['-applied_at']
         unique_together = ['user', 'college_name']  # Prevent duplicate applications
+        indexes = [
+            # User's applications, newest first
+            models.Index(fields=['user', '-applied_at'], name='college_apps_user_idx'),
+        ]
     
     def __str__(self):
         return f"{self.full_name} → {self.college_name}"
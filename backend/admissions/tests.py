@@ -1,3 +1,16 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
+from authentication.models import User
+from job_portal.query_plans import QueryPlanTestMixin
 
-# Create your tests here.
+
+class QueryPlanTests(QueryPlanTestMixin, TestCase):
+    """The main query of the college application list uses an index"""
+
+    def test_my_applications(self):
+        user = User.objects.create_user(
+            email='cara@example.com', password='testpass123', first_name='Cara', last_name='Candidate'
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+        self.assertIndexedQueries('college_applications', client.get, '/api/admissions/my-applications')
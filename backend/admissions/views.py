@@ -4,6 +4,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from .models import CollegeApplication
+from .filters import filter_college_applications
 from .serializers import (
     CollegeApplicationSerializer,
     CollegeApplicationCreateSerializer,
@@ -144,17 +145,8 @@ def admin_all_applications(request):
             'message': 'Access denied. Admin only.'
         }, status=status.HTTP_403_FORBIDDEN)
     
-    # Get all applications
-    applications = CollegeApplication.objects.all().select_related('user').order_by('-applied_at')
-    
-    # Optional filters
-    status_filter = request.GET.get('status')
-    college_filter = request.GET.get('college')
-    
-    if status_filter:
-        applications = applications.filter(status=status_filter)
-    if college_filter:
-        applications = applications.filter(college_name__icontains=college_filter)
+    # Get all applications, with the optional status and college filters
+    applications = filter_college_applications(request.GET).select_related('user').order_by('-applied_at')
     
     serializer = CollegeApplicationSerializer(applications, many=True)
     
@@ -1,6 +1,7 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User
+from .models import User, OutboundEmail
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
@@ -75,4 +76,23 @@ class UserAdmin(BaseUserAdmin):
             rejected_count += 1
         
         self.message_user(request, f'{rejected_count} recruiters rejected.')
-    reject_recruiters.short_description = "Reject selected recruiters"
\ No newline at end of file
+    reject_recruiters.short_description = "Reject selected recruiters"
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    """Email outbox, to inspect and requeue dead messages"""
+    
+    list_display = ['subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['subject', 'recipients']
+    readonly_fields = ['created_at', 'sent_at', 'claimed_at', 'last_error']
+    actions = ['requeue']
+    
+    def requeue(self, request, queryset):
+        """Admin action to retry selected messages now"""
+        count = queryset.exclude(status='sent').update(
+            status='queued', attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f'{count} messages requeued.')
+    requeue.short_description = "Requeue selected messages"
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from authentication.models import User, parse_experience_years
+
+
+class Command(BaseCommand):
+    help = 'Parse the experience text of every user into the stored experience_years'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of users updated per batch (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        updated = 0
+        batch = []
+        users = User.objects.only('id', 'experience', 'experience_years').order_by('pk')
+        for user in users.iterator(chunk_size=batch_size):
+            years = parse_experience_years(user.experience)
+            if years != user.experience_years:
+                user.experience_years = years
+                batch.append(user)
+            if len(batch) >= batch_size:
+                User.objects.bulk_update(batch, ['experience_years'])
+                updated += len(batch)
+                batch = []
+        if batch:
+            User.objects.bulk_update(batch, ['experience_years'])
+            updated += len(batch)
+        self.stdout.write(self.style.SUCCESS(f'Updated experience years for {updated} users'))
+        if updated:
+            self.stdout.write('Run rebuild_candidate_search to refresh the resume database.')
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from authentication.models import User
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored profile_completion score of every user'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of users updated per batch (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        fields = ['id', 'profile_completion'] + User.COMPLETION_FIELDS + User.COMPLETION_BONUS_FIELDS
+        updated = 0
+        batch = []
+        for user in User.objects.only(*fields).order_by('pk').iterator(chunk_size=batch_size):
+            completion = user.calculate_profile_completion()
+            if completion != user.profile_completion:
+                user.profile_completion = completion
+                batch.append(user)
+            if len(batch) >= batch_size:
+                User.objects.bulk_update(batch, ['profile_completion'])
+                updated += len(batch)
+                batch = []
+        if batch:
+            User.objects.bulk_update(batch, ['profile_completion'])
+            updated += len(batch)
+        self.stdout.write(self.style.SUCCESS(f'Updated profile completion for {updated} users'))
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from authentication.revocation import DEFAULT_PURGE_BATCH_SIZE, purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete expired outstanding and blacklisted JWT tokens in batches. '
+        'Purges once and exits, or repeats with --poll.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_PURGE_BATCH_SIZE,
+            help=f'Tokens deleted per statement (default: {DEFAULT_PURGE_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--poll',
+            type=float,
+            default=0,
+            help='Seconds between purges; 0 purges once and exits (default: 0)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            deleted = purge_expired_tokens(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired tokens'))
+            if not options['poll']:
+                break
+            close_old_connections()
+            time.sleep(options['poll'])
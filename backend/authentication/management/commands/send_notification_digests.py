@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from authentication.notifications import send_due_digests
+
+
+class Command(BaseCommand):
+    help = (
+        'Queue one email per user covering their pending notifications, once the oldest '
+        'has waited NOTIFICATION_DIGEST_WINDOW seconds. Runs once, or keeps polling with --poll.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll',
+            type=float,
+            default=0,
+            help='Seconds to wait between checks; 0 queues what is due and exits (default: 0)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            emails, covered = send_due_digests()
+            if emails:
+                self.stdout.write(self.style.SUCCESS(
+                    f'Queued {emails} digest emails covering {covered} notifications'
+                ))
+            if not options['poll']:
+                break
+            close_old_connections()
+            time.sleep(options['poll'])
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from authentication.outbox import DEFAULT_BATCH_SIZE, requeue_stale_claims, send_batch
+
+
+class Command(BaseCommand):
+    help = (
+        'Send queued outbox email in batches over one connection per batch. '
+        'Sends what is due and exits, or keeps polling with --poll.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Messages sent per connection (default: {DEFAULT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--poll',
+            type=float,
+            default=0,
+            help='Seconds to wait when the queue is empty; 0 sends what is due and exits (default: 0)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            requeued = requeue_stale_claims()
+            if requeued:
+                self.stdout.write(self.style.WARNING(f'Requeued {requeued} abandoned messages'))
+            sent, failed = send_batch(batch_size=options['batch_size'])
+            if sent or failed:
+                self.stdout.write(self.style.SUCCESS(f'Sent {sent} messages, {failed} failed'))
+                # More may be due; check again at once
+                continue
+            if not options['poll']:
+                break
+            close_old_connections()
+            time.sleep(options['poll'])
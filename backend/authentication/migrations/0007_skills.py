@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0006_user_reset_otp_user_reset_otp_created'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Case-folded canonical name', max_length=100, unique=True)),
+                ('display_name', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'skills',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, db_table='user_skills', help_text='Normalized skills, kept in sync with the skills text', related_name='users', to='authentication.skill'),
+        ),
+    ]
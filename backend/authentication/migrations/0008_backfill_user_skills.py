@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+def canonical_skill_name(name):
+    return ' '.join(str(name).split()).casefold()
+
+
+def resolve_skills(Skill, names, cache):
+    """Return Skill ids for the names, creating missing skills (cache maps name -> id)"""
+    ids = []
+    for name in names:
+        canonical = canonical_skill_name(name)[:100]
+        if not canonical:
+            continue
+        if canonical not in cache:
+            skill, _ = Skill.objects.get_or_create(
+                name=canonical, defaults={'display_name': ' '.join(str(name).split())[:100]}
+            )
+            cache[canonical] = skill.id
+        if cache[canonical] not in ids:
+            ids.append(cache[canonical])
+    return ids
+
+
+def backfill_user_skills(apps, schema_editor):
+    User = apps.get_model('authentication', 'User')
+    Skill = apps.get_model('authentication', 'Skill')
+    UserSkill = User.skill_tags.through
+    cache = dict(Skill.objects.values_list('name', 'id'))
+
+    links = []
+    users = User.objects.exclude(skills__isnull=True).exclude(skills='').values_list('id', 'skills')
+    for user_id, skills in users.iterator():
+        for skill_id in resolve_skills(Skill, skills.split(','), cache):
+            links.append(UserSkill(user_id=user_id, skill_id=skill_id))
+    UserSkill.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0007_skills'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_user_skills, migrations.RunPython.noop),
+    ]
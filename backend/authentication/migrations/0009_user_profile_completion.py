@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0008_backfill_user_skills'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='profile_completion',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', '-profile_completion'], name='users_role_completion_idx'),
+        ),
+    ]
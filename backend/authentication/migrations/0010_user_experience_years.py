@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0009_user_profile_completion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='experience_years',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Parsed from experience on save', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'experience_years'], name='users_role_experience_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
+import re
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.utils import timezone
 from django.core.validators import RegexValidator
 
 class UserManager(BaseUserManager):
@@ -26,6 +28,83 @@ class UserManager(BaseUserManager):
         
         return self.create_user(email, password, **extra_fields)
 
+# A duration such as '3 years', '18 months', '2.5 yrs', '5+ years' or '3-5 years' (lower bound kept)
+EXPERIENCE_DURATION_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(?:(?:-|to)\s*\d+(?:\.\d+)?\s*)?\+?\s*(years?|yrs?|months?|mos?)\b'
+)
+
+
+def parse_experience_years(text):
+    """
+    Whole years of experience in free text, or None when no duration is found.
+    The first duration given in years wins wherever it appears ('6 months
+    internship, then 4 years' is 4); '1 year 6 months' is read as one
+    duration. Text with only months uses the first month figure.
+    """
+    if not text:
+        return None
+    text = text.lower()
+    matches = list(EXPERIENCE_DURATION_RE.finditer(text))
+    if not matches:
+        return None
+    
+    for index, match in enumerate(matches):
+        if not match.group(2).startswith('m'):
+            months = float(match.group(1)) * 12
+            following = matches[index + 1] if index + 1 < len(matches) else None
+            if following is not None and following.group(2).startswith('m'):
+                between = text[match.end():following.start()].strip(' ,')
+                if between in ('', 'and', '&'):
+                    months += float(following.group(1))
+            break
+    else:
+        months = float(matches[0].group(1))
+    return min(int(months // 12), 99)
+
+
+def canonical_skill_name(name):
+    """Case-folded, whitespace-normalized form used as the unique skill key"""
+    return ' '.join(str(name).split()).casefold()
+
+
+class SkillManager(models.Manager):
+    """Manager resolving free-text skill names to Skill rows"""
+    
+    def resolve(self, names):
+        """Return Skill rows for the given names, creating any that are missing"""
+        display_names = {}
+        for name in names:
+            canonical = canonical_skill_name(name)
+            if canonical and canonical not in display_names:
+                display_names[canonical] = ' '.join(str(name).split())[:100]
+        if not display_names:
+            return []
+        
+        self.bulk_create(
+            [self.model(name=canonical[:100], display_name=display) for canonical, display in display_names.items()],
+            ignore_conflicts=True
+        )
+        return list(self.filter(name__in=[canonical[:100] for canonical in display_names]))
+
+
+class Skill(models.Model):
+    """
+    Canonical skill shared by candidate profiles and job posts
+    """
+    name = models.CharField(max_length=100, unique=True, help_text="Case-folded canonical name")
+    display_name = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    objects = SkillManager()
+    
+    class Meta:
+        db_table = 'skills'
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.display_name
+
+
 class User(AbstractUser):
     """
     Custom User model for Job Portal (Candidates and Recruiters)
@@ -73,8 +152,19 @@ class User(AbstractUser):
     # Professional Info
     skills = models.TextField(null=True, blank=True, help_text="Comma-separated skills")
     experience = models.TextField(null=True, blank=True)
+    experience_years = models.PositiveSmallIntegerField(
+        null=True, blank=True, help_text="Parsed from experience on save"
+    )
     education = models.TextField(null=True, blank=True)
     
+    skill_tags = models.ManyToManyField(
+        Skill,
+        blank=True,
+        related_name='users',
+        db_table='user_skills',
+        help_text="Normalized skills, kept in sync with the skills text"
+    )
+    
     # Social Links
     linkedin_url = models.URLField(null=True, blank=True)
     github_url = models.URLField(null=True, blank=True)
@@ -105,6 +195,9 @@ class User(AbstractUser):
     )
     approved_at = models.DateTimeField(null=True, blank=True, help_text="When the recruiter was approved")
     
+    # Profile completion percentage, recomputed on save (see calculate_profile_completion)
+    profile_completion = models.PositiveSmallIntegerField(default=0)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -118,14 +211,111 @@ class User(AbstractUser):
         db_table = 'users'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            # Recruiters sort and filter candidates by completion
+            models.Index(fields=['role', '-profile_completion'], name='users_role_completion_idx'),
+            models.Index(fields=['role', 'experience_years'], name='users_role_experience_idx'),
+            # Role listings (candidates, recruiters by approval status), newest first
+            models.Index(fields=['role', '-created_at'], name='users_role_created_idx'),
+            models.Index(fields=['role', 'approval_status', '-created_at'], name='users_role_approval_idx'),
+            # Admin user list, newest first
+            models.Index(fields=['-created_at'], name='users_created_idx'),
+        ]
+    
+    # Fields counted by calculate_profile_completion
+    COMPLETION_FIELDS = [
+        'first_name', 'last_name', 'email', 'phone', 'city', 'state',
+        'bio', 'skills', 'experience', 'education'
+    ]
+    COMPLETION_BONUS_FIELDS = [
+        'linkedin_url', 'github_url', 'portfolio_url', 'resume_file_name', 'resume_file_path'
+    ]
     
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.email})"
     
+    # Skills text and role as loaded from the database, to detect changes on save
+    _loaded_skills = None
+    _loaded_role = None
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_skills = instance.__dict__.get('skills')
+        instance._loaded_role = instance.__dict__.get('role')
+        return instance
+    
+    # Users built by CachedJWTAuthentication (authentication/user_cache.py): the
+    # cached snapshot values, until the rest of the row is loaded
+    _snapshot = None
+    _has_company_profile = None
+    
+    def refresh_from_db(self, using=None, fields=None):
+        """
+        A user built from a snapshot loads all its deferred fields on first
+        access, in one query, along with fresh values of the snapshot fields
+        the request has not changed, so a save never writes back stale ones
+        """
+        if self._snapshot is not None and fields is not None:
+            snapshot, self._snapshot = self._snapshot, None
+            fields = set(fields) | self.get_deferred_fields() | {
+                field for field, value in snapshot.items()
+                if field != 'id' and self.__dict__.get(field) == value
+            }
+            super().refresh_from_db(using, fields)
+            if 'skills' in fields:
+                self._loaded_skills = self.skills
+            if 'role' in fields:
+                self._loaded_role = self.role
+            return
+        super().refresh_from_db(using, fields)
+    
+    def save(self, *args, **kwargs):
+        """
+        Override save to store the derived profile_completion and experience_years
+        and keep skill_tags in sync with the skills text
+        """
+        self.profile_completion = self.calculate_profile_completion()
+        self.experience_years = parse_experience_years(self.experience)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if update_fields.intersection(self.COMPLETION_FIELDS + self.COMPLETION_BONUS_FIELDS):
+                update_fields.add('profile_completion')
+            if 'experience' in update_fields:
+                update_fields.add('experience_years')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+        if (update_fields is None or 'skills' in update_fields) and self.skills != self._loaded_skills:
+            self.skill_tags.set(Skill.objects.resolve(self.get_skills_list()))
+            self._loaded_skills = self.skills
+    
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
     
+    def calculate_profile_completion(self):
+        """Profile completion percentage: core fields, plus social links and resume when present"""
+        completed_fields = 0
+        total_fields = len(self.COMPLETION_FIELDS)
+        
+        for field in self.COMPLETION_FIELDS:
+            value = getattr(self, field, None)
+            if value and str(value).strip():
+                completed_fields += 1
+        
+        # Add bonus for social links
+        if self.linkedin_url or self.github_url or self.portfolio_url:
+            completed_fields += 1
+            total_fields += 1
+        
+        # Add bonus for resume
+        if self.resume_file_name or self.resume_file_path:
+            completed_fields += 1
+            total_fields += 1
+        
+        return int((completed_fields / total_fields) * 100)
+    
     def get_skills_list(self):
         """Return skills as a list"""
         if self.skills:
@@ -141,6 +331,10 @@ class User(AbstractUser):
         if self.approval_status != 'approved':
             return False
         
+        # Users from the authentication cache know whether they have one
+        if self._has_company_profile:
+            return True
+        
         # Check if recruiter has a company profile
         try:
             from recruiter.models import RecruiterCompanyProfile
@@ -169,4 +363,83 @@ class User(AbstractUser):
         if self.role == 'recruiter':
             self.approval_status = 'rejected'
             self.approved_at = None
-            self.save()
\ No newline at end of file
+            self.save()
+
+
+class OutboundEmail(models.Model):
+    """
+    Email waiting in the outbox. Views queue rows and return at once;
+    the send_queued_email worker delivers them in batches over one SMTP
+    connection (see authentication/outbox.py).
+    """
+    
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('dead', 'Dead'),  # gave up after EMAIL_OUTBOX_MAX_ATTEMPTS
+    ]
+    
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default='')
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'email_outbox'
+        ordering = ['-created_at']
+        indexes = [
+            # Worker queue scan: due messages, oldest first
+            models.Index(fields=['status', 'next_attempt_at'], name='email_outbox_queue_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
+
+
+class Notification(models.Model):
+    """
+    Event addressed to a user. The row is the in-app notification; the
+    send_notification_digests worker later merges a user's pending rows
+    into one outbox email (see authentication/notifications.py).
+    """
+    
+    KIND_CHOICES = [
+        ('application_status', 'Application Status'),
+        ('company_verification', 'Company Verification'),
+        ('recruiter_approval', 'Recruiter Approval'),
+    ]
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES)
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    data = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True)
+    # Set once the notification went out in an email digest
+    emailed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'notifications'
+        ordering = ['-created_at']
+        indexes = [
+            # In-app list, newest first
+            models.Index(fields=['user', '-created_at'], name='notifications_user_idx'),
+            # Digest worker: notifications not emailed yet
+            models.Index(
+                fields=['user', 'created_at'],
+                condition=models.Q(emailed_at__isnull=True),
+                name='notifications_digest_idx',
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.title} -> {self.user.email}"
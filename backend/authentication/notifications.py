@@ -0,0 +1,103 @@
+"""
+User notifications.
+
+notify() and notify_many() record an event once, as a Notification row,
+which is also what the in-app notification list reads; recording is a
+single INSERT, so the triggering request never waits on delivery.
+
+Email goes out asynchronously in digests: `manage.py
+send_notification_digests` (or the digests job of `manage.py
+run_background_jobs`) finds users whose oldest un-emailed notification is
+older than NOTIFICATION_DIGEST_WINDOW seconds and queues one outbox email
+per user covering every pending notification not yet read in the app, so
+a burst of status changes reaches the user as a single message.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from .models import Notification, User
+from .outbox import queue_email
+
+DIGEST_SUBJECT = 'Updates on your MytechZ account'
+
+
+def get_digest_window():
+    return getattr(settings, 'NOTIFICATION_DIGEST_WINDOW', 15 * 60)
+
+
+def notify(user_id, kind, title, message, data=None):
+    """Record a notification for one user"""
+    return Notification.objects.create(
+        user_id=user_id, kind=kind, title=title, message=message, data=data or {}
+    )
+
+
+def notify_many(notifications):
+    """Record [(user_id, kind, title, message, data)] in one INSERT"""
+    return Notification.objects.bulk_create([
+        Notification(user_id=user_id, kind=kind, title=title, message=message, data=data or {})
+        for user_id, kind, title, message, data in notifications
+    ])
+
+
+def digest_body(user, notifications):
+    lines = [f'Hello {user.first_name},', '']
+    if len(notifications) == 1:
+        lines.append('There is an update on your MytechZ account:')
+    else:
+        lines.append(f'There are {len(notifications)} updates on your MytechZ account:')
+    lines.append('')
+    for notification in notifications:
+        lines.append(f'- {notification.title}: {notification.message}')
+    lines += ['', 'Best regards,', 'MytechZ Team']
+    return '\n'.join(lines)
+
+
+def due_digest_users(now=None):
+    """Ids of users whose oldest pending notification has waited a full window"""
+    cutoff = (now or timezone.now()) - timedelta(seconds=get_digest_window())
+    return list(
+        Notification.objects.filter(emailed_at__isnull=True)
+        .values('user_id')
+        .annotate(oldest=Min('created_at'))
+        .filter(oldest__lte=cutoff)
+        .values_list('user_id', flat=True)
+    )
+
+
+def send_digest(user_id):
+    """
+    Queue one email with every pending notification of a user that is
+    still unread. Returns the number emailed.
+    """
+    with transaction.atomic():
+        pending = list(
+            Notification.objects.select_for_update()
+            .filter(user_id=user_id, emailed_at__isnull=True)
+            .order_by('created_at', 'pk')
+        )
+        if not pending:
+            return 0
+        # Notifications already read in the app are closed without an email
+        unread = [notification for notification in pending if notification.read_at is None]
+        if unread:
+            user = User.objects.get(pk=user_id)
+            queue_email(DIGEST_SUBJECT, digest_body(user, unread), [user.email])
+        Notification.objects.filter(pk__in=[notification.pk for notification in pending]).update(
+            emailed_at=timezone.now()
+        )
+    return len(unread)
+
+
+def send_due_digests():
+    """Queue the digests that are due. Returns (emails, notifications covered)."""
+    emails = covered = 0
+    for user_id in due_digest_users():
+        count = send_digest(user_id)
+        if count:
+            emails += 1
+            covered += count
+    return emails, covered
@@ -0,0 +1,136 @@
+"""
+Database-backed email outbox.
+
+queue_email() stores a message and returns immediately, so a slow SMTP
+handshake never holds a gunicorn worker. The outbox job of `manage.py
+run_background_jobs` (or `manage.py send_queued_email` on its own) claims
+due messages in batches and sends each batch over one reused backend
+connection. A failed message is retried with exponential backoff
+(EMAIL_OUTBOX_RETRY_DELAY seconds, doubled per attempt) and marked 'dead'
+after EMAIL_OUTBOX_MAX_ATTEMPTS. With SMTP the job runner must therefore
+be deployed.
+
+With EMAIL_OUTBOX_INLINE (the default for the console and locmem
+backends) messages are also sent right after the request's transaction
+commits, so local development needs no worker.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+DEFAULT_BATCH_SIZE = 50
+
+# Claimed messages not finished within this time are assumed lost with their worker
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+MAX_RETRY_DELAY = 6 * 60 * 60
+
+
+def get_max_attempts():
+    return getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+
+
+def get_retry_delay(attempts):
+    """Seconds to wait before the next attempt after `attempts` failures"""
+    base = getattr(settings, 'EMAIL_OUTBOX_RETRY_DELAY', 60)
+    return min(base * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+
+
+def queue_email(subject, body, recipients, from_email=None):
+    """Put a message in the outbox. Returns the OutboundEmail row."""
+    email = OutboundEmail.objects.create(
+        subject=subject,
+        body=body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipients),
+    )
+    if getattr(settings, 'EMAIL_OUTBOX_INLINE', False):
+        transaction.on_commit(lambda: send_batch(ids=[email.pk]))
+    return email
+
+
+def requeue_stale_claims():
+    """Return messages claimed by a worker that died mid-batch to the queue"""
+    return OutboundEmail.objects.filter(
+        status='sending', claimed_at__lt=timezone.now() - CLAIM_TIMEOUT
+    ).update(status='queued')
+
+
+def claim_batch(batch_size=DEFAULT_BATCH_SIZE, ids=None):
+    """Mark up to batch_size due messages as 'sending' and return them"""
+    now = timezone.now()
+    with transaction.atomic():
+        due = OutboundEmail.objects.filter(status='queued', next_attempt_at__lte=now)
+        if ids is not None:
+            due = due.filter(pk__in=ids)
+        claimed = list(
+            due.select_for_update(skip_locked=True)
+            .order_by('next_attempt_at', 'pk')
+            .values_list('pk', flat=True)[:batch_size]
+        )
+        OutboundEmail.objects.filter(pk__in=claimed).update(status='sending', claimed_at=now)
+    return list(OutboundEmail.objects.filter(pk__in=claimed).order_by('next_attempt_at', 'pk'))
+
+
+def record_failure(email, error):
+    email.attempts += 1
+    email.last_error = str(error)[:2000]
+    if email.attempts >= get_max_attempts():
+        email.status = 'dead'
+    else:
+        email.status = 'queued'
+        email.next_attempt_at = timezone.now() + timedelta(seconds=get_retry_delay(email.attempts))
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+
+def send_batch(batch_size=DEFAULT_BATCH_SIZE, ids=None):
+    """
+    Send one batch of due messages over a single backend connection.
+    Returns (sent, failed).
+    """
+    batch = claim_batch(batch_size, ids)
+    if not batch:
+        return 0, 0
+
+    sent = failed = 0
+    connection = get_connection()
+    reconnect = True
+    try:
+        for index, email in enumerate(batch):
+            if reconnect:
+                # (Re)open the shared connection; a failed send may have broken it
+                try:
+                    connection.close()
+                    connection.open()
+                except Exception as e:
+                    # Server unreachable: retry the rest of the batch later
+                    for pending in batch[index:]:
+                        record_failure(pending, e)
+                    return sent, failed + len(batch) - index
+                reconnect = False
+            message = EmailMessage(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email,
+                to=email.recipients,
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as e:
+                record_failure(email, e)
+                failed += 1
+                reconnect = True
+                continue
+            email.status = 'sent'
+            email.attempts += 1
+            email.sent_at = timezone.now()
+            email.save(update_fields=['status', 'attempts', 'sent_at'])
+            sent += 1
+    finally:
+        connection.close()
+    return sent, failed
@@ -0,0 +1,169 @@
+"""
+Revoked token checks without a database round trip.
+
+Revocations live in simplejwt's token blacklist tables. Each process keeps
+the JTIs of blacklisted access tokens that have not expired in a local
+set, so checking the access token of every request is a set lookup. Only
+rows expiring within ACCESS_TOKEN_LIFETIME can belong to an access token;
+blacklisted refresh tokens live for days, stay out of the set and keep
+simplejwt's own database check, as refreshing is rare and a replayed
+refresh token mints new access tokens.
+
+The set picks up blacklist rows newer than the last one scanned right away
+when this process revokes an access token and when the revocation version
+kept in the shared cache changes; only access token revocations bump the
+version, so refresh rotation does not make every worker sync. The set is
+reloaded completely at least every TOKEN_BLACKLIST_SYNC_INTERVAL seconds,
+which also catches rows committed out of id order. Without a shared cache
+(no REDIS_URL) the version would only ever change for this worker's own
+revocations, so it looks for new rows every TOKEN_BLACKLIST_POLL_INTERVAL
+seconds instead, and a logout applies on every worker within that delay.
+
+`manage.py purge_expired_tokens` (or the tokens job of `manage.py
+run_background_jobs`) deletes expired outstanding and blacklisted tokens
+in batches.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+VERSION_KEY = 'token_blacklist:version'
+
+DEFAULT_PURGE_BATCH_SIZE = 1000
+
+
+def get_sync_interval():
+    return getattr(settings, 'TOKEN_BLACKLIST_SYNC_INTERVAL', 30)
+
+
+def get_poll_interval():
+    return getattr(settings, 'TOKEN_BLACKLIST_POLL_INTERVAL', 2)
+
+
+def is_cache_shared():
+    return getattr(settings, 'CACHE_SHARED', False)
+
+
+class RevokedTokens:
+    """Process-local set of the JTIs of unexpired blacklisted access tokens"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.expiry = {}
+        self.last_id = 0
+        self.version = None
+        self.synced_at = None
+        self.polled_at = None
+
+    def sync(self, full=False):
+        """Add blacklist rows created since the last sync (or all of them) and drop expired JTIs"""
+        started = time.monotonic()
+        now = timezone.now()
+        access_until = now + api_settings.ACCESS_TOKEN_LIFETIME
+        if full:
+            # Rows up to the newest id are covered, whether or not they match
+            last_id = BlacklistedToken.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+            rows = list(
+                BlacklistedToken.objects.filter(
+                    id__lte=last_id,
+                    token__expires_at__gt=now,
+                    # Anything expiring later is a refresh token
+                    token__expires_at__lte=access_until,
+                ).values_list('id', 'token__jti', 'token__expires_at')
+            )
+        else:
+            # Refresh token rows are scanned too, so last_id moves past them
+            rows = list(
+                BlacklistedToken.objects.filter(id__gt=self.last_id)
+                .order_by('id')
+                .values_list('id', 'token__jti', 'token__expires_at')
+            )
+            last_id = rows[-1][0] if rows else 0
+        with self.lock:
+            if full:
+                self.expiry = {}
+                self.synced_at = started
+            self.polled_at = started
+            self.last_id = max(self.last_id, last_id)
+            for _, jti, expires_at in rows:
+                if now < expires_at <= access_until:
+                    self.expiry[jti] = expires_at
+            self.expiry = {jti: expires_at for jti, expires_at in self.expiry.items() if expires_at > now}
+
+    def is_revoked(self, jti):
+        shared = is_cache_shared()
+        version = cache.get(VERSION_KEY) if shared else None
+        if self.synced_at is None or time.monotonic() - self.synced_at > get_sync_interval():
+            self.version = version
+            self.sync(full=True)
+        elif shared and version != self.version:
+            self.version = version
+            self.sync()
+        elif not shared and time.monotonic() - self.polled_at > get_poll_interval():
+            self.sync()
+        return jti in self.expiry
+
+
+revoked_tokens = RevokedTokens()
+
+
+def is_revoked(token):
+    return revoked_tokens.is_revoked(token[api_settings.JTI_CLAIM])
+
+
+def revoke_token(token, user=None):
+    """Blacklist any token (refresh or access) until it expires"""
+    outstanding, _ = OutstandingToken.objects.get_or_create(
+        jti=token[api_settings.JTI_CLAIM],
+        defaults={
+            'user': user,
+            'token': str(token),
+            'expires_at': datetime_from_epoch(token['exp']),
+        },
+    )
+    blacklisted, created = BlacklistedToken.objects.get_or_create(token=outstanding)
+    # Blacklisted refresh tokens are checked in the database when used
+    if created and token.get(api_settings.TOKEN_TYPE_CLAIM) == 'access':
+        transaction.on_commit(publish_revocation)
+    return blacklisted, created
+
+
+def bump_version():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+
+
+def publish_revocation():
+    """Make a revocation visible to this process now and to the others on their next check"""
+    bump_version()
+    revoked_tokens.sync()
+
+
+def purge_expired_tokens(batch_size=DEFAULT_PURGE_BATCH_SIZE):
+    """Delete expired outstanding tokens and their blacklist rows. Returns the number deleted."""
+    deleted = 0
+    now = timezone.now()
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
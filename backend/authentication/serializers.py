@@ -2,7 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from .models import User
+from .models import User, Notification
 from datetime import datetime
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -102,13 +102,13 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'skills', 'skills_list', 'experience', 'education',
             'linkedin', 'github', 'portfolio', 'profilePhoto',
             'resume_file_name', 'resume_file_path', 'resume_uploaded_at',
-            'role', 'approval_status', 'profile_completed', 'approved_at',
+            'role', 'approval_status', 'profile_completed', 'profile_completion', 'approved_at',
             'created_at', 'updated_at',
             # Keep original field names for compatibility
             'first_name', 'last_name', 'date_of_birth', 
             'linkedin_url', 'github_url', 'portfolio_url'
         ]
-        read_only_fields = ['id', 'email', 'role', 'approval_status', 'profile_completed', 'approved_at', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'email', 'role', 'approval_status', 'profile_completed', 'profile_completion', 'approved_at', 'created_at', 'updated_at']
     
     def get_profilePhoto(self, obj):
         """Return profile photo URL (placeholder for now)"""
@@ -219,4 +219,16 @@ class ResumeUploadSerializer(serializers.ModelSerializer):
             instance.resume_file_name = resume_file.name
             instance.resume_uploaded_at = datetime.now()
             instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    is_read = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = Notification
+        fields = ['id', 'kind', 'title', 'message', 'data', 'created_at', 'read_at', 'is_read']
+        read_only_fields = fields
+    
+    def get_is_read(self, obj):
+        return obj.read_at is not None
@@ -1,3 +1,508 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from job_portal.query_plans import QueryPlanTestMixin
+from .models import Notification, OutboundEmail, User, parse_experience_years
+from .notifications import notify, send_due_digests
+from .outbox import queue_email, send_batch
+from .revocation import VERSION_KEY, RevokedTokens, revoke_token, revoked_tokens
+from .throttling import get_client_ip
+from .user_cache import get_snapshot, load_snapshot
 
-# Create your tests here.
+
+def create_user(email, role='candidate', **extra_fields):
+    return User.objects.create_user(
+        email=email,
+        password='testpass123',
+        first_name='Cara',
+        last_name='Candidate',
+        role=role,
+        **extra_fields
+    )
+
+
+class ProfileCompletionTests(TestCase):
+    """profile_completion is stored on save and read by the endpoints"""
+
+    def test_updated_on_save(self):
+        user = create_user('cara@example.com')
+        # first_name, last_name, email out of ten core fields
+        self.assertEqual(user.profile_completion, 30)
+
+        user.city = 'Chennai'
+        user.github_url = 'https://github.com/cara'
+        user.save(update_fields=['city', 'github_url'])
+        user.refresh_from_db()
+        # 4 core fields + social link bonus out of 11
+        self.assertEqual(user.profile_completion, 45)
+
+    def test_stats_and_candidates_list_use_stored_value(self):
+        candidate = create_user('cara@example.com', bio='Hello', phone='12345')
+        create_user('empty@example.com')
+        client = APIClient()
+
+        client.force_authenticate(candidate)
+        response = client.get('/api/auth/profile/stats')
+        self.assertEqual(response.data['stats']['profile_completion'], candidate.profile_completion)
+
+        client.force_authenticate(create_user('rita@example.com', role='recruiter'))
+        response = client.get('/api/auth/candidates', {'min_completion': 50, 'sort': 'completion'})
+        self.assertEqual([c['email'] for c in response.data['candidates']], ['cara@example.com'])
+        self.assertEqual(response.data['candidates'][0]['profile_completion'], 50)
+
+    def test_backfill_command(self):
+        user = create_user('cara@example.com', bio='Hello')
+        User.objects.filter(pk=user.pk).update(profile_completion=0)
+        out = StringIO()
+        call_command('backfill_profile_completion', stdout=out)
+        self.assertIn('Updated profile completion for 1 users', out.getvalue())
+        user.refresh_from_db()
+        self.assertEqual(user.profile_completion, 40)
+
+
+class ExperienceYearsTests(TestCase):
+    """experience_years is parsed from the experience text on save"""
+
+    def test_parser(self):
+        cases = {
+            '': None,
+            'Worked at Acme': None,
+            '3 years as a backend developer': 3,
+            '5+ yrs': 5,
+            '2-4 years': 2,
+            '3 to 5 years': 3,
+            '18 months': 1,
+            '1 year 6 months at Acme': 1,
+            '2 years and 12 months': 3,
+            '2.5 Years': 2,
+            '6 months internship, then 4 years at Acme': 4,
+            '30 months': 2,
+        }
+        for text, years in cases.items():
+            self.assertEqual(parse_experience_years(text), years, text)
+
+    def test_stored_on_save(self):
+        user = create_user('cara@example.com', experience='4 years at Acme')
+        self.assertEqual(user.experience_years, 4)
+
+        user.experience = '30 months'
+        user.save(update_fields=['experience'])
+        user.refresh_from_db()
+        self.assertEqual(user.experience_years, 2)
+
+    def test_candidates_list_filter(self):
+        create_user('senior@example.com', experience='8 years')
+        create_user('junior@example.com', experience='1 year')
+        client = APIClient()
+        client.force_authenticate(create_user('rita@example.com', role='recruiter'))
+        response = client.get('/api/auth/candidates', {'min_experience': 3})
+        self.assertEqual([c['email'] for c in response.data['candidates']], ['senior@example.com'])
+
+    def test_backfill_command(self):
+        user = create_user('cara@example.com', experience='7 years')
+        User.objects.filter(pk=user.pk).update(experience_years=None)
+        out = StringIO()
+        call_command('backfill_experience_years', stdout=out)
+        self.assertIn('Updated experience years for 1 users', out.getvalue())
+        user.refresh_from_db()
+        self.assertEqual(user.experience_years, 7)
+
+
+class CountingBackend(locmem.EmailBackend):
+    """locmem backend that counts opened connections"""
+    opened = 0
+
+    def open(self):
+        CountingBackend.opened += 1
+        return super().open()
+
+
+class FailingBackend(locmem.EmailBackend):
+    def send_messages(self, messages):
+        raise ConnectionError('SMTP server unavailable')
+
+
+@override_settings(EMAIL_OUTBOX_INLINE=False)
+class EmailOutboxTests(TestCase):
+    """Queued email delivered by the send_queued_email worker"""
+
+    def test_forgot_password_queues_email(self):
+        create_user('cara@example.com')
+        response = APIClient().post('/api/auth/forgot-password', {'email': 'cara@example.com'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutboundEmail.objects.get()
+        self.assertEqual((email.status, email.recipients), ('queued', ['cara@example.com']))
+
+        call_command('send_queued_email', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn(User.objects.get().reset_otp, mail.outbox[0].body)
+        self.assertEqual(OutboundEmail.objects.get().status, 'sent')
+
+    def test_background_job_runner_sends_queued_email(self):
+        for i in range(3):
+            queue_email('Hello', 'Body', [f'user{i}@example.com'])
+        out = StringIO()
+        call_command('run_background_jobs', '--once', stdout=out)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn('Sent 3 messages, 0 failed', out.getvalue())
+
+    @override_settings(EMAIL_BACKEND='authentication.tests.CountingBackend')
+    def test_batch_shares_one_connection(self):
+        CountingBackend.opened = 0
+        for i in range(3):
+            queue_email('Hello', 'Body', [f'user{i}@example.com'])
+        self.assertEqual(send_batch(), (3, 0))
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(len(mail.outbox), 3)
+
+    @override_settings(
+        EMAIL_BACKEND='authentication.tests.FailingBackend',
+        EMAIL_OUTBOX_MAX_ATTEMPTS=2,
+        EMAIL_OUTBOX_RETRY_DELAY=60,
+    )
+    def test_retry_with_backoff_then_dead(self):
+        email = queue_email('Hello', 'Body', ['cara@example.com'])
+        self.assertEqual(send_batch(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), ('queued', 1))
+        self.assertIn('SMTP server unavailable', email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=50))
+
+        # Not due yet
+        self.assertEqual(send_batch(), (0, 0))
+        OutboundEmail.objects.update(next_attempt_at=timezone.now())
+        send_batch()
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), ('dead', 2))
+
+    @override_settings(EMAIL_OUTBOX_INLINE=True)
+    def test_inline_delivery_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_email('Hello', 'Body', ['cara@example.com'])
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(OutboundEmail.objects.get().status, 'sent')
+
+
+@override_settings(EMAIL_OUTBOX_INLINE=False, NOTIFICATION_DIGEST_WINDOW=900)
+class NotificationTests(TestCase):
+    """In-app notifications and their email digests"""
+
+    def setUp(self):
+        self.user = create_user('cara@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_digest_merges_pending_notifications(self):
+        for i in range(3):
+            notify(self.user.id, 'application_status', f'Update {i}', 'Shortlisted')
+        # Nothing is due until the oldest notification has waited a full window
+        self.assertEqual(send_due_digests(), (0, 0))
+
+        Notification.objects.update(created_at=timezone.now() - timedelta(minutes=20))
+        self.assertEqual(send_due_digests(), (1, 3))
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.recipients, ['cara@example.com'])
+        self.assertIn('There are 3 updates', email.body)
+        self.assertIn('- Update 2: Shortlisted', email.body)
+        self.assertFalse(Notification.objects.filter(emailed_at__isnull=True).exists())
+        self.assertEqual(send_due_digests(), (0, 0))
+
+    def test_digest_skips_notifications_read_in_app(self):
+        first = notify(self.user.id, 'application_status', 'First', 'One')
+        notify(self.user.id, 'application_status', 'Second', 'Two')
+        Notification.objects.update(created_at=timezone.now() - timedelta(minutes=20))
+        self.client.post('/api/auth/notifications/read', {'ids': [first.id]}, format='json')
+
+        out = StringIO()
+        call_command('run_background_jobs', '--once', stdout=out)
+        self.assertIn('Queued 1 digest emails covering 1 notifications', out.getvalue())
+        self.assertNotIn('First', OutboundEmail.objects.get().body)
+        self.assertFalse(Notification.objects.filter(emailed_at__isnull=True).exists())
+
+        # Everything read: nothing to email, and nothing left pending
+        notify(self.user.id, 'application_status', 'Third', 'Three')
+        Notification.objects.filter(emailed_at__isnull=True).update(
+            created_at=timezone.now() - timedelta(minutes=20), read_at=timezone.now()
+        )
+        self.assertEqual(send_due_digests(), (0, 0))
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+        self.assertFalse(Notification.objects.filter(emailed_at__isnull=True).exists())
+
+    def test_mark_read_rejects_invalid_ids(self):
+        for ids in (['abc'], [None], '12'):
+            response = self.client.post('/api/auth/notifications/read', {'ids': ids}, format='json')
+            self.assertEqual(response.status_code, 400)
+
+    def test_list_and_mark_read(self):
+        first = notify(self.user.id, 'application_status', 'First', 'One')
+        notify(self.user.id, 'application_status', 'Second', 'Two')
+        notify(create_user('other@example.com').id, 'application_status', 'Other', 'Three')
+
+        response = self.client.get('/api/auth/notifications')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['title'] for item in response.data['notifications']], ['Second', 'First'])
+        self.assertEqual(response.data['unread_count'], 2)
+
+        response = self.client.post('/api/auth/notifications/read', {'ids': [first.id]}, format='json')
+        self.assertEqual(response.data['updated'], 1)
+        response = self.client.get('/api/auth/notifications', {'unread': 'true'})
+        self.assertEqual([item['title'] for item in response.data['notifications']], ['Second'])
+
+        response = self.client.post('/api/auth/notifications/read', {'all': True}, format='json')
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(self.client.get('/api/auth/notifications').data['unread_count'], 0)
+
+
+@override_settings(LOGIN_THROTTLE_IP_RATE='3/minute', LOGIN_THROTTLE_EMAIL_RATE='2/minute')
+class LoginAdmissionTests(TestCase):
+    """Login floods are refused before password hashing"""
+
+    def setUp(self):
+        cache.clear()
+        create_user('cara@example.com')
+        self.client = APIClient()
+        patcher = mock.patch('authentication.serializers.authenticate', wraps=authenticate)
+        self.authenticate = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self, email='cara@example.com', password='wrong', ip='10.0.0.1', role='candidate'):
+        return self.client.post(
+            '/api/auth/login',
+            {'email': email, 'password': password, 'role': role},
+            format='json',
+            REMOTE_ADDR=ip
+        )
+
+    def test_unknown_email_looks_like_wrong_password(self):
+        with mock.patch.object(User, 'set_password') as set_password:
+            unknown = self.login(email='nobody@example.com')
+        # Hashed like a real check, without touching an account
+        set_password.assert_called_once_with('wrong')
+        wrong_password = self.login()
+        self.assertEqual((unknown.status_code, unknown.data), (wrong_password.status_code, wrong_password.data))
+        self.assertEqual(unknown.data['errors'], {'non_field_errors': ['Invalid credentials.']})
+
+    def test_wrong_role_looks_like_wrong_password(self):
+        right_password = self.login(password='testpass123', role='recruiter')
+        wrong_password = self.login(role='recruiter')
+        self.assertEqual(right_password.status_code, 400)
+        self.assertEqual(
+            (right_password.status_code, right_password.data), (wrong_password.status_code, wrong_password.data)
+        )
+
+    def test_email_whitespace_ignored(self):
+        self.assertEqual(self.login(email=' cara@example.com ', password='testpass123').status_code, 200)
+
+    def test_ip_burst_refused_with_retry_after(self):
+        for i in range(3):
+            self.assertEqual(self.login(email=f'user{i}@example.com').status_code, 400)
+        response = self.login(password='testpass123')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response['Retry-After']), 0)
+        # The refused attempt never reached password hashing
+        self.assertEqual(self.authenticate.call_count, 3)
+
+    def test_email_bucket_spans_addresses(self):
+        for i in range(2):
+            self.assertEqual(self.login(ip=f'10.0.1.{i}').status_code, 400)
+        self.assertEqual(self.login(ip='10.0.1.9').status_code, 429)
+        self.assertEqual(self.authenticate.call_count, 2)
+
+    def test_real_user_unaffected_by_stuffing_burst(self):
+        create_user('victim@example.com')
+        # A stuffing run of 50 guesses from one address...
+        statuses = [self.login(email='victim@example.com' if i % 2 else f'user{i}@example.com').status_code
+                    for i in range(50)]
+        self.assertEqual(statuses.count(429), 47)
+        # ...costs at most the bucket capacity in password hashes
+        self.assertLessEqual(self.authenticate.call_count, 3)
+        # and a real user elsewhere still logs in at once
+        self.assertEqual(self.login(password='testpass123', ip='10.0.0.2').status_code, 200)
+
+    @override_settings(LOGIN_THROTTLE_PROXY_COUNT=1)
+    def test_client_ip_behind_proxy(self):
+        request = mock.Mock(META={'REMOTE_ADDR': '172.16.0.1', 'HTTP_X_FORWARDED_FOR': '1.2.3.4, 5.6.7.8'})
+        self.assertEqual(get_client_ip(request), '5.6.7.8')
+
+
+@override_settings(AUTH_USER_CACHE_ENABLED=True)
+class CachedUserAuthenticationTests(TestCase):
+    """JWT requests resolve the caller from the cached user snapshot"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('cara@example.com', city='Chennai')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def user_queries(self, *args):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(*args)
+        self.assertEqual(response.status_code, 200)
+        return [query['sql'] for query in context.captured_queries if '"users"' in query['sql']]
+
+    def test_repeat_requests_skip_user_query(self):
+        self.assertEqual(len(self.user_queries('/api/auth/notifications')), 1)
+        self.assertEqual(self.user_queries('/api/auth/notifications'), [])
+
+    def test_deferred_fields_load_in_one_query(self):
+        self.user_queries('/api/auth/notifications')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/auth/profile')
+        self.assertEqual(response.data['city'], 'Chennai')
+        self.assertEqual(len([query for query in context.captured_queries if 'FROM "users"' in query['sql']]), 1)
+
+    def test_save_drops_snapshot(self):
+        self.user_queries('/api/auth/notifications')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.client.get('/api/auth/notifications').status_code, 401)
+
+    def test_read_before_commit_is_not_cached_again(self):
+        self.user_queries('/api/auth/notifications')
+        stale = load_snapshot(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.user.is_active = False
+                self.user.save()
+                # Kept until the change commits
+                self.assertEqual(self.user_queries('/api/auth/notifications'), [])
+        # A request that loaded the row before the commit finishes after it
+        with mock.patch('authentication.user_cache.load_snapshot', return_value=stale):
+            self.assertTrue(get_snapshot(self.user.pk)['is_active'])
+        self.assertFalse(get_snapshot(self.user.pk)['is_active'])
+
+    @override_settings(AUTH_USER_CACHE_ENABLED=False)
+    def test_disabled_without_shared_cache(self):
+        self.assertEqual(len(self.user_queries('/api/auth/notifications')), 1)
+        self.assertEqual(len(self.user_queries('/api/auth/notifications')), 1)
+
+    def test_profile_update_keeps_fields_changed_elsewhere(self):
+        self.user_queries('/api/auth/notifications')
+        # Changed by a bulk update the cached snapshot has not seen
+        User.objects.filter(pk=self.user.pk).update(first_name='Carla')
+        response = self.client.put('/api/auth/profile', {'city': 'Madurai'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.first_name, self.user.city), ('Carla', 'Madurai'))
+
+
+class TokenRevocationTests(TestCase):
+    """Logout and refresh rotation revoke tokens; revocation checks skip the database"""
+
+    def setUp(self):
+        cache.clear()
+        revoked_tokens.reset()
+        self.user = create_user('cara@example.com')
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.refresh.access_token}')
+
+    def test_logout_revokes_access_and_refresh_token(self):
+        self.assertEqual(self.client.get('/api/auth/notifications').status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/auth/logout', {'refresh_token': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(BlacklistedToken.objects.count(), 2)
+
+        self.assertEqual(self.client.get('/api/auth/notifications').status_code, 401)
+        response = APIClient().post('/api/auth/token/refresh', {'refresh': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_refresh_rotation_blacklists_old_token(self):
+        client = APIClient()
+        response = client.post('/api/auth/token/refresh', {'refresh': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.data['refresh'], str(self.refresh))
+        response = client.post('/api/auth/token/refresh', {'refresh': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 401)
+        # Refresh rotation leaves the access token set and its version alone
+        self.assertIsNone(cache.get(VERSION_KEY))
+
+    @override_settings(CACHE_SHARED=True)
+    def test_not_revoked_check_skips_database(self):
+        self.client.get('/api/auth/notifications')
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.client.get('/api/auth/notifications').status_code, 200)
+        self.assertFalse([query for query in context.captured_queries if 'token_blacklist' in query['sql']])
+
+    @override_settings(CACHE_SHARED=True)
+    def test_other_processes_see_revocation(self):
+        other_process = RevokedTokens()
+        access = self.refresh.access_token
+        self.assertFalse(other_process.is_revoked(access['jti']))
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_token(access, user=self.user)
+        # The cached revocation version changed: the set catches up at once
+        self.assertTrue(other_process.is_revoked(access['jti']))
+
+    def test_other_processes_see_revocation_without_shared_cache(self):
+        other_process = RevokedTokens()
+        access = self.refresh.access_token
+        self.assertFalse(other_process.is_revoked(access['jti']))
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_token(access, user=self.user)
+        # Another worker's local cache never sees the version change
+        cache.delete(VERSION_KEY)
+        with self.assertNumQueries(0):
+            self.assertFalse(other_process.is_revoked(access['jti']))
+        with override_settings(TOKEN_BLACKLIST_POLL_INTERVAL=-1):
+            self.assertTrue(other_process.is_revoked(access['jti']))
+
+    def test_incremental_sync_moves_past_refresh_tokens(self):
+        revoked_tokens.sync(full=True)
+        revoke_token(self.refresh, user=self.user)
+        revoked_tokens.sync()
+        self.assertEqual(revoked_tokens.last_id, BlacklistedToken.objects.get().id)
+        self.assertEqual(revoked_tokens.expiry, {})
+        # Nothing new: the refresh token row is not scanned again
+        with CaptureQueriesContext(connection) as context:
+            revoked_tokens.sync()
+        self.assertIn(f'> {revoked_tokens.last_id}', context.captured_queries[0]['sql'])
+
+    def test_set_holds_only_access_tokens(self):
+        access = self.refresh.access_token
+        revoke_token(self.refresh, user=self.user)
+        revoke_token(access, user=self.user)
+        revoked_tokens.sync(full=True)
+        self.assertEqual(set(revoked_tokens.expiry), {access['jti']})
+
+    def test_purge_expired_tokens_in_batches(self):
+        for i in range(3):
+            expired = OutstandingToken.objects.create(
+                user=self.user, jti=f'expired-{i}', token='token', expires_at=timezone.now() - timedelta(days=1)
+            )
+            BlacklistedToken.objects.create(token=expired)
+        out = StringIO()
+        call_command('purge_expired_tokens', '--batch-size', '2', stdout=out)
+        self.assertIn('Deleted 3 expired tokens', out.getvalue())
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [self.refresh['jti']])
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+class QueryPlanTests(QueryPlanTestMixin, TestCase):
+    """The main queries of the candidate lists use an index"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(create_user('rita@example.com', role='recruiter'))
+        create_user('cara@example.com', experience='3 years')
+
+    def test_candidates_list(self):
+        self.assertIndexedQueries('users', self.client.get, '/api/auth/candidates')
+        self.assertIndexedQueries('users', self.client.get, '/api/auth/candidates', {'sort': 'completion'})
+        self.assertIndexedQueries('users', self.client.get, '/api/auth/candidates', {'min_experience': 2})
@@ -0,0 +1,90 @@
+"""
+Login admission control.
+
+Every login attempt that would reach password verification (a PBKDF2 hash
+costing tens of milliseconds of CPU) first takes a token from two token
+buckets kept in the cache: one per client IP and one per email address.
+A bucket holds up to `capacity` tokens and refills at capacity/period per
+second, so short bursts from a real user pass while a sustained stream of
+guesses is refused with a 429 and Retry-After before any hashing happens.
+The sync gunicorn workers therefore stay free for other users during a
+credential-stuffing burst.
+
+Rates are LOGIN_THROTTLE_IP_RATE and LOGIN_THROTTLE_EMAIL_RATE, written
+'<attempts>/<period>' with period in seconds or as second/minute/hour.
+With the local-memory cache each gunicorn worker keeps its own buckets;
+set REDIS_URL to share them. Bucket updates are read-modify-write, so
+concurrent requests may occasionally both take the last token; this is
+admission control, not an exact counter.
+"""
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+KEY_PREFIX = 'login_throttle'
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600}
+
+
+def parse_rate(rate):
+    """'10/minute' or '10/60' -> (capacity, refill per second)"""
+    attempts, period = rate.split('/')
+    seconds = PERIODS[period] if period in PERIODS else int(period)
+    return int(attempts), int(attempts) / seconds
+
+
+def bucket_key(scope, identity):
+    # Hash the identity: emails are user input of any length and content
+    digest = hashlib.sha256(identity.encode()).hexdigest()
+    return f'{KEY_PREFIX}:{scope}:{digest}'
+
+
+def take_token(key, rate, now=None):
+    """
+    Take one token from a bucket. Returns 0 when admitted, otherwise the
+    seconds until a token is available.
+    """
+    capacity, refill = parse_rate(rate)
+    now = time.time() if now is None else now
+    tokens, updated = cache.get(key) or (capacity, now)
+    tokens = min(capacity, tokens + (now - updated) * refill)
+    if tokens < 1:
+        return math.ceil((1 - tokens) / refill)
+    # Keep the bucket until it would have refilled completely
+    cache.set(key, (tokens - 1, now), timeout=math.ceil(capacity / refill))
+    return 0
+
+
+def get_client_ip(request):
+    """
+    Client address. Behind LOGIN_THROTTLE_PROXY_COUNT trusted proxies it is
+    the address the outermost one saw, from the right of X-Forwarded-For;
+    entries further left are client-supplied and could be spoofed.
+    """
+    proxies = getattr(settings, 'LOGIN_THROTTLE_PROXY_COUNT', 0)
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if proxies and forwarded:
+        addresses = [address.strip() for address in forwarded.split(',')]
+        return addresses[-min(proxies, len(addresses))]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def admit_login(request, email):
+    """
+    Charge a login attempt to the client IP and the email address.
+    Returns 0 when the attempt may proceed, otherwise the Retry-After seconds.
+    """
+    if not getattr(settings, 'LOGIN_THROTTLE_ENABLED', True):
+        return 0
+    # The IP bucket first: a refused burst then never touches the email buckets
+    retry_after = take_token(
+        bucket_key('ip', get_client_ip(request)), settings.LOGIN_THROTTLE_IP_RATE
+    )
+    if retry_after:
+        return retry_after
+    return take_token(
+        bucket_key('email', email.strip().lower()), settings.LOGIN_THROTTLE_EMAIL_RATE
+    )
@@ -1,4 +1,5 @@
 from django.urls import path
+from rest_framework_simplejwt.views import TokenRefreshView
 from . import views
 
 urlpatterns = [
@@ -7,6 +8,7 @@ urlpatterns = [
     path('recruiter-register', views.recruiter_register_view, name='recruiter_register'),
     path('login', views.login_view, name='login'),
     path('logout', views.logout_view, name='logout'),
+    path('token/refresh', TokenRefreshView.as_view(), name='token_refresh'),
     
     # Password reset endpoints
     path('forgot-password', views.forgot_password_view, name='forgot_password'),
@@ -18,6 +20,10 @@ urlpatterns = [
     path('profile/upload-resume', views.upload_resume_view, name='upload_resume'),
     path('profile/stats', views.user_stats_view, name='user_stats'),
     
+    # Notification endpoints
+    path('notifications', views.notifications_view, name='notifications'),
+    path('notifications/read', views.mark_notifications_read_view, name='mark_notifications_read'),
+    
     # Recruiter endpoints
     path('candidates', views.candidates_list_view, name='candidates_list'),
     
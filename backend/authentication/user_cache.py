@@ -0,0 +1,133 @@
+"""
+Cached user resolution for JWT-authenticated requests.
+
+CachedJWTAuthentication keeps a slim snapshot of each caller (identity,
+role, approval and profile flags) in the cache for AUTH_USER_CACHE_TIMEOUT
+seconds, so most requests find out who is calling without a query on
+users, and the permission checks and can_post_jobs() read the snapshot
+instead of loading more rows.
+
+request.user is still a User: the fields outside the snapshot are
+deferred, and the first access to any of them loads the rest of the row
+in one query (see User.refresh_from_db), which is what every request cost
+before. Saving a User or RecruiterCompanyProfile drops the snapshot once
+the transaction commits (see recruiter/signals.py); bulk updates on users
+call invalidate_users() the same way. A dropped snapshot leaves a marker
+for INVALIDATION_GRACE seconds that keeps a request which read the row
+before the commit from caching it again.
+
+Dropping a snapshot has to reach every gunicorn worker, so the cache is
+only used when it is shared (AUTH_USER_CACHE_ENABLED defaults to on when
+REDIS_URL is set); otherwise every request loads the user as before.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+from .revocation import is_revoked
+
+KEY_PREFIX = 'auth_user'
+
+# Cached in place of a dropped snapshot
+INVALIDATED = 'invalidated'
+
+# Seconds the marker stays; longer than a request takes to load and cache a row
+INVALIDATION_GRACE = 10
+
+# User fields kept in the snapshot
+SNAPSHOT_FIELDS = [
+    'id', 'email', 'first_name', 'last_name', 'role', 'approval_status',
+    'is_active', 'is_staff', 'is_superuser', 'profile_completed',
+]
+
+
+def is_enabled():
+    return getattr(settings, 'AUTH_USER_CACHE_ENABLED', False)
+
+
+def get_timeout():
+    return getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 60)
+
+
+def user_key(user_id):
+    return f'{KEY_PREFIX}:{user_id}'
+
+
+def invalidate_user(user_id):
+    invalidate_users([user_id])
+
+
+def invalidate_users(user_ids):
+    """Drop snapshots; call once the change has committed"""
+    cache.set_many({user_key(user_id): INVALIDATED for user_id in user_ids}, INVALIDATION_GRACE)
+
+
+def load_snapshot(user_id):
+    """Snapshot values of a user from the database, or None"""
+    values = User.objects.filter(pk=user_id).values(*SNAPSHOT_FIELDS).first()
+    if values is None:
+        return None
+    from recruiter.models import RecruiterCompanyProfile
+    values['has_company_profile'] = (
+        values['role'] == 'recruiter'
+        and RecruiterCompanyProfile.objects.filter(recruiter_id=user_id).exists()
+    )
+    return values
+
+
+def get_snapshot(user_id):
+    key = user_key(user_id)
+    cached = cache.get(key)
+    if cached is not None and cached != INVALIDATED:
+        return cached
+    snapshot = load_snapshot(user_id)
+    if snapshot is not None and cached is None:
+        # add() leaves a marker set since the read in place: the row loaded
+        # here may predate the change that set it
+        cache.add(key, snapshot, get_timeout())
+    return snapshot
+
+
+def user_from_snapshot(snapshot):
+    """A User with the snapshot fields loaded and every other field deferred"""
+    # from_db() takes the values in model field order
+    fields = [field.attname for field in User._meta.concrete_fields if field.attname in SNAPSHOT_FIELDS]
+    user = User.from_db(DEFAULT_DB_ALIAS, fields, [snapshot[field] for field in fields])
+    user._snapshot = {field: snapshot[field] for field in SNAPSHOT_FIELDS}
+    user._has_company_profile = snapshot['has_company_profile']
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication resolving the user from the cached snapshot and
+    refusing revoked (logged out) access tokens
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if is_revoked(validated_token):
+            raise InvalidToken(_('Token is blacklisted'))
+        return validated_token
+
+    def get_user(self, validated_token):
+        # Revocation checks compare the password hash, which is not cached
+        if not is_enabled() or api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != 'id':
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        snapshot = get_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not snapshot['is_active']:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user_from_snapshot(snapshot)
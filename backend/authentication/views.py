@@ -5,19 +5,25 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth import authenticate
-from django.core.mail import send_mail
 from django.conf import settings
+from django.db.models import F
 from django.utils import timezone
 from datetime import timedelta
 import random
 import string
-from .models import User
+from recruiter.pagination import InvalidCursor, get_page_size, paginate_keyset
+from recruiter.stats import get_recruiter_stats
+from .models import User, Notification, canonical_skill_name
+from .outbox import queue_email
+from .revocation import revoke_token
+from .throttling import admit_login
 from .serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
     UserProfileSerializer,
     UserProfileUpdateSerializer,
-    ResumeUploadSerializer
+    ResumeUploadSerializer,
+    NotificationSerializer
 )
 
 @api_view(['POST'])
@@ -184,22 +190,38 @@ def login_view(request):
     email = request.data.get('email')
     password = request.data.get('password')
     role = request.data.get('role', 'candidate')  # Default to candidate
+    if isinstance(email, str):
+        email = email.strip()
+    
+    if isinstance(email, str) and email and password:
+        # Refuse floods before any password hashing (see throttling.py)
+        retry_after = admit_login(request, email)
+        if retry_after:
+            response = Response({
+                'success': False,
+                'message': f'Too many login attempts. Try again in {retry_after} seconds.'
+            }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+            response['Retry-After'] = str(retry_after)
+            return response
     
     login_data = {
         'email': email,
         'password': password
     }
     
+    # authenticate() hashes the password of an unknown email too, so neither
+    # the response nor its timing tells whether the email is registered
     serializer = UserLoginSerializer(data=login_data)
     if serializer.is_valid():
         user = serializer.validated_data['user']
         
-        # Check if user role matches requested role
+        # A wrong role fails exactly like a wrong password, so a login
+        # attempt never reveals which role an account has
         if user.role != role:
             return Response({
                 'success': False,
-                'message': f'Invalid credentials for {role} login',
-                'errors': {'role': [f'User is not registered as a {role}']}
+                'message': 'Login failed',
+                'errors': {'non_field_errors': ['Invalid credentials.']}
             }, status=status.HTTP_400_BAD_REQUEST)
         
         # Generate JWT tokens
@@ -260,9 +282,11 @@ def login_view(request):
 @permission_classes([IsAuthenticated])
 def logout_view(request):
     """
-    Logout candidate (blacklist refresh token)
+    Logout candidate (blacklist the access token and the refresh token)
     """
     try:
+        if request.auth is not None:
+            revoke_token(request.auth, user=request.user)
         refresh_token = request.data.get('refresh_token')
         if refresh_token:
             token = RefreshToken(refresh_token)
@@ -383,36 +407,22 @@ def user_stats_view(request):
     user = request.user
     
     if user.role == 'recruiter':
-        # Recruiter dashboard stats
-        total_candidates = User.objects.filter(role='candidate').count()
+        # Recruiter dashboard stats, one cached aggregate over their jobs
+        stats = get_recruiter_stats(user.id)
         
         return Response({
             'success': True,
             'stats': {
-                'total_candidates': total_candidates,
-                'active_jobs': 0,  # Placeholder
-                'applications_received': 0,  # Placeholder
-                'interviews_scheduled': 0,  # Placeholder
+                **stats,
                 'member_since': user.created_at.strftime('%B %Y')
             }
         }, status=status.HTTP_200_OK)
     else:
-        # Candidate dashboard stats (existing logic)
-        profile_fields = [
-            user.first_name, user.last_name, user.phone, user.email,
-            user.date_of_birth, user.gender, user.address, user.city, 
-            user.state, user.pincode, user.bio, user.skills, 
-            user.experience, user.education, user.linkedin_url,
-            user.github_url, user.portfolio_url, user.resume_file_path
-        ]
-        
-        completed_fields = sum(1 for field in profile_fields if field)
-        completion_percentage = (completed_fields / len(profile_fields)) * 100
-        
+        # Candidate dashboard stats
         return Response({
             'success': True,
             'stats': {
-                'profile_completion': round(completion_percentage, 1),
+                'profile_completion': user.profile_completion,
                 'resume_uploaded': bool(user.resume_file_path),
                 'skills_count': len(user.get_skills_list()),
                 'social_links_added': sum([
@@ -429,6 +439,10 @@ def user_stats_view(request):
 def candidates_list_view(request):
     """
     Get list of candidates (for recruiters only)
+      ?skill=X                only candidates with skill X
+      ?min_completion=N       only profiles at least N percent complete
+      ?min_experience=N       only candidates with at least N years of experience
+      ?sort=completion|experience   highest first
     """
     if request.user.role != 'recruiter':
         return Response({
@@ -436,12 +450,30 @@ def candidates_list_view(request):
             'message': 'Access denied. Recruiter role required.'
         }, status=status.HTTP_403_FORBIDDEN)
     
-    # Get all candidates
-    candidates = User.objects.filter(role='candidate').values(
+    # Get all candidates, optionally only those with a given skill
+    candidates = User.objects.filter(role='candidate')
+    skill = request.GET.get('skill')
+    if skill:
+        candidates = candidates.filter(skill_tags__name=canonical_skill_name(skill))
+    try:
+        min_completion = int(request.GET.get('min_completion', 0))
+        min_experience = int(request.GET.get('min_experience', 0))
+    except ValueError:
+        min_completion = min_experience = 0
+    if min_completion:
+        candidates = candidates.filter(profile_completion__gte=min_completion)
+    if min_experience:
+        candidates = candidates.filter(experience_years__gte=min_experience)
+    sort = request.GET.get('sort')
+    if sort == 'completion':
+        candidates = candidates.order_by('-profile_completion', 'id')
+    elif sort == 'experience':
+        candidates = candidates.order_by(F('experience_years').desc(nulls_last=True), 'id')
+    candidates = candidates.values(
         'id', 'first_name', 'last_name', 'email', 'phone',
         'skills', 'experience', 'city', 'state',
         'linkedin_url', 'github_url', 'portfolio_url',
-        'created_at'
+        'experience_years', 'profile_completion', 'created_at'
     )
     
     # Format candidates data
@@ -460,6 +492,8 @@ def candidates_list_view(request):
                 'github': candidate['github_url'],
                 'portfolio': candidate['portfolio_url']
             },
+            'experience_years': candidate['experience_years'],
+            'profile_completion': candidate['profile_completion'],
             'joined_date': candidate['created_at'].strftime('%Y-%m-%d')
         })
     
@@ -572,35 +606,13 @@ Best regards,
 MytechZ Team
     """.strip()
     
-    # Try to send email
-    try:
-        from django.conf import settings
-        
-        # Check if we're using SMTP backend
-        if hasattr(settings, 'EMAIL_BACKEND') and 'smtp' in settings.EMAIL_BACKEND:
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[email],
-                fail_silently=False,
-            )
-            response_message = 'OTP sent to your email address. Please check your inbox.'
-        else:
-            # Console backend - show OTP in response for development
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[email],
-                fail_silently=False,
-            )
-            response_message = f'Development mode: OTP is {otp}. Check console for email content.'
-            
-    except Exception as e:
-        print(f"Email sending failed: {str(e)}")
-        # Still return success but with fallback message
-        response_message = f'OTP generated. For development: {otp}'
+    # Queue the email; the outbox worker delivers it outside the request
+    queue_email(subject, message, [email])
+    if 'smtp' in settings.EMAIL_BACKEND:
+        response_message = 'OTP sent to your email address. Please check your inbox.'
+    else:
+        # Console backend - show OTP in response for development
+        response_message = f'Development mode: OTP is {otp}. Check console for email content.'
     
     return Response({
         'success': True,
@@ -661,4 +673,65 @@ def reset_password_view(request):
     return Response({
         'success': True,
         'message': 'Password reset successfully'
-    })
\ No newline at end of file
+    })
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def notifications_view(request):
+    """
+    In-app notifications of the current user, newest first
+      ?unread=true        only unread notifications
+      ?limit=N&cursor=C   keyset pagination
+    """
+    notifications = Notification.objects.filter(user=request.user)
+    if request.GET.get('unread', '').lower() in ('1', 'true'):
+        notifications = notifications.filter(read_at__isnull=True)
+    
+    try:
+        page, next_cursor = paginate_keyset(
+            notifications,
+            cursor=request.GET.get('cursor'),
+            limit=get_page_size(request)
+        )
+    except InvalidCursor:
+        return Response({
+            'success': False,
+            'message': 'Invalid cursor'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    return Response({
+        'success': True,
+        'notifications': NotificationSerializer(page, many=True).data,
+        'unread_count': Notification.objects.filter(user=request.user, read_at__isnull=True).count(),
+        'next': next_cursor,
+        'has_more': next_cursor is not None
+    }, status=status.HTTP_200_OK)
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def mark_notifications_read_view(request):
+    """
+    Mark notifications as read
+    Body: {"ids": [1, 2]} or {"all": true}
+    """
+    notifications = Notification.objects.filter(user=request.user, read_at__isnull=True)
+    if not request.data.get('all'):
+        ids = request.data.get('ids')
+        try:
+            if not isinstance(ids, list):
+                raise TypeError
+            ids = [int(notification_id) for notification_id in ids]
+        except (TypeError, ValueError):
+            return Response({
+                'success': False,
+                'message': 'Provide a list of notification ids or all=true'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        notifications = notifications.filter(id__in=ids)
+    
+    updated = notifications.update(read_at=timezone.now())
+    
+    return Response({
+        'success': True,
+        'message': f'{updated} notifications marked as read',
+        'updated': updated
+    }, status=status.HTTP_200_OK)
@@ -0,0 +1,66 @@
+"""
+Query plan assertions for tests.
+
+QueryPlanTestMixin.assertIndexedQueries() calls an endpoint, captures the
+SELECTs it runs against a table and EXPLAINs each one, failing when the
+database would read any table in full instead of going through an index.
+
+Test tables are tiny and have no statistics, so on PostgreSQL sequential
+scans are disabled for the duration of the test transaction; a plan that
+still shows one has no usable index.
+"""
+import re
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# 'SCAN users' (SQLite 3.36+) or 'SCAN TABLE users [AS U0]' (older versions);
+# scans 'USING INDEX' are not full table scans
+SQLITE_FULL_SCAN_RE = re.compile(r'\bSCAN (?:TABLE )?(\w+)(?: AS \w+)?\s*$')
+POSTGRESQL_FULL_SCAN_RE = re.compile(r'Seq Scan on (\w+)')
+
+
+def explain(sql):
+    """Return the query plan of a SQL statement as text"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {sql}')
+        else:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        return '\n'.join(' '.join(str(column) for column in row) for row in cursor.fetchall())
+
+
+def full_table_scans(plan):
+    """Names of the tables a query plan reads in full"""
+    if connection.vendor == 'postgresql':
+        return POSTGRESQL_FULL_SCAN_RE.findall(plan)
+    return [
+        match.group(1)
+        for line in plan.splitlines()
+        for match in [SQLITE_FULL_SCAN_RE.search(line)] if match
+    ]
+
+
+class QueryPlanTestMixin:
+    """Assertions on the query plans of the queries an endpoint runs"""
+
+    def assertIndexedQueries(self, table, func, *args, **kwargs):
+        """
+        Call func and assert every SELECT it runs on 'table' avoids full table scans.
+        Returns func's result.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            result = func(*args, **kwargs)
+
+        pattern = re.compile(rf'\bFROM "?{table}"?(?:\s|,|$)', re.IGNORECASE)
+        selects = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].lstrip().upper().startswith('SELECT') and pattern.search(query['sql'])
+        ]
+        self.assertTrue(selects, f'No SELECT on {table} was run')
+
+        for sql in selects:
+            plan = explain(sql)
+            scans = full_table_scans(plan)
+            self.assertEqual(scans, [], f'Full table scan on {", ".join(scans)}\n{sql}\n{plan}')
+        return result
@@ -12,7 +12,9 @@ from rest_framework import status
 from recruiter import views as recruiter_views
 from admin_management.models import Webinar, AdmissionPost
 from admin_management.serializers import WebinarSerializer, AdmissionPostSerializer
+from admin_management.response_cache import cache_public_response
 
+@cache_public_response('webinars')
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def public_webinars_view(request):
@@ -25,6 +27,7 @@ def public_webinars_view(request):
         'total': webinars.count()
     })
 
+@cache_public_response('admissions')
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def public_admissions_view(request):
@@ -77,6 +80,7 @@ urlpatterns = [
     
     # Public endpoints
     path('api/jobs/public', recruiter_views.public_jobs_view, name='public_jobs'),
+    path('api/jobs/search', recruiter_views.search_jobs_view, name='search_jobs'),
     path('api/jobs/<int:job_id>', recruiter_views.job_detail_public_view, name='job_detail_public'),
     path('api/jobs/<int:job_id>/apply', recruiter_views.apply_job_view, name='apply_job'),
     path('api/jobs/<int:job_id>/check-status', recruiter_views.check_application_status_view, name='check_application_status'),
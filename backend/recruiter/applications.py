@@ -0,0 +1,65 @@
+"""
+Bulk application status changes.
+
+A recruiter triaging applicants moves many applications at once: ownership
+of the whole set is checked in one query, the rows change in one UPDATE,
+and the job counters and dashboard stats that the per-row signals would
+have maintained are adjusted afterwards in the same transaction.
+"""
+from collections import Counter, defaultdict
+from django.db import transaction
+from django.utils import timezone
+
+from .models import JobApplication, JobPost
+from .stats import invalidate_recruiter_stats
+from .notifications import notify_application_statuses
+
+# Most applications one request may change
+MAX_BULK_APPLICATIONS = 500
+
+
+def bulk_update_status(recruiter, application_ids, new_status, recruiter_notes=''):
+    """
+    Move the recruiter's applications to new_status, optionally replacing
+    their notes. Returns (updated ids, [{'id', 'message'}] for rejected ids).
+    """
+    errors = []
+    with transaction.atomic():
+        rows = {
+            row[0]: row[1:]
+            for row in (
+                JobApplication.objects.select_for_update(of=('self',))
+                .filter(id__in=application_ids)
+                .values_list('id', 'job_id', 'job__recruiter_id', 'status', 'candidate_id', 'job__job_title')
+            )
+        }
+
+        updated = []
+        moves = defaultdict(Counter)
+        status_changes = []
+        for application_id in application_ids:
+            if application_id not in rows:
+                errors.append({'id': application_id, 'message': 'Application not found'})
+                continue
+            job_id, owner_id, old_status, candidate_id, job_title = rows[application_id]
+            if owner_id != recruiter.id:
+                errors.append({'id': application_id, 'message': 'Access denied'})
+                continue
+            updated.append(application_id)
+            moves[job_id][old_status] -= 1
+            moves[job_id][new_status] += 1
+            if old_status != new_status:
+                status_changes.append((candidate_id, application_id, job_id, job_title, new_status))
+
+        if updated:
+            changes = {'status': new_status, 'updated_at': timezone.now()}
+            if recruiter_notes:
+                changes['recruiter_notes'] = recruiter_notes
+            JobApplication.objects.filter(id__in=updated).update(**changes)
+            # update() sends no signals: move the counters count_application_save would have
+            for job_id, deltas in moves.items():
+                JobPost.objects.shift_application_counts(job_id, deltas)
+            # ...and record the candidate notifications the status signal would have
+            notify_application_statuses(status_changes)
+            transaction.on_commit(lambda: invalidate_recruiter_stats(recruiter.id))
+    return updated, errors
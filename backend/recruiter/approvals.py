@@ -0,0 +1,62 @@
+"""
+Bulk recruiter approval and rejection.
+
+The single-recruiter admin endpoints save the user and then the company
+profile (whose save() saves the user again), one recruiter per request.
+Here one query classifies the whole set, and set-based UPDATEs on users
+and company profiles apply the decision in a single transaction.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from authentication.models import User
+from authentication.user_cache import invalidate_users
+from .models import RecruiterCompanyProfile
+from .notifications import notify_recruiter_approval
+
+ACTIONS = ['approve', 'reject']
+
+# Most recruiters one request may change
+MAX_BULK_RECRUITERS = 500
+
+
+def bulk_set_approval(recruiter_ids, action, reason=''):
+    """
+    Approve or reject recruiters. As in the single endpoints, only
+    recruiters with a completed profile can be approved; approving also
+    verifies pending company profiles, rejecting rejects them with the
+    reason as verification notes.
+    Returns (updated ids, [{'id', 'message'}] for rejected ids).
+    """
+    errors = []
+    with transaction.atomic():
+        found = dict(
+            User.objects.select_for_update()
+            .filter(id__in=recruiter_ids, role='recruiter')
+            .values_list('id', 'profile_completed')
+        )
+        updated = []
+        for recruiter_id in recruiter_ids:
+            if recruiter_id not in found:
+                errors.append({'id': recruiter_id, 'message': 'Recruiter not found'})
+            elif action == 'approve' and not found[recruiter_id]:
+                errors.append({'id': recruiter_id, 'message': 'Profile not completed'})
+            else:
+                updated.append(recruiter_id)
+
+        if updated:
+            now = timezone.now()
+            recruiters = User.objects.filter(id__in=updated)
+            profiles = RecruiterCompanyProfile.objects.filter(recruiter_id__in=updated)
+            if action == 'approve':
+                recruiters.update(approval_status='approved', approved_at=now, updated_at=now)
+                profiles.filter(verification_status='pending').update(
+                    verification_status='verified', updated_at=now
+                )
+            else:
+                recruiters.update(approval_status='rejected', approved_at=None, updated_at=now)
+                profiles.update(verification_status='rejected', verification_notes=reason, updated_at=now)
+            notify_recruiter_approval(updated, action, reason)
+            # update() sends no signals
+            transaction.on_commit(lambda: invalidate_users(updated))
+    return updated, errors
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 class RecruiterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'recruiter'
-    verbose_name = 'Recruiter Management'
\ No newline at end of file
+    verbose_name = 'Recruiter Management'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
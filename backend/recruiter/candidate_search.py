@@ -0,0 +1,124 @@
+"""
+Candidate search table behind the recruiter resume database.
+
+CandidateSearchProfile keeps one indexed row per active candidate with the
+values the resume database filters and sorts on (location, experience in
+years, profile completion, last activity), so those are answered by the
+database instead of by parsing every profile in Python. Skill filters use
+the normalized User.skill_tags links.
+
+Rows are refreshed by the User post_save signal in recruiter/signals.py and
+can be rebuilt with `manage.py rebuild_candidate_search`.
+"""
+from datetime import timedelta
+from django.db.models import Q
+from django.utils import timezone
+
+from authentication.models import User, canonical_skill_name
+from .models import CandidateSearchProfile
+
+# ?sort= value -> CandidateSearchProfile field, all sorted descending
+SORT_FIELDS = {
+    'last_active': 'last_active',
+    'joined': 'joined_at',
+    'experience': 'experience_years',
+    'completion': 'profile_completion',
+}
+DEFAULT_SORT = 'last_active'
+
+# User fields the search row is built from; saves touching none of them skip the refresh
+SOURCE_FIELDS = {
+    'role', 'is_active', 'first_name', 'last_name', 'email', 'phone', 'city', 'state',
+    'bio', 'skills', 'experience', 'experience_years', 'education', 'linkedin_url', 'github_url',
+    'portfolio_url', 'resume_file_name', 'resume_file_path', 'updated_at',
+}
+
+
+def normalize_place(value):
+    return ' '.join((value or '').split()).lower()[:100]
+
+
+def build_search_profile(user):
+    """Unsaved CandidateSearchProfile holding the searchable values of a candidate"""
+    return CandidateSearchProfile(
+        candidate_id=user.pk,
+        city=normalize_place(user.city),
+        state=normalize_place(user.state),
+        experience_years=user.experience_years or 0,
+        profile_completion=user.profile_completion,
+        last_active=user.updated_at or timezone.now(),
+        joined_at=user.created_at or timezone.now(),
+    )
+
+
+def refresh_search_profile(user):
+    """Create, update or drop the search row of one user"""
+    if user.role != 'candidate' or not user.is_active:
+        CandidateSearchProfile.objects.filter(candidate_id=user.pk).delete()
+        return
+    profile = build_search_profile(user)
+    CandidateSearchProfile.objects.update_or_create(
+        candidate_id=user.pk,
+        defaults={
+            field: getattr(profile, field)
+            for field in ('city', 'state', 'experience_years', 'profile_completion', 'last_active', 'joined_at')
+        }
+    )
+
+
+def rebuild_search_profiles(batch_size=1000):
+    """Re-create every search row from the users table. Returns the number of rows."""
+    candidates = User.objects.filter(role='candidate', is_active=True).order_by('pk')
+    CandidateSearchProfile.objects.all().delete()
+    created = 0
+    batch = []
+    for user in candidates.iterator(chunk_size=batch_size):
+        batch.append(build_search_profile(user))
+        if len(batch) >= batch_size:
+            CandidateSearchProfile.objects.bulk_create(batch)
+            created += len(batch)
+            batch = []
+    if batch:
+        CandidateSearchProfile.objects.bulk_create(batch)
+        created += len(batch)
+    return created
+
+
+def parse_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def filter_candidates(profiles, params):
+    """
+    Apply the resume database filters from query parameters:
+      skills=a,b          candidates having every listed skill
+      location=X          city or state equal to X (case-insensitive)
+      min_experience=N    at least N years of experience
+      min_completion=N    profile at least N percent complete
+      active_within=N     profile updated in the last N days
+    """
+    for skill in (params.get('skills') or '').split(','):
+        skill = canonical_skill_name(skill)
+        if skill:
+            profiles = profiles.filter(candidate__skill_tags__name=skill)
+
+    location = normalize_place(params.get('location'))
+    if location:
+        profiles = profiles.filter(Q(city=location) | Q(state=location))
+
+    min_experience = parse_int(params.get('min_experience'))
+    if min_experience:
+        profiles = profiles.filter(experience_years__gte=min_experience)
+
+    min_completion = parse_int(params.get('min_completion'))
+    if min_completion:
+        profiles = profiles.filter(profile_completion__gte=min_completion)
+
+    active_within = parse_int(params.get('active_within'))
+    if active_within:
+        profiles = profiles.filter(last_active__gte=timezone.now() - timedelta(days=active_within))
+
+    return profiles
@@ -0,0 +1,32 @@
+"""
+Recruiter application export columns. Streaming and encoding live in
+job_portal/exports.py.
+"""
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+from job_portal.exports import export_rows
+
+# Exported column -> JobApplication values() path or annotation
+APPLICATION_COLUMNS = {
+    'id': 'id',
+    'applied_at': 'applied_at',
+    'updated_at': 'updated_at',
+    'status': 'status',
+    'job_id': 'job_id',
+    'job_title': 'job__job_title',
+    'job_location': 'job__location',
+    'candidate_id': 'candidate_id',
+    'candidate_name': Concat('candidate__first_name', Value(' '), 'candidate__last_name'),
+    'candidate_email': 'candidate__email',
+    'candidate_phone': 'candidate__phone',
+    'candidate_city': 'candidate__city',
+    'candidate_experience': 'candidate__experience',
+    'cover_letter': 'cover_letter',
+    'recruiter_notes': 'recruiter_notes',
+}
+
+
+def application_export_rows(applications):
+    """Export rows of a JobApplication queryset as dicts keyed by column"""
+    return export_rows(applications, APPLICATION_COLUMNS)
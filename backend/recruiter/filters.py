@@ -0,0 +1,128 @@
+"""
+Filters and facet counts for the public job listing.
+
+Each facet is counted with one grouped aggregate query over the published
+jobs matching every active filter except the facet's own, so a client can
+draw its filter chips (with counts) without fetching the whole catalog.
+"""
+from django.db.models import Case, CharField, Count, Value, When
+from django.db.models.functions import Coalesce
+
+from authentication.models import canonical_skill_name
+
+# Fixed salary bands on the advertised (annual) salary: (key, lower bound, upper bound)
+SALARY_BANDS = [
+    ('0-3L', 0, 300000),
+    ('3-6L', 300000, 600000),
+    ('6-10L', 600000, 1000000),
+    ('10-20L', 1000000, 2000000),
+    ('20L+', 2000000, None),
+]
+SALARY_NOT_DISCLOSED = 'not_disclosed'
+
+# Facet dimensions counted by distinct column value
+VALUE_FACETS = ['job_type', 'work_mode', 'experience_level', 'location']
+
+# Most frequent values returned for open-ended facets such as location
+MAX_FACET_VALUES = 20
+
+
+def salary_range_filter(lower, upper):
+    """Filter kwargs for a salary band on the '_salary' annotation"""
+    condition = {'_salary__gte': lower}
+    if upper is not None:
+        condition['_salary__lt'] = upper
+    return condition
+
+
+def with_salary(jobs):
+    """Annotate each job with its advertised salary as '_salary' (max, else min)"""
+    return jobs.annotate(_salary=Coalesce('max_salary', 'min_salary'))
+
+
+def with_salary_band(jobs):
+    """Annotate each job with its SALARY_BANDS key as 'salary_band'"""
+    whens = [
+        When(then=Value(key), **salary_range_filter(lower, upper))
+        for key, lower, upper in SALARY_BANDS
+    ]
+    return with_salary(jobs).annotate(
+        salary_band=Case(*whens, default=Value(SALARY_NOT_DISCLOSED), output_field=CharField())
+    )
+
+
+def filter_salary_band(jobs, band_key):
+    """Restrict jobs to one salary band; unknown band keys are ignored"""
+    if band_key == SALARY_NOT_DISCLOSED:
+        return jobs.filter(max_salary__isnull=True, min_salary__isnull=True)
+    for key, lower, upper in SALARY_BANDS:
+        if key == band_key:
+            return with_salary(jobs).filter(**salary_range_filter(lower, upper))
+    return jobs
+
+
+def filter_public_jobs(jobs, params, skip=None):
+    """
+    Apply the optional public job listing filters from query parameters.
+    'skip' names one filter to leave out (used when counting its facet).
+    """
+    job_type = params.get('job_type')
+    work_mode = params.get('work_mode')
+    experience_level = params.get('experience_level')
+    location = params.get('location')
+    salary_band = params.get('salary_band')
+    skill = params.get('skill')
+
+    if job_type and skip != 'job_type':
+        jobs = jobs.filter(job_type=job_type)
+    if work_mode and skip != 'work_mode':
+        jobs = jobs.filter(work_mode=work_mode)
+    if experience_level and skip != 'experience_level':
+        jobs = jobs.filter(experience_level=experience_level)
+    if location and skip != 'location':
+        jobs = jobs.filter(location__icontains=location)
+    if salary_band and skip != 'salary':
+        jobs = filter_salary_band(jobs, salary_band)
+    if skill and skip != 'skill':
+        jobs = jobs.filter(skill_tags__name=canonical_skill_name(skill))
+    return jobs
+
+
+def public_job_facets(jobs, params):
+    """
+    Return facet counts for the published jobs queryset 'jobs'.
+    Runs one grouped COUNT query per dimension.
+    """
+    facets = {}
+
+    for field in VALUE_FACETS:
+        rows = (
+            filter_public_jobs(jobs, params, skip=field)
+            .values(field)
+            .annotate(count=Count('id'))
+            .order_by('-count', field)
+        )
+        if field == 'location':
+            rows = rows[:MAX_FACET_VALUES]
+        facets[field] = [
+            {'value': row[field], 'count': row['count']}
+            for row in rows if row[field]
+        ]
+
+    band_counts = {
+        row['salary_band']: row['count']
+        for row in with_salary_band(filter_public_jobs(jobs, params, skip='salary'))
+        .values('salary_band')
+        .annotate(count=Count('id'))
+        .order_by()
+    }
+    facets['salary'] = [
+        {'value': key, 'min': lower, 'max': upper, 'count': band_counts.get(key, 0)}
+        for key, lower, upper in SALARY_BANDS
+    ]
+    facets['salary'].append({
+        'value': SALARY_NOT_DISCLOSED, 'min': None, 'max': None,
+        'count': band_counts.get(SALARY_NOT_DISCLOSED, 0)
+    })
+
+    return facets
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from recruiter.candidate_search import rebuild_search_profiles
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the resume database candidate search table from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of candidates written per batch (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding candidate search table...')
+        with transaction.atomic():
+            created = rebuild_search_profiles(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {created} candidates'))
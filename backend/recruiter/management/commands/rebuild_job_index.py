@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from recruiter.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the job full-text search index from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of jobs indexed per batch (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        self.stdout.write(f'Rebuilding job search index ({backend.__class__.__name__})...')
+        indexed = backend.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} jobs'))
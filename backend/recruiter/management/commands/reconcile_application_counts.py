@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from recruiter.models import JobPost, JobApplication, application_count_field
+
+
+class Command(BaseCommand):
+    help = 'Check the application counters on job posts against the applications and fix any drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted jobs without fixing them'
+        )
+
+    def actual_counts(self):
+        """Counter values recomputed from the application rows, by job id"""
+        counts = {}
+        rows = (
+            JobApplication.objects.values('job_id', 'status')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        for row in rows:
+            job_counts = counts.setdefault(row['job_id'], dict.fromkeys(JobPost.COUNTER_FIELDS, 0))
+            field = application_count_field(row['status'])
+            if field in job_counts:
+                job_counts[field] = row['count']
+            job_counts['applications_count'] += row['count']
+        return counts
+
+    def handle(self, *args, **options):
+        zero = dict.fromkeys(JobPost.COUNTER_FIELDS, 0)
+        drifted = 0
+        with transaction.atomic():
+            actual = self.actual_counts()
+            stored = JobPost.objects.select_for_update().values('id', *JobPost.COUNTER_FIELDS)
+            for job in stored.iterator():
+                expected = actual.get(job['id'], zero)
+                diff = {field: value for field, value in expected.items() if job[field] != value}
+                if not diff:
+                    continue
+                drifted += 1
+                changes = ', '.join(f'{field} {job[field]} -> {value}' for field, value in diff.items())
+                self.stdout.write(f"Job {job['id']}: {changes}")
+                if not options['dry_run']:
+                    JobPost.objects.filter(pk=job['id']).update(**diff)
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('All application counters are correct'))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{drifted} jobs have drifted counters (dry run, nothing fixed)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Fixed application counters on {drifted} jobs'))
@@ -0,0 +1,234 @@
+"""
+Candidate-to-job matching.
+
+Active candidates are loaded into a compact in-memory pool: each candidate
+is a skill bitset (a Python int with one bit per skill any candidate has,
+numbered densely when the pool loads), an experience figure in years and
+a set of location tokens. Scoring a job is then one pass of integer
+AND/popcount operations over the pool with no per-row queries, so
+thousands of candidates score in a few milliseconds.
+
+The pool lives in process memory, tagged with the candidate pool
+generation kept in the cache, so a match request reads one small cache
+key instead of unpickling every candidate. Ranked results are kept next
+to the pool, keyed on the job and its updated_at, and dropped with it; a
+page of matches slices the ranking in place. recruiter/signals.py bumps
+the generation when a candidate profile or its skills change.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from django.core.cache import cache
+
+# Weight of each component in the final score (sums to 1)
+WEIGHTS = {'skills': 0.6, 'experience': 0.25, 'location': 0.15}
+
+# Years outside the job's experience range at which the experience score reaches 0
+EXPERIENCE_TOLERANCE = 3
+
+MATCH_CACHE_TIMEOUT = 60 * 60
+
+# Job rankings kept per process, least recently used dropped first
+MAX_CACHED_RANKINGS = 200
+POOL_GENERATION_KEY = 'job_matches:pool_generation'
+
+EXPERIENCE_RANGE_RE = re.compile(r'(\d+)\s*(?:-\s*(\d+)|(\+))?')
+LOCATION_SPLIT_RE = re.compile(r'[,/|]')
+
+
+def parse_experience_range(text):
+    """Parse a job experience level ('3-5 years', '8+ years') into (min, max); max None means open"""
+    match = EXPERIENCE_RANGE_RE.search(text or '')
+    if not match:
+        return None
+    lower = int(match.group(1))
+    if match.group(2):
+        return lower, int(match.group(2))
+    if match.group(3):
+        return lower, None
+    return lower, lower
+
+
+def location_tokens(*parts):
+    """Lower-cased place names from comma separated location strings"""
+    tokens = set()
+    for part in parts:
+        for token in LOCATION_SPLIT_RE.split(part or ''):
+            token = ' '.join(token.split()).lower()
+            if token and token != 'india':
+                tokens.add(token)
+    return frozenset(tokens)
+
+
+def skill_bits(skill_ids, skill_index):
+    """Bitset with the bit of each indexed Skill id set; other ids are skipped"""
+    bits = 0
+    for skill_id in skill_ids:
+        position = skill_index.get(skill_id)
+        if position is not None:
+            bits |= 1 << position
+    return bits
+
+
+def experience_score(years, job_range):
+    if job_range is None:
+        return 1.0
+    if years is None:
+        return 0.5
+    lower, upper = job_range
+    if years < lower:
+        gap = lower - years
+    elif upper is not None and years > upper:
+        gap = years - upper
+    else:
+        return 1.0
+    return max(0.0, 1 - gap / EXPERIENCE_TOLERANCE)
+
+
+class CandidatePool:
+    """
+    Active candidates as parallel lists of ids, skill bitsets, experience
+    and locations. skill_index maps each Skill id held by a candidate to
+    its bit, so bitsets stay as wide as the skills in use, whatever the
+    largest Skill id.
+    """
+
+    def __init__(self, ids, skills, experience, locations, skill_index):
+        self.ids = ids
+        self.skills = skills
+        self.experience = experience
+        self.locations = locations
+        self.skill_index = skill_index
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def load(cls):
+        """Build the pool from the database in two queries"""
+        from authentication.models import User
+
+        candidates = list(
+            User.objects.filter(role='candidate', is_active=True)
+            .order_by('id')
+            .values_list('id', 'experience_years', 'city', 'state')
+        )
+        skill_ids = {}
+        links = User.skill_tags.through.objects.filter(
+            user__role='candidate', user__is_active=True
+        ).values_list('user_id', 'skill_id')
+        skill_index = {}
+        for user_id, skill_id in links.iterator():
+            skill_ids.setdefault(user_id, []).append(skill_id)
+            skill_index.setdefault(skill_id, len(skill_index))
+
+        return cls(
+            ids=[row[0] for row in candidates],
+            skills=[skill_bits(skill_ids.get(row[0], ()), skill_index) for row in candidates],
+            experience=[row[1] for row in candidates],
+            locations=[location_tokens(row[2], row[3]) for row in candidates],
+            skill_index=skill_index,
+        )
+
+    def rank(self, job_skills, job_experience=None, job_locations=frozenset(), remote=False):
+        """
+        Score every candidate against a job and return [(candidate_id, score, matched_skills)]
+        for candidates with a positive score, best first.
+        """
+        # Job skills no candidate has set no bit but still count as wanted
+        wanted = skill_bits(job_skills, self.skill_index)
+        wanted_count = len(set(job_skills))
+        results = []
+        for candidate_id, bits, years, places in zip(self.ids, self.skills, self.experience, self.locations):
+            matched = (bits & wanted).bit_count()
+            if wanted_count and not matched:
+                continue
+            skills = matched / wanted_count if wanted_count else 0.0
+            location = 1.0 if remote or not job_locations or places & job_locations else 0.0
+            score = (
+                WEIGHTS['skills'] * skills
+                + WEIGHTS['experience'] * experience_score(years, job_experience)
+                + WEIGHTS['location'] * location
+            )
+            results.append((candidate_id, round(score * 100, 1), matched))
+        results.sort(key=lambda row: (-row[1], row[0]))
+        return results
+
+
+def initial_generation():
+    # Start from the clock, not 1: after a cache flush the new generation
+    # must not match a pool a process loaded before the flush
+    return int(time.time() * 1000)
+
+
+def get_pool_generation():
+    generation = cache.get(POOL_GENERATION_KEY)
+    if generation is None:
+        generation = initial_generation()
+        cache.add(POOL_GENERATION_KEY, generation, timeout=None)
+        generation = cache.get(POOL_GENERATION_KEY, generation)
+    return generation
+
+
+def invalidate_candidate_pool():
+    """Drop the loaded candidate pools and every cached job ranking"""
+    try:
+        cache.incr(POOL_GENERATION_KEY)
+    except ValueError:
+        cache.add(POOL_GENERATION_KEY, initial_generation(), timeout=None)
+
+
+# This process's pool: {'generation', 'loaded_at', 'pool'}
+_local_pool = {}
+_local_pool_lock = threading.Lock()
+
+# Rankings computed from that pool: {(job id, updated_at): ranked}
+_local_rankings = OrderedDict()
+
+
+def get_candidate_pool():
+    """
+    Return the candidate pool, loading it on the first call after a change.
+    A pool is also reloaded after MATCH_CACHE_TIMEOUT seconds, in case a
+    generation bump was not visible to this process (unshared cache).
+    """
+    generation = get_pool_generation()
+    with _local_pool_lock:
+        current = _local_pool.get('pool')
+        fresh = time.monotonic() - _local_pool.get('loaded_at', 0) < MATCH_CACHE_TIMEOUT
+        if current is not None and fresh and _local_pool['generation'] == generation:
+            return current
+    pool = CandidatePool.load()
+    with _local_pool_lock:
+        _local_pool.update(generation=generation, loaded_at=time.monotonic(), pool=pool)
+        _local_rankings.clear()
+    return pool
+
+
+def rank_candidates(job):
+    """
+    Ranked matches for a job as [(candidate_id, score, matched_skills)].
+    Kept in process memory until the job or the candidate pool changes.
+    """
+    pool = get_candidate_pool()
+    key = (job.pk, job.updated_at)
+    with _local_pool_lock:
+        ranked = _local_rankings.get(key) if _local_pool.get('pool') is pool else None
+        if ranked is not None:
+            _local_rankings.move_to_end(key)
+            return ranked
+    job_skills = list(job.skill_tags.values_list('id', flat=True))
+    ranked = pool.rank(
+        job_skills,
+        job_experience=parse_experience_range(job.experience_level),
+        job_locations=location_tokens(job.location),
+        remote=job.work_mode == 'Remote',
+    )
+    with _local_pool_lock:
+        # A pool reloaded meanwhile cleared the rankings; do not store stale ones
+        if _local_pool.get('pool') is pool:
+            _local_rankings[key] = ranked
+            while len(_local_rankings) > MAX_CACHED_RANKINGS:
+                _local_rankings.popitem(last=False)
+    return ranked
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter', '0004_jobapplication'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['is_published', '-created_at', '-id'], name='job_posts_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,80 @@
+import json
+
+from django.db import migrations
+
+
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS job_search_index USING fts5("
+    "job_title, job_description, department, required_skills, "
+    "tokenize = 'porter unicode61')",
+]
+
+POSTGRESQL_CREATE = [
+    "CREATE TABLE IF NOT EXISTS job_search_index ("
+    "job_id integer PRIMARY KEY REFERENCES job_posts (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS job_search_index_document_gin ON job_search_index USING GIN (document)",
+]
+
+POSTGRESQL_INSERT = (
+    "INSERT INTO job_search_index (job_id, document) VALUES (%s, "
+    "setweight(to_tsvector('english', %s), 'A') || setweight(to_tsvector('english', %s), 'D') || "
+    "setweight(to_tsvector('english', %s), 'C') || setweight(to_tsvector('english', %s), 'B')) "
+    "ON CONFLICT (job_id) DO NOTHING"
+)
+
+
+def skills_text(raw):
+    try:
+        parsed = json.loads(raw) if raw else []
+    except (json.JSONDecodeError, TypeError):
+        return raw or ''
+    if isinstance(parsed, list):
+        return ' '.join(str(skill) for skill in parsed)
+    return raw or ''
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        statements = SQLITE_CREATE
+        insert = (
+            "INSERT INTO job_search_index (rowid, job_title, job_description, department, required_skills) "
+            "VALUES (%s, %s, %s, %s, %s)"
+        )
+    elif vendor == 'postgresql':
+        statements = POSTGRESQL_CREATE
+        insert = POSTGRESQL_INSERT
+    else:
+        return
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+    JobPost = apps.get_model('recruiter', 'JobPost')
+    rows = [
+        [job['id'], job['job_title'] or '', job['job_description'] or '',
+         job['department'] or '', skills_text(job['required_skills'])]
+        for job in JobPost.objects.values(
+            'id', 'job_title', 'job_description', 'department', 'required_skills'
+        ).iterator()
+    ]
+    if rows:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.executemany(insert, rows)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute("DROP TABLE IF EXISTS job_search_index")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter', '0005_jobpost_feed_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0007_skills'),
+        ('recruiter', '0006_job_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, db_table='job_post_skills', help_text='Normalized skills, kept in sync with required_skills', related_name='job_posts', to='authentication.skill'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+import json
+
+from django.db import migrations
+
+
+def canonical_skill_name(name):
+    return ' '.join(str(name).split()).casefold()
+
+
+def parse_skills(raw):
+    try:
+        skills = json.loads(raw) if raw else []
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return skills if isinstance(skills, list) else []
+
+
+def backfill_job_skills(apps, schema_editor):
+    JobPost = apps.get_model('recruiter', 'JobPost')
+    Skill = apps.get_model('authentication', 'Skill')
+    JobPostSkill = JobPost.skill_tags.through
+    cache = dict(Skill.objects.values_list('name', 'id'))
+
+    links = []
+    jobs = JobPost.objects.exclude(required_skills__isnull=True).exclude(required_skills='')
+    for job_id, raw in jobs.values_list('id', 'required_skills').iterator():
+        seen = set()
+        for name in parse_skills(raw):
+            canonical = canonical_skill_name(name)[:100]
+            if not canonical or canonical in seen:
+                continue
+            seen.add(canonical)
+            if canonical not in cache:
+                skill, _ = Skill.objects.get_or_create(
+                    name=canonical, defaults={'display_name': ' '.join(str(name).split())[:100]}
+                )
+                cache[canonical] = skill.id
+            links.append(JobPostSkill(jobpost_id=job_id, skill_id=cache[canonical]))
+    JobPostSkill.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0008_backfill_user_skills'),
+        ('recruiter', '0007_jobpost_skill_tags'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_job_skills, migrations.RunPython.noop),
+    ]
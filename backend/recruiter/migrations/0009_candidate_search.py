@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0008_backfill_user_skills'),
+        ('recruiter', '0008_backfill_job_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateSearchProfile',
+            fields=[
+                ('candidate', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_profile', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('city', models.CharField(blank=True, default='', max_length=100)),
+                ('state', models.CharField(blank=True, default='', max_length=100)),
+                ('experience_years', models.PositiveSmallIntegerField(default=0)),
+                ('profile_completion', models.PositiveSmallIntegerField(default=0)),
+                ('last_active', models.DateTimeField()),
+                ('joined_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Candidate Search Profile',
+                'verbose_name_plural': 'Candidate Search Profiles',
+                'db_table': 'candidate_search',
+                'indexes': [models.Index(fields=['-last_active', '-candidate'], name='candidate_search_active_idx'), models.Index(fields=['-joined_at', '-candidate'], name='candidate_search_joined_idx'), models.Index(fields=['-experience_years', '-candidate'], name='candidate_search_exp_idx'), models.Index(fields=['-profile_completion', '-candidate'], name='candidate_search_compl_idx'), models.Index(fields=['city'], name='candidate_search_city_idx'), models.Index(fields=['state'], name='candidate_search_state_idx')],
+            },
+        ),
+    ]
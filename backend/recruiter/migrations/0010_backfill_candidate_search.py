@@ -0,0 +1,57 @@
+import re
+
+from django.db import migrations
+from django.utils import timezone
+
+EXPERIENCE_YEARS_RE = re.compile(r'(\d+)\s*(?:year|yr)')
+
+COMPLETION_FIELDS = [
+    'first_name', 'last_name', 'email', 'phone', 'city', 'state',
+    'bio', 'skills', 'experience', 'education'
+]
+
+
+def profile_completion(user):
+    completed = sum(1 for field in COMPLETION_FIELDS if str(getattr(user, field) or '').strip())
+    total = len(COMPLETION_FIELDS)
+    if user.linkedin_url or user.github_url or user.portfolio_url:
+        completed += 1
+        total += 1
+    if user.resume_file_name or user.resume_file_path:
+        completed += 1
+        total += 1
+    return int(completed / total * 100)
+
+
+def normalize_place(value):
+    return ' '.join((value or '').split()).lower()[:100]
+
+
+def backfill_candidate_search(apps, schema_editor):
+    User = apps.get_model('authentication', 'User')
+    CandidateSearchProfile = apps.get_model('recruiter', 'CandidateSearchProfile')
+
+    rows = []
+    for user in User.objects.filter(role='candidate', is_active=True).iterator():
+        match = EXPERIENCE_YEARS_RE.search((user.experience or '').lower())
+        rows.append(CandidateSearchProfile(
+            candidate_id=user.pk,
+            city=normalize_place(user.city),
+            state=normalize_place(user.state),
+            experience_years=min(int(match.group(1)), 99) if match else 0,
+            profile_completion=profile_completion(user),
+            last_active=user.updated_at or timezone.now(),
+            joined_at=user.created_at or timezone.now(),
+        ))
+    CandidateSearchProfile.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter', '0009_candidate_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_candidate_search, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter', '0010_backfill_candidate_search'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='jobpost',
+            name='job_posts_feed_idx',
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['candidate', '-applied_at'], name='job_apps_candidate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', 'status', '-applied_at'], name='job_apps_job_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-applied_at'], name='job_apps_job_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at', '-id'], name='job_posts_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['recruiter', '-created_at'], name='job_posts_recruiter_idx'),
+        ),
+    ]
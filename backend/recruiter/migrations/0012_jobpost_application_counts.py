@@ -0,0 +1,72 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:36
+
+from django.db import migrations, models
+
+
+STATUSES = ['applied', 'under_review', 'shortlisted', 'interview_scheduled', 'rejected', 'accepted', 'withdrawn']
+
+
+def count_applications(apps, schema_editor):
+    JobPost = apps.get_model('recruiter', 'JobPost')
+    JobApplication = apps.get_model('recruiter', 'JobApplication')
+
+    counts = {}
+    rows = JobApplication.objects.values('job_id', 'status').annotate(count=models.Count('id')).order_by()
+    for row in rows:
+        job_counts = counts.setdefault(row['job_id'], {'applications_count': 0})
+        if row['status'] in STATUSES:
+            job_counts[f"{row['status']}_count"] = row['count']
+        job_counts['applications_count'] += row['count']
+    for job_id, fields in counts.items():
+        JobPost.objects.filter(pk=job_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter', '0011_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='accepted_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='applications_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='applied_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='interview_scheduled_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='rejected_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='shortlisted_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='under_review_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='withdrawn_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(count_applications, migrations.RunPython.noop),
+    ]
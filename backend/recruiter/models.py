@@ -1,6 +1,6 @@
 from django.db import models
 from django.core.validators import URLValidator, MinValueValidator, MaxValueValidator
-from authentication.models import User
+from authentication.models import User, Skill
 import json
 
 class RecruiterCompanyProfile(models.Model):
@@ -145,6 +145,72 @@ class RecruiterCompanyProfile(models.Model):
             self.recruiter.mark_profile_completed()
 
 
+def get_company_name(recruiter):
+    """
+    Resolve the display company name for a recruiter.
+    Uses the cached company_profile relation, so querysets built with
+    with_company() resolve names without a query per row.
+    """
+    try:
+        return recruiter.company_profile.company_name
+    except RecruiterCompanyProfile.DoesNotExist:
+        # Fallback to recruiter's full name if no company profile
+        return recruiter.full_name + "'s Company"
+
+
+class JobPostQuerySet(models.QuerySet):
+    """QuerySet helpers for job post listings"""
+    
+    def with_company(self):
+        """Join the recruiter and company profile needed by JobPostSerializer"""
+        return self.select_related('recruiter', 'recruiter__company_profile')
+    
+    def move_application_count(self, job_id, added=None, removed=None):
+        """
+        Atomically adjust a job's application counters with F() expressions.
+        added/removed are the statuses an application entered/left; an
+        application being created has no 'removed', one being deleted no 'added'.
+        """
+        changes = {}
+        if added:
+            field = application_count_field(added)
+            changes[field] = models.F(field) + 1
+        if removed:
+            field = application_count_field(removed)
+            changes[field] = models.F(field) - 1
+        if added and not removed:
+            changes['applications_count'] = models.F('applications_count') + 1
+        elif removed and not added:
+            changes['applications_count'] = models.F('applications_count') - 1
+        if changes:
+            self.filter(pk=job_id).update(**changes)
+    
+    def shift_application_counts(self, job_id, deltas):
+        """
+        Atomically add {status: delta} to a job's per-status counters, for
+        applications changing status in bulk (the total is unchanged).
+        """
+        changes = {
+            application_count_field(status): models.F(application_count_field(status)) + delta
+            for status, delta in deltas.items() if delta
+        }
+        if changes:
+            self.filter(pk=job_id).update(**changes)
+
+
+def application_count_field(status):
+    """JobPost counter field holding the number of applications in a status"""
+    return f'{status}_count'
+
+
+def get_application_counts(job):
+    """A job's stored application counters by status, read from the row"""
+    return {
+        status: getattr(job, application_count_field(status))
+        for status, _ in JobApplication.STATUS_CHOICES
+    }
+
+
 class JobPost(models.Model):
     """
     Job Posting model - Fresh implementation
@@ -196,6 +262,13 @@ class JobPost(models.Model):
     # Requirements
     requirements = models.TextField(blank=True, null=True, help_text="JSON array")
     required_skills = models.TextField(blank=True, null=True, help_text="JSON array")
+    skill_tags = models.ManyToManyField(
+        Skill,
+        blank=True,
+        related_name='job_posts',
+        db_table='job_post_skills',
+        help_text="Normalized skills, kept in sync with required_skills"
+    )
     
     # Application Settings
     application_deadline = models.DateField(blank=True, null=True)
@@ -211,15 +284,42 @@ class JobPost(models.Model):
     is_featured = models.BooleanField(default=False)
     is_published = models.BooleanField(default=False)
     
+    # Application counters, kept current by the JobApplication signals in
+    # recruiter/signals.py (check with `manage.py reconcile_application_counts`)
+    applications_count = models.IntegerField(default=0)
+    applied_count = models.IntegerField(default=0)
+    under_review_count = models.IntegerField(default=0)
+    shortlisted_count = models.IntegerField(default=0)
+    interview_scheduled_count = models.IntegerField(default=0)
+    rejected_count = models.IntegerField(default=0)
+    accepted_count = models.IntegerField(default=0)
+    withdrawn_count = models.IntegerField(default=0)
+    COUNTER_FIELDS = [
+        'applications_count', 'applied_count', 'under_review_count', 'shortlisted_count',
+        'interview_scheduled_count', 'rejected_count', 'accepted_count', 'withdrawn_count',
+    ]
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = JobPostQuerySet.as_manager()
+    
     class Meta:
         db_table = 'job_posts'
         verbose_name = 'Job Post'
         verbose_name_plural = 'Job Posts'
         ordering = ['-created_at']
+        indexes = [
+            # Public job feed: published jobs only, keyset paginated on (created_at, id)
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(is_published=True),
+                name='job_posts_published_idx'
+            ),
+            # Recruiter's own jobs, newest first
+            models.Index(fields=['recruiter', '-created_at'], name='job_posts_recruiter_idx'),
+        ]
     
     def __str__(self):
         return f"{self.job_title} - {self.recruiter.full_name}"
@@ -288,15 +388,49 @@ class JobPost(models.Model):
         else:
             self.required_skills = ''
     
+    # required_skills and is_published as loaded from the database, to detect changes on save
+    _loaded_required_skills = None
+    _loaded_is_published = None
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_required_skills = instance.__dict__.get('required_skills')
+        instance._loaded_is_published = instance.__dict__.get('is_published')
+        return instance
+    
     def save(self, *args, **kwargs):
-        """Override save to enforce company profile check"""
+        """Override save to enforce company profile check and sync skill_tags"""
         # Security check: Only recruiters with company profile can create/update jobs
         if not self.recruiter.can_post_jobs():
             from django.core.exceptions import PermissionDenied
             raise PermissionDenied(
                 f"Recruiter {self.recruiter.email} must complete company profile before posting jobs."
             )
+        # Never write the application counters back from memory: they are
+        # moved in place by F() updates and may have changed since loading
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if ((update_fields is None or 'required_skills' in update_fields)
+                and self.required_skills != self._loaded_required_skills):
+            skills = self.get_required_skills()
+            self.skill_tags.set(Skill.objects.resolve(skills if isinstance(skills, list) else []))
+            self._loaded_required_skills = self.required_skills
+
+
+class JobApplicationQuerySet(models.QuerySet):
+    """QuerySet helpers for job application listings"""
+    
+    def with_company(self):
+        """Join the job, candidate and company profile needed by JobApplicationSerializer"""
+        return self.select_related(
+            'job', 'job__recruiter', 'job__recruiter__company_profile', 'candidate'
+        )
 
 
 class JobApplication(models.Model):
@@ -340,17 +474,81 @@ class JobApplication(models.Model):
     # Recruiter Notes
     recruiter_notes = models.TextField(blank=True, null=True)
     
+    objects = JobApplicationQuerySet.as_manager()
+    
     class Meta:
         db_table = 'job_applications'
         verbose_name = 'Job Application'
         verbose_name_plural = 'Job Applications'
         ordering = ['-applied_at']
         unique_together = ['job', 'candidate']  # Prevent duplicate applications
+        indexes = [
+            # Candidate's applications, newest first
+            models.Index(fields=['candidate', '-applied_at'], name='job_apps_candidate_idx'),
+            # Recruiter pipeline: applications per job, optionally by status, newest first
+            models.Index(fields=['job', 'status', '-applied_at'], name='job_apps_job_status_idx'),
+            models.Index(fields=['job', '-applied_at'], name='job_apps_job_idx'),
+        ]
     
     def __str__(self):
         return f"{self.candidate.full_name} → {self.job.job_title}"
     
+    # Status as loaded from the database, to move the job counters on save
+    _loaded_status = None
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # After the post_save receivers, which compare against the loaded status
+        self._loaded_status = self.status
+    
     @property
     def is_active(self):
         """Check if application is still active"""
         return self.status not in ['rejected', 'withdrawn', 'accepted']
+
+
+class CandidateSearchProfile(models.Model):
+    """
+    Denormalized copy of the candidate fields the resume database filters and
+    sorts on. One row per active candidate, refreshed when the User is saved
+    (see recruiter/candidate_search.py).
+    """
+    candidate = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_profile'
+    )
+    
+    # Lower-cased for exact, indexed location matches
+    city = models.CharField(max_length=100, blank=True, default='')
+    state = models.CharField(max_length=100, blank=True, default='')
+    
+    experience_years = models.PositiveSmallIntegerField(default=0)
+    profile_completion = models.PositiveSmallIntegerField(default=0)
+    
+    last_active = models.DateTimeField()
+    joined_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'candidate_search'
+        verbose_name = 'Candidate Search Profile'
+        verbose_name_plural = 'Candidate Search Profiles'
+        indexes = [
+            # One index per sort order, keyset paginated on (field, candidate_id)
+            models.Index(fields=['-last_active', '-candidate'], name='candidate_search_active_idx'),
+            models.Index(fields=['-joined_at', '-candidate'], name='candidate_search_joined_idx'),
+            models.Index(fields=['-experience_years', '-candidate'], name='candidate_search_exp_idx'),
+            models.Index(fields=['-profile_completion', '-candidate'], name='candidate_search_compl_idx'),
+            models.Index(fields=['city'], name='candidate_search_city_idx'),
+            models.Index(fields=['state'], name='candidate_search_state_idx'),
+        ]
+    
+    def __str__(self):
+        return f"Search profile for {self.candidate_id}"
@@ -0,0 +1,79 @@
+"""
+Notifications sent to candidates and recruiters by recruiter workflows.
+Recording is one INSERT; email delivery happens later in digests (see
+authentication/notifications.py).
+"""
+from authentication.notifications import notify, notify_many
+
+# Application statuses the candidate hears about, and what to tell them
+APPLICATION_STATUS_MESSAGES = {
+    'under_review': 'Your application is being reviewed.',
+    'shortlisted': 'You have been shortlisted.',
+    'interview_scheduled': 'An interview has been scheduled. The recruiter will contact you with details.',
+    'rejected': 'The recruiter has decided not to move forward with your application.',
+    'accepted': 'Congratulations! Your application has been accepted.',
+}
+
+COMPANY_VERIFICATION_MESSAGES = {
+    'verified': 'Company profile has been verified! You can now post jobs.',
+    'rejected': 'Company profile has been rejected. Please check the notes and resubmit.',
+    'pending': 'Company profile is under review.',
+}
+
+RECRUITER_APPROVAL_MESSAGES = {
+    'approve': 'Your recruiter account has been approved. You can now post jobs.',
+    'reject': 'Your recruiter account has been rejected.',
+}
+
+
+def application_status_notification(candidate_id, application_id, job_id, job_title, status):
+    """(user_id, kind, title, message, data) for an application status change, or None"""
+    message = APPLICATION_STATUS_MESSAGES.get(status)
+    if message is None:
+        return None
+    return (
+        candidate_id,
+        'application_status',
+        f'Application update: {job_title}',
+        message,
+        {'application_id': application_id, 'job_id': job_id, 'status': status},
+    )
+
+
+def notify_application_status(application):
+    notification = application_status_notification(
+        application.candidate_id, application.id, application.job_id,
+        application.job.job_title, application.status
+    )
+    if notification:
+        notify(*notification)
+
+
+def notify_application_statuses(changes):
+    """Record notifications for [(candidate_id, application_id, job_id, job_title, status)] at once"""
+    notifications = [application_status_notification(*change) for change in changes]
+    notify_many([notification for notification in notifications if notification])
+
+
+def notify_company_verification(profile):
+    message = COMPANY_VERIFICATION_MESSAGES.get(profile.verification_status, '')
+    if profile.verification_status == 'rejected' and profile.verification_notes:
+        message = f'{message} Notes: {profile.verification_notes}'
+    notify(
+        profile.recruiter_id,
+        'company_verification',
+        f'Company profile {profile.verification_status}',
+        message,
+        {'profile_id': profile.id, 'status': profile.verification_status},
+    )
+
+
+def notify_recruiter_approval(recruiter_ids, action, reason=''):
+    message = RECRUITER_APPROVAL_MESSAGES[action]
+    if action == 'reject' and reason:
+        message = f'{message} Reason: {reason}'
+    status = 'approved' if action == 'approve' else 'rejected'
+    notify_many([
+        (recruiter_id, 'recruiter_approval', f'Recruiter account {status}', message, {'status': status})
+        for recruiter_id in recruiter_ids
+    ])
@@ -0,0 +1,65 @@
+"""
+Keyset (cursor) pagination helpers for function-based list views.
+
+Pages are ordered newest first on (field, id). The cursor is an opaque
+token holding the sort value and id of the last row on the page, so
+fetching page N costs the same indexed range scan as fetching page 1.
+"""
+import base64
+import json
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded"""
+
+
+def encode_cursor(value, pk):
+    """Encode a (sort value, id) pair as an opaque URL-safe token"""
+    raw = json.dumps([value.isoformat() if hasattr(value, 'isoformat') else value, pk])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token, field):
+    """Decode a cursor token into a (sort value, id) pair for the given model field"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return field.to_python(value), int(pk)
+    except (ValueError, TypeError, ValidationError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def get_page_size(request, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Read the 'limit' query parameter, clamped to 1..maximum"""
+    try:
+        limit = int(request.GET.get('limit', default))
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(limit, maximum))
+
+
+def paginate_keyset(queryset, cursor=None, limit=DEFAULT_PAGE_SIZE, field='created_at'):
+    """
+    Return (rows, next_cursor) for one page of a queryset ordered by -field, -id.
+    next_cursor is None on the last page. Raises InvalidCursor for bad tokens.
+    """
+    if cursor:
+        value, pk = decode_cursor(cursor, queryset.model._meta.get_field(field))
+        queryset = queryset.filter(
+            Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk})
+        )
+
+    # Fetch one extra row to learn whether another page exists without a COUNT(*)
+    rows = list(queryset.order_by(f'-{field}', '-pk')[:limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, field), last.pk)
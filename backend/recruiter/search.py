@@ -0,0 +1,294 @@
+"""
+Full-text search over job posts.
+
+Indexes job_title, job_description, department and required_skills in a
+side table and returns job ids ranked by relevance. Searches can be
+restricted to a JobPost queryset (published jobs passing the listing
+filters), which the backends apply inside the search query as an
+`IN (subquery)`, so ranking, paging and counting all see the same rows.
+The backend is picked from the database vendor:
+
+- SQLite: FTS5 virtual table ranked with bm25()
+- PostgreSQL: tsvector table with a GIN index ranked with ts_rank_cd()
+- anything else: icontains scan ordered by newest first (no ranking)
+
+The index is kept current by the JobPost post_save/post_delete signals in
+recruiter/signals.py and can be rebuilt with `manage.py rebuild_job_index`.
+"""
+import json
+import re
+from django.db import connection, transaction
+
+# Default page of ranked matches returned by search()
+MAX_SEARCH_RESULTS = 500
+
+# Columns indexed, in the order the backends store them
+INDEXED_FIELDS = ['job_title', 'job_description', 'department', 'required_skills']
+
+SEARCH_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def job_document(job):
+    """Return the text indexed for a job, keyed by indexed field"""
+    skills = job.required_skills or ''
+    try:
+        parsed = json.loads(skills) if skills else []
+        if isinstance(parsed, list):
+            skills = ' '.join(str(skill) for skill in parsed)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    return {
+        'job_title': job.job_title or '',
+        'job_description': job.job_description or '',
+        'department': job.department or '',
+        'required_skills': skills,
+    }
+
+
+def search_terms(query):
+    """Split a user query into plain word tokens"""
+    return SEARCH_TOKEN_RE.findall((query or '').lower())
+
+
+class BaseSearchBackend:
+    """Interface shared by the search backends"""
+
+    def index_job(self, job):
+        """Add or refresh one job in the index"""
+
+    def remove_job(self, job_id):
+        """Remove one job from the index"""
+
+    def clear(self):
+        """Remove every job from the index"""
+
+    def search(self, query, jobs=None, limit=MAX_SEARCH_RESULTS, offset=0):
+        """Return one page of matching job ids within `jobs`, most relevant first"""
+        raise NotImplementedError
+
+    def count(self, query, jobs=None):
+        """Return the number of matching jobs within `jobs`"""
+        raise NotImplementedError
+
+    def restrict(self, column, jobs):
+        """SQL condition and params limiting an index column to the ids of a JobPost queryset"""
+        if jobs is None:
+            return '', []
+        sql, params = jobs.order_by().values('id').query.sql_with_params()
+        return f' AND {column} IN ({sql})', list(params)
+
+    def rebuild(self, batch_size=500):
+        """Re-index every job from scratch. Returns the number of jobs indexed."""
+        from .models import JobPost
+
+        jobs = JobPost.objects.only('id', *INDEXED_FIELDS).order_by('pk')
+        indexed = 0
+        with transaction.atomic():
+            self.clear()
+            batch = []
+            for job in jobs.iterator(chunk_size=batch_size):
+                batch.append(job)
+                if len(batch) >= batch_size:
+                    self.index_batch(batch)
+                    indexed += len(batch)
+                    batch = []
+            if batch:
+                self.index_batch(batch)
+                indexed += len(batch)
+        return indexed
+
+    def index_batch(self, jobs):
+        for job in jobs:
+            self.index_job(job)
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """SQLite FTS5 backend for single-node setups"""
+
+    table = 'job_search_index'
+    # bm25 column weights: title, description, department, skills
+    weights = (10.0, 1.0, 2.0, 5.0)
+
+    def index_batch(self, jobs):
+        rows = []
+        for job in jobs:
+            document = job_document(job)
+            rows.append([job.pk] + [document[field] for field in INDEXED_FIELDS])
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'DELETE FROM {self.table} WHERE rowid = %s', [[row[0]] for row in rows]
+            )
+            cursor.executemany(
+                f'INSERT INTO {self.table} (rowid, {", ".join(INDEXED_FIELDS)}) '
+                f'VALUES (%s, %s, %s, %s, %s)',
+                rows
+            )
+
+    def index_job(self, job):
+        self.index_batch([job])
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [job_id])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+
+    def match_condition(self, query, jobs):
+        """WHERE clause and params for a query, or None when it has no terms"""
+        terms = search_terms(query)
+        if not terms:
+            return None
+        # Quote every term so user input never reaches the FTS5 query syntax;
+        # the trailing * makes each term a prefix match ("pyth" finds "python").
+        match = ' '.join(f'"{term}"*' for term in terms)
+        restriction, params = self.restrict('rowid', jobs)
+        return f'{self.table} MATCH %s{restriction}', [match] + params
+
+    def search(self, query, jobs=None, limit=MAX_SEARCH_RESULTS, offset=0):
+        condition = self.match_condition(query, jobs)
+        if condition is None:
+            return []
+        where, params = condition
+        rank = f'bm25({self.table}, {", ".join(str(w) for w in self.weights)})'
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {self.table} WHERE {where} '
+                f'ORDER BY {rank}, rowid DESC LIMIT %s OFFSET %s',
+                params + [limit, offset]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def count(self, query, jobs=None):
+        condition = self.match_condition(query, jobs)
+        if condition is None:
+            return 0
+        where, params = condition
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {self.table} WHERE {where}', params)
+            return cursor.fetchone()[0]
+
+
+class PostgreSQLSearchBackend(BaseSearchBackend):
+    """PostgreSQL tsvector backend with a GIN index for production"""
+
+    table = 'job_search_index'
+    config = 'english'
+
+    def document_sql(self):
+        """SQL building the weighted tsvector from the four indexed fields"""
+        # Weights: title A, skills B, department C, description D
+        parts = [
+            f"setweight(to_tsvector('{self.config}', %s), '{weight}')"
+            for weight in ('A', 'D', 'C', 'B')
+        ]
+        return ' || '.join(parts)
+
+    def index_batch(self, jobs):
+        rows = []
+        for job in jobs:
+            document = job_document(job)
+            rows.append([job.pk] + [document[field] for field in INDEXED_FIELDS])
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {self.table} (job_id, document) '
+                f'VALUES (%s, {self.document_sql()}) '
+                f'ON CONFLICT (job_id) DO UPDATE SET document = EXCLUDED.document',
+                rows
+            )
+
+    def index_job(self, job):
+        self.index_batch([job])
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE job_id = %s', [job_id])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {self.table}')
+
+    def match_condition(self, query, jobs):
+        """FROM/WHERE clause and params for a query, or None when it has no terms"""
+        terms = search_terms(query)
+        if not terms:
+            return None
+        # Prefix-match every term, same as the SQLite backend
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        restriction, params = self.restrict('job_id', jobs)
+        return (
+            f"{self.table}, to_tsquery('{self.config}', %s) query WHERE document @@ query{restriction}",
+            [tsquery] + params
+        )
+
+    def search(self, query, jobs=None, limit=MAX_SEARCH_RESULTS, offset=0):
+        condition = self.match_condition(query, jobs)
+        if condition is None:
+            return []
+        source, params = condition
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT job_id FROM {source} '
+                f'ORDER BY ts_rank_cd(document, query) DESC, job_id DESC LIMIT %s OFFSET %s',
+                params + [limit, offset]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def count(self, query, jobs=None):
+        condition = self.match_condition(query, jobs)
+        if condition is None:
+            return 0
+        source, params = condition
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {source}', params)
+            return cursor.fetchone()[0]
+
+
+class BasicSearchBackend(BaseSearchBackend):
+    """Fallback for databases without a full-text backend: unranked icontains scan"""
+
+    def rebuild(self, batch_size=500):
+        return 0
+
+    def matches(self, query, jobs):
+        """Queryset of matching jobs, or None when the query has no terms"""
+        from django.db.models import Q
+        from .models import JobPost
+
+        terms = search_terms(query)
+        if not terms:
+            return None
+        condition = Q()
+        for term in terms:
+            term_condition = Q()
+            for field in INDEXED_FIELDS:
+                term_condition |= Q(**{f'{field}__icontains': term})
+            condition &= term_condition
+        matches = JobPost.objects.filter(condition)
+        if jobs is not None:
+            matches = matches.filter(id__in=jobs.order_by().values('id'))
+        return matches
+
+    def search(self, query, jobs=None, limit=MAX_SEARCH_RESULTS, offset=0):
+        matches = self.matches(query, jobs)
+        if matches is None:
+            return []
+        return list(
+            matches.order_by('-created_at', '-id').values_list('id', flat=True)[offset:offset + limit]
+        )
+
+    def count(self, query, jobs=None):
+        matches = self.matches(query, jobs)
+        return 0 if matches is None else matches.count()
+
+
+SEARCH_BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgreSQLSearchBackend,
+}
+
+
+def get_search_backend():
+    """Return the search backend for the default database"""
+    return SEARCH_BACKENDS.get(connection.vendor, BasicSearchBackend)()
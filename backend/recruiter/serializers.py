@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from django.core.validators import URLValidator
-from .models import RecruiterCompanyProfile, JobPost, JobApplication
+from .models import (
+    RecruiterCompanyProfile, JobPost, JobApplication, get_application_counts, get_company_name
+)
 from authentication.models import User
 from datetime import datetime
 import json
@@ -310,13 +312,7 @@ class JobPostSerializer(serializers.ModelSerializer):
     
     def get_company_name(self, obj):
         """Get company name from recruiter's company profile if exists"""
-        try:
-            from recruiter.models import RecruiterCompanyProfile
-            profile = RecruiterCompanyProfile.objects.get(recruiter=obj.recruiter)
-            return profile.company_name
-        except:
-            # Fallback to recruiter's full name if no company profile
-            return obj.recruiter.full_name + "'s Company"
+        return get_company_name(obj.recruiter)
     
     def to_internal_value(self, data):
         """Handle frontend data format"""
@@ -428,6 +424,23 @@ class JobPostSerializer(serializers.ModelSerializer):
         return instance
 
 
+class RecruiterJobPostSerializer(JobPostSerializer):
+    """
+    Job post with its applicant counts, for the owning recruiter and admins.
+    The public serializer leaves them out: the counters move through F()
+    updates that do not invalidate the cached public job list.
+    """
+    application_counts = serializers.SerializerMethodField()
+    
+    class Meta(JobPostSerializer.Meta):
+        fields = JobPostSerializer.Meta.fields + ['applications_count', 'application_counts']
+        read_only_fields = JobPostSerializer.Meta.read_only_fields + ['applications_count', 'application_counts']
+    
+    def get_application_counts(self, obj):
+        """Stored counters by application status"""
+        return get_application_counts(obj)
+
+
 
 class JobApplicationSerializer(serializers.ModelSerializer):
     """
@@ -465,12 +478,7 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     
     def get_company_name(self, obj):
         """Get company name from job's recruiter"""
-        try:
-            from recruiter.models import RecruiterCompanyProfile
-            profile = RecruiterCompanyProfile.objects.get(recruiter=obj.job.recruiter)
-            return profile.company_name
-        except:
-            return obj.job.recruiter.full_name + "'s Company"
+        return get_company_name(obj.job.recruiter)
 
 
 class JobApplicationCreateSerializer(serializers.ModelSerializer):
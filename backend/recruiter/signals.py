@@ -0,0 +1,136 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from authentication.models import User
+from authentication.user_cache import invalidate_user
+from .models import JobPost, JobApplication, RecruiterCompanyProfile
+from .candidate_search import SOURCE_FIELDS, refresh_search_profile
+from .matching import invalidate_candidate_pool
+from .search import get_search_backend
+from .stats import invalidate_recruiter_stats
+from .notifications import notify_application_status
+
+# User fields the candidate matching pool is built from
+MATCHING_FIELDS = {'role', 'is_active', 'experience', 'experience_years', 'city', 'state'}
+
+
+@receiver(post_save, sender=JobPost)
+def index_job_post(sender, instance, raw=False, **kwargs):
+    """Keep the job search index current when a job is saved"""
+    if raw:
+        return
+    get_search_backend().index_job(instance)
+
+
+@receiver(post_delete, sender=JobPost)
+def unindex_job_post(sender, instance, **kwargs):
+    """Drop a deleted job from the search index"""
+    get_search_backend().remove_job(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def refresh_pool_on_user_save(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Rebuild the candidate matching pool when a candidate's profile changes"""
+    if raw or instance.role != 'candidate':
+        return
+    if update_fields is not None and not MATCHING_FIELDS.intersection(update_fields):
+        return
+    invalidate_candidate_pool()
+
+
+@receiver(post_save, sender=User)
+def refresh_candidate_search(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Keep the resume database search row of a candidate current"""
+    if raw:
+        return
+    if update_fields is not None and not SOURCE_FIELDS.intersection(update_fields):
+        return
+    refresh_search_profile(instance)
+
+
+@receiver(post_delete, sender=User)
+def refresh_pool_on_user_delete(sender, instance, **kwargs):
+    if instance.role == 'candidate':
+        invalidate_candidate_pool()
+
+
+@receiver(m2m_changed, sender=User.skill_tags.through)
+def refresh_pool_on_skills_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_candidate_pool()
+
+
+@receiver(post_save, sender=JobApplication)
+def count_application_save(sender, instance, created, raw=False, **kwargs):
+    """Move the job's application counters when an application is created or changes status"""
+    if raw:
+        return
+    if created:
+        JobPost.objects.move_application_count(instance.job_id, added=instance.status)
+    elif instance._loaded_status and instance._loaded_status != instance.status:
+        JobPost.objects.move_application_count(
+            instance.job_id, added=instance.status, removed=instance._loaded_status
+        )
+
+
+@receiver(post_delete, sender=JobApplication)
+def count_application_delete(sender, instance, **kwargs):
+    JobPost.objects.move_application_count(
+        instance.job_id, removed=instance._loaded_status or instance.status
+    )
+
+
+@receiver(post_save, sender=JobPost)
+@receiver(post_delete, sender=JobPost)
+def refresh_stats_on_job_change(sender, instance, raw=False, **kwargs):
+    """Drop the recruiter's cached dashboard stats when one of their jobs changes"""
+    if raw:
+        return
+    # After commit: dropped earlier, a dashboard request could cache the old figures again
+    recruiter_id = instance.recruiter_id
+    transaction.on_commit(lambda: invalidate_recruiter_stats(recruiter_id))
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def refresh_stats_on_application_change(sender, instance, raw=False, **kwargs):
+    """Drop the hiring recruiter's cached dashboard stats when an application changes"""
+    if raw:
+        return
+    job_id = instance.job_id
+    recruiter_id = instance.job.recruiter_id if JobApplication.job.is_cached(instance) else None
+
+    def drop_stats():
+        # Looked up only here, after commit, when the job was not loaded
+        hiring_id = recruiter_id or (
+            JobPost.objects.filter(pk=job_id).values_list('recruiter_id', flat=True).first()
+        )
+        if hiring_id:
+            invalidate_recruiter_stats(hiring_id)
+
+    transaction.on_commit(drop_stats)
+
+
+@receiver(post_save, sender=JobApplication)
+def notify_candidate_on_status_change(sender, instance, created, raw=False, **kwargs):
+    """Tell the candidate when a recruiter moves their application"""
+    if raw or created:
+        return
+    if instance._loaded_status and instance._loaded_status != instance.status:
+        notify_application_status(instance)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_user(sender, instance, **kwargs):
+    """Authenticated requests must see role, approval and activation changes"""
+    # After commit: dropped earlier, another request could cache the old row again
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user(user_id))
+
+
+@receiver(post_save, sender=RecruiterCompanyProfile)
+@receiver(post_delete, sender=RecruiterCompanyProfile)
+def drop_cached_recruiter(sender, instance, **kwargs):
+    recruiter_id = instance.recruiter_id
+    transaction.on_commit(lambda: invalidate_user(recruiter_id))
@@ -0,0 +1,72 @@
+"""
+Recruiter dashboard statistics.
+
+All figures come from one aggregate query over the recruiter's job posts:
+job totals by publication state, application totals from the per-status
+counters kept on JobPost, and applications received in the last week from
+a grouped count over the recruiter's applications. The query cost does not
+depend on how many jobs or applications the recruiter has accumulated
+beyond the rows it aggregates, and the result is cached per recruiter.
+
+recruiter/signals.py drops the cached entry when one of the recruiter's
+jobs or applications is saved or deleted; the timeout bounds how stale the
+rolling 'last 7 days' figure can get.
+"""
+from datetime import timedelta
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import JobApplication, JobPost, application_count_field
+
+STATS_CACHE_TIMEOUT = 5 * 60
+RECENT_DAYS = 7
+
+
+def stats_key(recruiter_id):
+    return f'recruiter_stats:{recruiter_id}'
+
+
+def invalidate_recruiter_stats(recruiter_id):
+    cache.delete(stats_key(recruiter_id))
+
+
+def compute_recruiter_stats(recruiter_id):
+    """Dashboard figures of one recruiter, in a single query"""
+    since = timezone.now() - timedelta(days=RECENT_DAYS)
+    statuses = [value for value, _ in JobApplication.STATUS_CHOICES]
+    totals = (
+        JobPost.objects.filter(recruiter_id=recruiter_id)
+        .annotate(recent=Count('applications', filter=Q(applications__applied_at__gte=since)))
+        .aggregate(
+            total_jobs=Count('id'),
+            active_jobs=Count('id', filter=Q(is_published=True)),
+            draft_jobs=Count('id', filter=Q(is_published=False)),
+            applications_received=Coalesce(Sum('applications_count'), 0),
+            new_applications=Coalesce(Sum('recent'), 0),
+            **{
+                status: Coalesce(Sum(application_count_field(status)), 0)
+                for status in statuses
+            }
+        )
+    )
+    return {
+        'total_jobs': totals['total_jobs'],
+        'active_jobs': totals['active_jobs'],
+        'draft_jobs': totals['draft_jobs'],
+        'applications_received': totals['applications_received'],
+        'applications_by_status': {status: totals[status] for status in statuses},
+        'interviews_scheduled': totals['interview_scheduled'],
+        'new_applications_last_7_days': totals['new_applications'],
+    }
+
+
+def get_recruiter_stats(recruiter_id):
+    """Cached dashboard figures of one recruiter"""
+    key = stats_key(recruiter_id)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_recruiter_stats(recruiter_id)
+        cache.set(key, stats, timeout=STATS_CACHE_TIMEOUT)
+    return stats
@@ -0,0 +1,948 @@
+import csv
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from authentication.models import Notification, User, Skill
+from authentication.user_cache import get_snapshot, user_from_snapshot
+from job_portal.query_plans import QueryPlanTestMixin, explain, full_table_scans
+from .models import RecruiterCompanyProfile, JobPost, JobApplication, CandidateSearchProfile
+from .matching import CandidatePool, get_candidate_pool
+from .search import get_search_backend
+
+
+def create_recruiter(email, company_name='Acme Corp'):
+    """Create an approved recruiter, optionally with a company profile"""
+    recruiter = User.objects.create_user(
+        email=email,
+        password='testpass123',
+        first_name='Rita',
+        last_name='Recruiter',
+        role='recruiter',
+        approval_status='approved',
+    )
+    if company_name:
+        RecruiterCompanyProfile.objects.create(
+            recruiter=recruiter,
+            company_name=company_name,
+            industry='Technology',
+            company_size='11-50',
+            head_office_location='Chennai',
+            company_description='We build things',
+            office_address='1 Main Street',
+            work_mode='hybrid',
+            verification_status='verified',
+        )
+    return recruiter
+
+
+def create_candidate(email, **extra_fields):
+    """Create a candidate user"""
+    return User.objects.create_user(
+        email=email,
+        password='testpass123',
+        first_name='Cara',
+        last_name='Candidate',
+        role='candidate',
+        **extra_fields
+    )
+
+
+def create_job(recruiter, **extra_fields):
+    """Create a published job post for a recruiter"""
+    fields = {
+        'job_title': 'Backend Engineer',
+        'job_type': 'Full-time',
+        'work_mode': 'Remote',
+        'experience_level': 'Mid',
+        'location': 'Chennai',
+        'job_description': 'Build APIs',
+        'is_published': True,
+    }
+    fields.update(extra_fields)
+    return JobPost.objects.create(recruiter=recruiter, **fields)
+
+
+class CompanyNameResolutionTests(TestCase):
+    """Listing endpoints resolve company names without a query per row"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.other_recruiter = create_recruiter('fallback@example.com', company_name='Gone Inc')
+        self.candidate = create_candidate('candidate@example.com')
+
+    def add_rows(self, count):
+        """Create jobs for both recruiters with an application on each"""
+        RecruiterCompanyProfile.objects.get_or_create(
+            recruiter=self.other_recruiter,
+            defaults={'company_name': 'Gone Inc', 'industry': 'Retail', 'company_size': '1-10',
+                      'head_office_location': 'Madurai', 'company_description': 'Shop',
+                      'office_address': '2 Side Street', 'work_mode': 'office'}
+        )
+        for i in range(count):
+            for recruiter in (self.recruiter, self.other_recruiter):
+                job = create_job(recruiter, job_title=f'Job {i}')
+                JobApplication.objects.create(job=job, candidate=self.candidate)
+        # Exercise the fallback name for recruiters without a company profile
+        RecruiterCompanyProfile.objects.filter(recruiter=self.other_recruiter).delete()
+
+    def count_queries(self, url, user=None):
+        """Return the number of queries a GET request runs"""
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def assert_constant_queries(self, url, user=None):
+        self.add_rows(1)
+        baseline = self.count_queries(url, user)
+        self.add_rows(5)
+        self.assertEqual(self.count_queries(url, user), baseline)
+
+    def test_public_jobs_constant_queries(self):
+        self.assert_constant_queries('/api/jobs/public')
+
+    def test_my_jobs_constant_queries(self):
+        self.assert_constant_queries('/api/recruiter/jobs/my-jobs', self.recruiter)
+
+    def test_recruiter_applications_constant_queries(self):
+        self.assert_constant_queries('/api/recruiter/applications/recruiter', self.recruiter)
+
+    def test_my_applications_constant_queries(self):
+        self.assert_constant_queries('/api/recruiter/applications/my-applications', self.candidate)
+
+    def test_company_name_fallback(self):
+        self.add_rows(1)
+        response = self.client.get('/api/jobs/public')
+        names = {job['company_name'] for job in response.data['jobs']}
+        self.assertEqual(names, {'Acme Corp', "Rita Recruiter's Company"})
+
+
+class PublicJobsPaginationTests(TestCase):
+    """Cursor pagination on the public job feed"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        recruiter = create_recruiter('recruiter@example.com')
+        self.jobs = [create_job(recruiter, job_title=f'Job {i}') for i in range(5)]
+
+    def test_pages_cover_feed_in_order(self):
+        seen = []
+        url = '/api/jobs/public?limit=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data['jobs']), 2)
+            seen.extend(job['id'] for job in response.data['jobs'])
+            next_cursor = response.data['next']
+            self.assertEqual(response.data['has_more'], next_cursor is not None)
+            url = f'/api/jobs/public?limit=2&cursor={next_cursor}' if next_cursor else None
+        self.assertEqual(seen, [job.id for job in reversed(self.jobs)])
+
+    def test_count_included_by_default(self):
+        response = self.client.get('/api/jobs/public?limit=2')
+        self.assertEqual(response.data['count'], 5)
+
+    def test_has_more_mode_skips_count(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/jobs/public?limit=2&has_more=true')
+        self.assertNotIn('count', response.data)
+        self.assertTrue(response.data['has_more'])
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/jobs/public?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 400)
+
+
+class JobSearchTests(TestCase):
+    """Full-text job search and incremental index maintenance"""
+
+    def setUp(self):
+        self.client = APIClient()
+        recruiter = create_recruiter('recruiter@example.com')
+        self.title_match = create_job(recruiter, job_title='Python Developer')
+        self.skill_match = create_job(
+            recruiter, job_title='Backend Engineer', required_skills='["Python", "Django"]'
+        )
+        self.description_match = create_job(
+            recruiter, job_title='Data Analyst', job_description='Some python scripting'
+        )
+        self.unrelated = create_job(recruiter, job_title='Sales Executive', job_description='Sell')
+
+    def search_ids(self, query):
+        response = self.client.get('/api/jobs/search', {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [job['id'] for job in response.data['jobs']]
+
+    def test_results_ranked_by_relevance(self):
+        self.assertEqual(
+            self.search_ids('python'),
+            [self.title_match.id, self.skill_match.id, self.description_match.id]
+        )
+
+    def test_prefix_and_multi_term_match(self):
+        self.assertEqual(self.search_ids('pyth djan'), [self.skill_match.id])
+
+    def test_index_follows_save_and_delete(self):
+        self.unrelated.job_title = 'Python Sales Engineer'
+        self.unrelated.save()
+        self.assertIn(self.unrelated.id, self.search_ids('python'))
+
+        self.title_match.delete()
+        self.assertNotIn(self.title_match.id, self.search_ids('python'))
+
+    def test_unpublished_jobs_hidden(self):
+        self.title_match.is_published = False
+        self.title_match.save()
+        self.assertNotIn(self.title_match.id, self.search_ids('python'))
+
+    def test_filters_and_paging_apply_before_ranking(self):
+        # Unpublished and filtered-out matches are excluded inside the search query
+        recruiter = self.title_match.recruiter
+        for i in range(5):
+            create_job(recruiter, job_title=f'Python Intern {i}', is_published=False)
+        onsite_job = create_job(recruiter, job_title='Python Lead', work_mode='Onsite')
+        response = self.client.get('/api/jobs/search', {'q': 'python', 'work_mode': 'Onsite'})
+        self.assertEqual([job['id'] for job in response.data['jobs']], [onsite_job.id])
+        self.assertEqual(response.data['count'], 1)
+
+        response = self.client.get('/api/jobs/search', {'q': 'python', 'limit': 2, 'offset': 2})
+        self.assertEqual(response.data['count'], 4)
+        self.assertEqual(len(response.data['jobs']), 2)
+        self.assertFalse(response.data['has_more'])
+
+    def test_query_required(self):
+        response = self.client.get('/api/jobs/search')
+        self.assertEqual(response.status_code, 400)
+
+    def test_rebuild_command(self):
+        get_search_backend().clear()
+        self.assertEqual(self.search_ids('python'), [])
+        call_command('rebuild_job_index', stdout=StringIO())
+        self.assertEqual(len(self.search_ids('python')), 3)
+
+
+class PublicJobFacetTests(TestCase):
+    """Facet counts on the public job listing"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        recruiter = create_recruiter('recruiter@example.com')
+        create_job(recruiter, job_type='Full-time', work_mode='Remote', max_salary=450000)
+        create_job(recruiter, job_type='Full-time', work_mode='Hybrid', min_salary=1200000)
+        create_job(recruiter, job_type='Internship', work_mode='Remote', location='Bengaluru')
+        create_job(recruiter, job_type='Contract', work_mode='Remote', is_published=False)
+
+    def get_facets(self, **params):
+        params['facets'] = 'true'
+        response = self.client.get('/api/jobs/public', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data['facets']
+
+    def counts(self, facet):
+        return {row['value']: row['count'] for row in facet}
+
+    def test_counts_per_dimension(self):
+        facets = self.get_facets()
+        self.assertEqual(self.counts(facets['job_type']), {'Full-time': 2, 'Internship': 1})
+        self.assertEqual(self.counts(facets['location']), {'Chennai': 2, 'Bengaluru': 1})
+        salary = self.counts(facets['salary'])
+        self.assertEqual(salary['3-6L'], 1)
+        self.assertEqual(salary['10-20L'], 1)
+        self.assertEqual(salary['not_disclosed'], 1)
+
+    def test_counts_respect_other_filters(self):
+        facets = self.get_facets(work_mode='Remote')
+        # job_type counts are narrowed by work_mode...
+        self.assertEqual(self.counts(facets['job_type']), {'Full-time': 1, 'Internship': 1})
+        # ...but work_mode counts ignore the work_mode filter itself
+        self.assertEqual(self.counts(facets['work_mode']), {'Remote': 2, 'Hybrid': 1})
+
+    def test_salary_band_filter(self):
+        response = self.client.get('/api/jobs/public', {'salary_band': '3-6L', 'facets': 'true'})
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(self.counts(response.data['facets']['job_type']), {'Full-time': 1})
+
+    def test_one_query_per_dimension(self):
+        # page + count + one grouped query for each of the five facets
+        with self.assertNumQueries(2 + 5):
+            self.client.get('/api/jobs/public', {'facets': 'true', 'salary_band': '3-6L'})
+
+
+class SkillTagTests(TestCase):
+    """Skills text is mirrored into the normalized Skill links"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter = create_recruiter('recruiter@example.com')
+
+    def test_user_skills_synced(self):
+        candidate = create_candidate('cara@example.com', skills='Python, django ,PYTHON')
+        self.assertEqual(sorted(candidate.skill_tags.values_list('name', flat=True)), ['django', 'python'])
+
+        candidate.skills = 'React'
+        candidate.save()
+        self.assertEqual(list(candidate.skill_tags.values_list('name', flat=True)), ['react'])
+        self.assertEqual(Skill.objects.get(name='python').display_name, 'Python')
+
+    def test_job_skills_synced(self):
+        job = create_job(self.recruiter, required_skills='["Machine  Learning", "SQL"]')
+        self.assertEqual(sorted(job.skill_tags.values_list('name', flat=True)), ['machine learning', 'sql'])
+
+        # Saving without touching required_skills leaves the links alone
+        job = JobPost.objects.get(pk=job.pk)
+        with CaptureQueriesContext(connection) as queries:
+            job.save(update_fields=['job_title'])
+        touched = [q['sql'] for q in queries.captured_queries if 'job_post_skills' in q['sql']]
+        self.assertEqual(touched, [])
+
+    def test_public_jobs_skill_filter(self):
+        create_job(self.recruiter, job_title='Data', required_skills='["SQL"]')
+        create_job(self.recruiter, job_title='Frontend', required_skills='["React"]')
+        response = self.client.get('/api/jobs/public', {'skill': 'sql'})
+        self.assertEqual([job['job_title'] for job in response.data['jobs']], ['Data'])
+
+    def test_resume_database_skill_filter(self):
+        create_candidate('py@example.com', skills='Python')
+        create_candidate('js@example.com', skills='JavaScript')
+        self.client.force_authenticate(self.recruiter)
+        response = self.client.get('/api/recruiter/resume-database/', {'skill': ' PYTHON '})
+        self.assertEqual([c['email'] for c in response.data['candidates']], ['py@example.com'])
+
+
+class JobMatchingTests(TestCase):
+    """Ranked candidate matches for a recruiter's job"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.job = create_job(
+            self.recruiter, work_mode='On-site', location='Chennai',
+            experience_level='3-5 years', required_skills='["Python", "Django"]'
+        )
+        self.client.force_authenticate(self.recruiter)
+
+    def get_matches(self, **params):
+        response = self.client.get(f'/api/recruiter/jobs/{self.job.id}/matches', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_ranking(self):
+        best = create_candidate('best@example.com', skills='python, Django', experience='4 years', city='Chennai')
+        partial = create_candidate('partial@example.com', skills='Python', experience='4 years', city='Chennai')
+        remote = create_candidate('remote@example.com', skills='Python,Django', experience='10 years', city='Pune')
+        create_candidate('none@example.com', skills='Java', experience='4 years', city='Chennai')
+
+        data = self.get_matches()
+        self.assertEqual([m['id'] for m in data['matches']], [best.id, partial.id, remote.id])
+        self.assertEqual(data['matches'][0]['score'], 100.0)
+        self.assertEqual(data['matches'][1]['matchedSkills'], 1)
+        self.assertEqual(data['count'], 3)
+
+        data = self.get_matches(limit=1, offset=1)
+        self.assertEqual([m['id'] for m in data['matches']], [partial.id])
+        self.assertTrue(data['has_more'])
+
+    def test_cached_until_candidates_change(self):
+        create_candidate('first@example.com', skills='Python')
+        self.assertEqual(self.get_matches()['count'], 1)
+
+        # Ranking kept in memory: job lookup + page of candidates only
+        with self.assertNumQueries(2):
+            self.get_matches()
+
+        create_candidate('second@example.com', skills='Django')
+        self.assertEqual(self.get_matches()['count'], 2)
+
+    def test_pool_kept_in_process_memory(self):
+        create_candidate('first@example.com', skills='Python')
+        with mock.patch.object(CandidatePool, 'load', wraps=CandidatePool.load) as load:
+            pool = get_candidate_pool()
+            self.assertIs(get_candidate_pool(), pool)
+            self.assertEqual(load.call_count, 1)
+            create_candidate('second@example.com', skills='Django')
+            self.assertEqual(len(get_candidate_pool()), 2)
+            self.assertEqual(load.call_count, 2)
+
+    def test_ranking_kept_in_process_memory(self):
+        create_candidate('first@example.com', skills='Python')
+        with mock.patch.object(CandidatePool, 'rank', autospec=True, side_effect=CandidatePool.rank) as rank:
+            self.get_matches()
+            self.get_matches(limit=1)
+            self.assertEqual(rank.call_count, 1)
+            # Editing the job ranks it again
+            self.job.job_title = 'Senior Backend Engineer'
+            self.job.save()
+            self.get_matches()
+            self.assertEqual(rank.call_count, 2)
+
+    def test_skill_bits_follow_skills_in_use(self):
+        create_candidate('first@example.com', skills='Python, Django')
+        create_candidate('second@example.com', skills='Django, Go')
+        pool = get_candidate_pool()
+        self.assertEqual(sorted(pool.skill_index.values()), [0, 1, 2])
+        self.assertLess(max(pool.skills), 1 << 3)
+
+    def test_only_owner(self):
+        other = create_recruiter('other@example.com', company_name='Other Co')
+        self.client.force_authenticate(other)
+        response = self.client.get(f'/api/recruiter/jobs/{self.job.id}/matches')
+        self.assertEqual(response.status_code, 404)
+
+
+class ResumeDatabaseTests(TestCase):
+    """Server-side filtered, cursor paginated resume database"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(create_recruiter('recruiter@example.com'))
+        self.senior = create_candidate(
+            'senior@example.com', skills='Python, SQL', experience='7 years backend', city='Chennai',
+            state='Tamil Nadu', bio='Backend developer', phone='99999', education='B.E'
+        )
+        self.junior = create_candidate('junior@example.com', skills='Python', experience='1 year', city='Pune')
+        self.fresher = create_candidate('fresher@example.com', skills='React', city='chennai ')
+
+    def get_emails(self, **params):
+        response = self.client.get('/api/recruiter/resume-database/', params)
+        self.assertEqual(response.status_code, 200)
+        return [candidate['email'] for candidate in response.data['candidates']]
+
+    def test_search_rows_follow_user_saves(self):
+        profile = CandidateSearchProfile.objects.get(candidate=self.senior)
+        self.assertEqual((profile.city, profile.experience_years), ('chennai', 7))
+
+        self.junior.experience = '4 years'
+        self.junior.save()
+        self.assertEqual(CandidateSearchProfile.objects.get(candidate=self.junior).experience_years, 4)
+
+        self.fresher.is_active = False
+        self.fresher.save()
+        self.assertFalse(CandidateSearchProfile.objects.filter(candidate=self.fresher).exists())
+
+    def test_filters(self):
+        self.assertEqual(self.get_emails(skills='python,sql'), ['senior@example.com'])
+        self.assertEqual(
+            sorted(self.get_emails(location='Chennai')), ['fresher@example.com', 'senior@example.com']
+        )
+        self.assertEqual(self.get_emails(min_experience=2), ['senior@example.com'])
+        self.assertEqual(self.get_emails(min_completion=70), ['senior@example.com'])
+
+    def test_sort_and_cursor(self):
+        response = self.client.get('/api/recruiter/resume-database/', {'sort': 'experience', 'limit': 2})
+        self.assertEqual(
+            [c['email'] for c in response.data['candidates']], ['senior@example.com', 'junior@example.com']
+        )
+        self.assertEqual(response.data['total'], 3)
+        self.assertTrue(response.data['has_more'])
+
+        emails = self.get_emails(sort='experience', limit=2, cursor=response.data['next'])
+        self.assertEqual(emails, ['fresher@example.com'])
+
+    def test_invalid_sort(self):
+        response = self.client.get('/api/recruiter/resume-database/', {'sort': 'salary'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_rebuild_command(self):
+        CandidateSearchProfile.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_candidate_search', stdout=out)
+        self.assertIn('Indexed 3 candidates', out.getvalue())
+
+
+class ApplicationCounterTests(TestCase):
+    """Denormalized application counters on JobPost"""
+
+    def setUp(self):
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.job = create_job(self.recruiter)
+        self.cara = create_candidate('cara@example.com')
+        self.carl = create_candidate('carl@example.com')
+
+    def counts(self):
+        job = JobPost.objects.get(pk=self.job.pk)
+        return job.applications_count, job.applied_count, job.shortlisted_count
+
+    def test_create_status_change_and_delete(self):
+        application = JobApplication.objects.create(job=self.job, candidate=self.cara)
+        JobApplication.objects.create(job=self.job, candidate=self.carl)
+        self.assertEqual(self.counts(), (2, 2, 0))
+
+        application = JobApplication.objects.get(pk=application.pk)
+        application.status = 'shortlisted'
+        application.save()
+        application.save()
+        self.assertEqual(self.counts(), (2, 1, 1))
+
+        application.delete()
+        self.assertEqual(self.counts(), (1, 1, 0))
+
+    def test_job_save_keeps_counters(self):
+        stale = JobPost.objects.get(pk=self.job.pk)
+        JobApplication.objects.create(job=self.job, candidate=self.cara)
+        stale.job_title = 'Senior Backend Engineer'
+        stale.save()
+        self.assertEqual(self.counts(), (1, 1, 0))
+
+    def test_my_jobs_shows_counts_without_extra_queries(self):
+        JobApplication.objects.create(job=self.job, candidate=self.cara)
+        client = APIClient()
+        client.force_authenticate(self.recruiter)
+        with self.assertNumQueries(2):
+            response = client.get('/api/recruiter/jobs/my-jobs')
+        job = response.data['jobs'][0]
+        self.assertEqual(job['applications_count'], 1)
+        self.assertEqual(job['application_counts']['applied'], 1)
+
+    def test_public_feed_leaves_counts_out(self):
+        # Counter updates do not invalidate the cached public list
+        cache.clear()
+        JobApplication.objects.create(job=self.job, candidate=self.cara)
+        job = APIClient().get('/api/jobs/public').data['jobs'][0]
+        self.assertNotIn('applications_count', job)
+
+    def test_reconcile_command(self):
+        JobApplication.objects.create(job=self.job, candidate=self.cara)
+        JobPost.objects.filter(pk=self.job.pk).update(applications_count=5, shortlisted_count=2)
+
+        out = StringIO()
+        call_command('reconcile_application_counts', '--dry-run', stdout=out)
+        self.assertIn('applications_count 5 -> 1', out.getvalue())
+        self.assertEqual(self.counts(), (5, 1, 2))
+
+        call_command('reconcile_application_counts', stdout=StringIO())
+        self.assertEqual(self.counts(), (1, 1, 0))
+
+
+class RecruiterStatsTests(TestCase):
+    """Recruiter dashboard statistics in /api/auth/profile/stats"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.job = create_job(self.recruiter)
+        create_job(self.recruiter, is_published=False)
+        other_job = create_job(create_recruiter('other@example.com', company_name='Globex'))
+        self.cara = create_candidate('cara@example.com')
+        self.carl = create_candidate('carl@example.com')
+        JobApplication.objects.create(job=self.job, candidate=self.cara, status='interview_scheduled')
+        old = JobApplication.objects.create(job=self.job, candidate=self.carl)
+        JobApplication.objects.filter(pk=old.pk).update(applied_at=timezone.now() - timedelta(days=30))
+        JobApplication.objects.create(job=other_job, candidate=self.cara)
+        self.client = APIClient()
+        self.client.force_authenticate(self.recruiter)
+
+    def get_stats(self):
+        response = self.client.get('/api/auth/profile/stats')
+        self.assertEqual(response.status_code, 200)
+        return response.data['stats']
+
+    def test_stats_are_scoped_to_the_recruiter(self):
+        stats = self.get_stats()
+        self.assertEqual(stats['active_jobs'], 1)
+        self.assertEqual(stats['draft_jobs'], 1)
+        self.assertEqual(stats['applications_received'], 2)
+        self.assertEqual(stats['interviews_scheduled'], 1)
+        self.assertEqual(stats['applications_by_status']['applied'], 1)
+        self.assertEqual(stats['new_applications_last_7_days'], 1)
+
+    def test_stats_are_cached_until_an_application_changes(self):
+        self.get_stats()
+        with self.assertNumQueries(0):
+            self.get_stats()
+
+        cleo = create_candidate('cleo@example.com')
+        with self.captureOnCommitCallbacks() as callbacks:
+            JobApplication.objects.create(job_id=self.job.id, candidate=cleo)
+            # Kept until the change commits, so nothing can cache the old figures again
+            with self.assertNumQueries(0):
+                self.get_stats()
+        for callback in callbacks:
+            callback()
+        with self.assertNumQueries(1):
+            stats = self.get_stats()
+        self.assertEqual(stats['applications_received'], 3)
+
+    def test_job_change_invalidates_stats(self):
+        self.get_stats()
+        with self.captureOnCommitCallbacks(execute=True):
+            create_job(self.recruiter)
+        self.assertEqual(self.get_stats()['active_jobs'], 2)
+
+
+class ApplicationExportTests(TestCase):
+    """Streaming CSV/NDJSON export of a recruiter's applications"""
+
+    def setUp(self):
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.job = create_job(self.recruiter)
+        other_job = create_job(create_recruiter('other@example.com', company_name='Globex'))
+        self.cara = create_candidate('cara@example.com')
+        self.carl = create_candidate('carl@example.com')
+        JobApplication.objects.create(job=self.job, candidate=self.cara, status='shortlisted')
+        JobApplication.objects.create(job=self.job, candidate=self.carl)
+        JobApplication.objects.create(job=other_job, candidate=self.cara)
+        self.client = APIClient()
+        self.client.force_authenticate(self.recruiter)
+
+    def test_csv_export(self):
+        response = self.client.get('/api/recruiter/applications/recruiter/export.csv')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment;', response['Content-Disposition'])
+        rows = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode('utf-8-sig'))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual({row['candidate_email'] for row in rows}, {'cara@example.com', 'carl@example.com'})
+        self.assertEqual(rows[0]['candidate_name'], 'Cara Candidate')
+
+    def test_ndjson_export_with_filters(self):
+        response = self.client.get(
+            '/api/recruiter/applications/recruiter/export.ndjson',
+            {'status': 'shortlisted', 'job_id': self.job.id}
+        )
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['candidate_email'], 'cara@example.com')
+        self.assertEqual(rows[0]['status'], 'shortlisted')
+
+    def test_unknown_format(self):
+        response = self.client.get('/api/recruiter/applications/recruiter/export.xlsx')
+        self.assertEqual(response.status_code, 400)
+
+
+class BulkApplicationStatusTests(TestCase):
+    """Bulk status changes on a recruiter's applications"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.job = create_job(self.recruiter)
+        self.applications = [
+            JobApplication.objects.create(job=self.job, candidate=create_candidate(f'cand{i}@example.com'))
+            for i in range(3)
+        ]
+        other_job = create_job(create_recruiter('other@example.com', company_name='Globex'))
+        self.foreign = JobApplication.objects.create(job=other_job, candidate=create_candidate('cara@example.com'))
+        self.client = APIClient()
+        self.client.force_authenticate(self.recruiter)
+
+    def bulk_update(self, ids, new_status='shortlisted', **extra):
+        return self.client.post(
+            '/api/recruiter/applications/bulk-update-status',
+            {'application_ids': ids, 'status': new_status, **extra},
+            format='json'
+        )
+
+    def test_updates_owned_and_reports_rejected_ids(self):
+        ids = [application.id for application in self.applications[:2]]
+        response = self.bulk_update(ids + [self.foreign.id, 999999], recruiter_notes='Strong profile')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], ids)
+        self.assertEqual(
+            response.data['errors'],
+            [{'id': self.foreign.id, 'message': 'Access denied'}, {'id': 999999, 'message': 'Application not found'}]
+        )
+        self.assertEqual(
+            set(JobApplication.objects.filter(status='shortlisted').values_list('id', flat=True)), set(ids)
+        )
+        self.assertEqual(JobApplication.objects.get(id=ids[0]).recruiter_notes, 'Strong profile')
+        self.assertEqual(JobApplication.objects.get(id=self.foreign.id).status, 'applied')
+
+    def test_keeps_counters_and_stats_current(self):
+        self.client.get('/api/auth/profile/stats')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bulk_update([application.id for application in self.applications])
+        job = JobPost.objects.get(pk=self.job.pk)
+        self.assertEqual((job.applications_count, job.applied_count, job.shortlisted_count), (3, 0, 3))
+        stats = self.client.get('/api/auth/profile/stats').data['stats']
+        self.assertEqual(stats['applications_by_status']['shortlisted'], 3)
+
+    def test_query_count_does_not_grow_with_ids(self):
+        with CaptureQueriesContext(connection) as one:
+            self.bulk_update([self.applications[0].id])
+        with CaptureQueriesContext(connection) as many:
+            self.bulk_update([application.id for application in self.applications], new_status='rejected')
+        self.assertEqual(len(one), len(many))
+
+    def test_rejects_invalid_input(self):
+        self.assertEqual(self.bulk_update([self.applications[0].id], new_status='hired').status_code, 400)
+        self.assertEqual(self.bulk_update('1,2').status_code, 400)
+        self.assertEqual(self.bulk_update('12').status_code, 400)
+        self.assertEqual(self.bulk_update({'id': self.applications[0].id}).status_code, 400)
+        self.assertEqual(self.bulk_update([]).status_code, 400)
+
+
+class BulkRecruiterApprovalTests(TestCase):
+    """Bulk approval and rejection of recruiters by admins"""
+
+    def setUp(self):
+        self.recruiters = [create_recruiter(f'recruiter{i}@example.com') for i in range(3)]
+        self.incomplete = create_recruiter('new@example.com', company_name=None)
+        User.objects.filter(role='recruiter').update(approval_status='pending')
+        RecruiterCompanyProfile.objects.update(verification_status='pending')
+        self.admin = User.objects.create_user(email='admin@example.com', password='testpass123', role='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def bulk_approval(self, ids, action='approve', **extra):
+        return self.client.post(
+            '/api/recruiter/admin/recruiters/bulk-approval',
+            {'recruiter_ids': ids, 'action': action, **extra},
+            format='json'
+        )
+
+    def test_bulk_approve(self):
+        ids = [recruiter.id for recruiter in self.recruiters]
+        # Savepoint, one SELECT, two UPDATEs, one notification INSERT, release
+        with self.assertNumQueries(6):
+            response = self.bulk_approval(ids + [self.incomplete.id, self.admin.id])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], ids)
+        self.assertEqual(response.data['errors'], [
+            {'id': self.incomplete.id, 'message': 'Profile not completed'},
+            {'id': self.admin.id, 'message': 'Recruiter not found'},
+        ])
+        self.assertEqual(User.objects.filter(approval_status='approved').count(), 3)
+        self.assertFalse(User.objects.filter(id__in=ids, approved_at__isnull=True).exists())
+        self.assertEqual(RecruiterCompanyProfile.objects.filter(verification_status='verified').count(), 3)
+        self.assertTrue(User.objects.get(id=ids[0]).can_post_jobs())
+
+    def test_bulk_reject_with_reason(self):
+        ids = [self.recruiters[0].id, self.incomplete.id]
+        response = self.bulk_approval(ids, action='reject', reason='Unverifiable company')
+        self.assertEqual(response.data['updated'], ids)
+        self.assertEqual(User.objects.filter(approval_status='rejected').count(), 2)
+        profile = RecruiterCompanyProfile.objects.get(recruiter=self.recruiters[0])
+        self.assertEqual(profile.verification_status, 'rejected')
+        self.assertEqual(profile.verification_notes, 'Unverifiable company')
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(self.recruiters[0])
+        response = self.bulk_approval([self.recruiters[1].id])
+        self.assertEqual(response.status_code, 403)
+
+    def test_rejects_invalid_input(self):
+        self.assertEqual(self.bulk_approval([self.recruiters[0].id], action='ban').status_code, 400)
+        self.assertEqual(self.bulk_approval(None).status_code, 400)
+        self.assertEqual(self.bulk_approval(str(self.recruiters[0].id)).status_code, 400)
+
+
+class JobPipelineTests(TestCase):
+    """Per-status pipeline columns for one job"""
+
+    def setUp(self):
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.job = create_job(self.recruiter)
+        self.applied = [
+            JobApplication.objects.create(job=self.job, candidate=create_candidate(f'cand{i}@example.com'))
+            for i in range(3)
+        ]
+        JobApplication.objects.create(
+            job=self.job, candidate=create_candidate('cara@example.com'), status='shortlisted'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.recruiter)
+
+    def test_columns_with_counts_and_cursors(self):
+        response = self.client.get(f'/api/recruiter/jobs/{self.job.id}/pipeline', {'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total'], 4)
+        columns = {column['status']: column for column in response.data['columns']}
+        self.assertEqual(list(columns), [value for value, _ in JobApplication.STATUS_CHOICES])
+        self.assertEqual(columns['applied']['count'], 3)
+        self.assertEqual(len(columns['applied']['applications']), 2)
+        self.assertTrue(columns['applied']['has_more'])
+        self.assertEqual(columns['shortlisted']['count'], 1)
+        self.assertFalse(columns['shortlisted']['has_more'])
+        self.assertEqual(columns['rejected']['applications'], [])
+
+        response = self.client.get(
+            f'/api/recruiter/jobs/{self.job.id}/pipeline',
+            {'status': 'applied', 'limit': 2, 'cursor': columns['applied']['next']}
+        )
+        [column] = response.data['columns']
+        self.assertEqual([application['id'] for application in column['applications']], [self.applied[0].id])
+        self.assertFalse(column['has_more'])
+
+    def test_column_load_is_one_query(self):
+        with self.assertNumQueries(2):
+            self.client.get(f'/api/recruiter/jobs/{self.job.id}/pipeline', {'status': 'shortlisted'})
+
+    def test_other_recruiters_job(self):
+        self.client.force_authenticate(create_recruiter('other@example.com', company_name='Globex'))
+        response = self.client.get(f'/api/recruiter/jobs/{self.job.id}/pipeline')
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_status_and_cursor(self):
+        url = f'/api/recruiter/jobs/{self.job.id}/pipeline'
+        self.assertEqual(self.client.get(url, {'status': 'hired'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'status': 'applied', 'cursor': 'bogus'}).status_code, 400)
+
+
+class ApplicationNotificationTests(TestCase):
+    """Candidates are notified when a recruiter moves their application"""
+
+    def setUp(self):
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.job = create_job(self.recruiter)
+        self.candidate = create_candidate('cara@example.com')
+        self.application = JobApplication.objects.create(job=self.job, candidate=self.candidate)
+        self.client = APIClient()
+        self.client.force_authenticate(self.recruiter)
+
+    def test_status_change_notifies_candidate(self):
+        self.assertFalse(Notification.objects.exists())
+        response = self.client.put(
+            f'/api/recruiter/applications/{self.application.id}/update-status',
+            {'status': 'shortlisted'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        notification = Notification.objects.get()
+        self.assertEqual((notification.user_id, notification.kind), (self.candidate.id, 'application_status'))
+        self.assertEqual(notification.title, 'Application update: Backend Engineer')
+        self.assertEqual(notification.data['status'], 'shortlisted')
+
+        # Saving without a status change notifies nobody
+        application = JobApplication.objects.get()
+        application.recruiter_notes = 'Call back'
+        application.save()
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_bulk_update_notifies_changed_applications(self):
+        other = JobApplication.objects.create(
+            job=self.job, candidate=create_candidate('carl@example.com'), status='shortlisted'
+        )
+        response = self.client.post(
+            '/api/recruiter/applications/bulk-update-status',
+            {'application_ids': [self.application.id, other.id], 'status': 'shortlisted'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(Notification.objects.values_list('user_id', 'data__application_id')),
+            [(self.candidate.id, self.application.id)]
+        )
+
+
+@override_settings(AUTH_USER_CACHE_ENABLED=True)
+class CachedRecruiterTests(TestCase):
+    """Recruiter checks read the cached user snapshot"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_recruiter('recruiter@example.com')
+
+    def test_can_post_jobs_without_queries(self):
+        user = user_from_snapshot(get_snapshot(self.recruiter.id))
+        with self.assertNumQueries(0):
+            self.assertTrue(user.can_post_jobs())
+
+    def test_approval_change_drops_snapshot(self):
+        pending = create_recruiter('pending@example.com')
+        User.objects.filter(pk=pending.pk).update(approval_status='pending')
+        pending.profile_completed = True
+        pending.save(update_fields=['profile_completed'])
+        self.assertEqual(get_snapshot(pending.id)['approval_status'], 'pending')
+
+        admin = User.objects.create_user(
+            email='admin@example.com', password='testpass123', first_name='Ada', last_name='Admin', role='admin'
+        )
+        client = APIClient()
+        client.force_authenticate(admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            client.post(
+                '/api/recruiter/admin/recruiters/bulk-approval',
+                {'recruiter_ids': [pending.id], 'action': 'approve'},
+                format='json'
+            )
+        self.assertEqual(get_snapshot(pending.id)['approval_status'], 'approved')
+
+    def test_create_job_with_token(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.recruiter).access_token}')
+        response = client.post('/api/recruiter/jobs/create', {
+            'job_title': 'Backend Engineer',
+            'job_type': 'Full-time',
+            'work_mode': 'Remote',
+            'experience_level': 'Mid',
+            'location': 'Chennai',
+            'job_description': 'Build APIs',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(JobPost.objects.get().recruiter_id, self.recruiter.id)
+
+
+class QueryPlanTests(QueryPlanTestMixin, TestCase):
+    """The main queries of the job and application endpoints use an index"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter = create_recruiter('recruiter@example.com')
+        self.candidate = create_candidate('cara@example.com')
+        self.job = create_job(self.recruiter)
+        create_job(self.recruiter, is_published=False)
+        JobApplication.objects.create(job=self.job, candidate=self.candidate)
+
+    def test_full_scan_detection(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite plan formats')
+        plan = '\n'.join([
+            'SCAN job_posts',
+            'SCAN TABLE users AS U0',
+            'SCAN TABLE job_applications',
+            'SCAN skills USING COVERING INDEX skills_name_idx',
+            'SEARCH TABLE recruiter_company_profile USING INDEX sqlite_autoindex (recruiter_id=?)',
+        ])
+        self.assertEqual(full_table_scans(plan), ['job_posts', 'users', 'job_applications'])
+
+    def test_public_jobs(self):
+        self.assertIndexedQueries('job_posts', self.client.get, '/api/jobs/public')
+        self.assertIndexedQueries('job_posts', self.client.get, '/api/jobs/public', {'job_type': 'Full-time'})
+
+    def test_my_jobs(self):
+        self.client.force_authenticate(self.recruiter)
+        self.assertIndexedQueries('job_posts', self.client.get, '/api/recruiter/jobs/my-jobs')
+
+    def test_candidate_applications(self):
+        self.client.force_authenticate(self.candidate)
+        self.assertIndexedQueries(
+            'job_applications', self.client.get, '/api/recruiter/applications/my-applications'
+        )
+
+    def test_recruiter_applications(self):
+        self.client.force_authenticate(self.recruiter)
+        self.assertIndexedQueries(
+            'job_applications', self.client.get, '/api/recruiter/applications/recruiter',
+            {'status': 'applied', 'job_id': self.job.id}
+        )
+
+    def test_job_pipeline(self):
+        self.client.force_authenticate(self.recruiter)
+        self.assertIndexedQueries(
+            'job_applications', self.client.get, f'/api/recruiter/jobs/{self.job.id}/pipeline'
+        )
+
+    def test_admin_recruiters(self):
+        admin = User.objects.create_user(
+            email='admin@example.com', password='testpass123', first_name='Ada', last_name='Admin', role='admin'
+        )
+        self.client.force_authenticate(admin)
+        self.assertIndexedQueries('users', self.client.get, '/api/recruiter/admin/recruiters', {'status': 'pending'})
+
+    def test_full_scan_detected(self):
+        plan = explain("SELECT id FROM job_posts WHERE job_title = 'Backend Engineer'")
+        self.assertEqual(full_table_scans(plan), ['job_posts'])
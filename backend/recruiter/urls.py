@@ -21,6 +21,7 @@ urlpatterns = [
     
     # Admin endpoints for recruiter approval workflow
     path('admin/recruiters', views.admin_recruiters_list_view, name='admin_recruiters_list'),
+    path('admin/recruiters/bulk-approval', views.admin_bulk_recruiter_approval_view, name='admin_bulk_recruiter_approval'),
     path('admin/recruiters/<int:recruiter_id>', views.admin_recruiter_detail_view, name='admin_recruiter_detail'),
     path('admin/recruiters/<int:recruiter_id>/approve', views.admin_approve_recruiter_view, name='admin_approve_recruiter'),
     path('admin/recruiters/<int:recruiter_id>/reject', views.admin_reject_recruiter_view, name='admin_reject_recruiter'),
@@ -31,9 +32,13 @@ urlpatterns = [
     path('jobs/my-jobs', views.my_jobs_view, name='my_jobs'),
     path('jobs/<int:job_id>', views.job_detail_view, name='job_detail'),
     path('jobs/<int:job_id>/update', views.update_job_view, name='update_job'),
+    path('jobs/<int:job_id>/matches', views.job_matches_view, name='job_matches'),
+    path('jobs/<int:job_id>/pipeline', views.job_pipeline_view, name='job_pipeline'),
     
     # Job Application endpoints (LinkedIn-style flow)
     path('applications/my-applications', views.my_applications_view, name='my_applications'),
     path('applications/recruiter', views.recruiter_applications_view, name='recruiter_applications'),
+    path('applications/recruiter/export.<str:export_format>', views.export_applications_view, name='export_applications'),
     path('applications/<int:application_id>/update-status', views.update_application_status_view, name='update_application_status'),
+    path('applications/bulk-update-status', views.bulk_update_application_status_view, name='bulk_update_application_status'),
 ]
\ No newline at end of file
@@ -5,8 +5,8 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db import models
-from authentication.models import User
-from .models import RecruiterCompanyProfile, JobPost
+from authentication.models import User, canonical_skill_name
+from .models import RecruiterCompanyProfile, JobPost, CandidateSearchProfile, application_count_field
 from .serializers import (
     RecruiterCompanyProfileSerializer,
     RecruiterCompanyProfileUpdateSerializer,
@@ -14,9 +14,26 @@ from .serializers import (
     CompanyVerificationSerializer,
     RecruiterApprovalSerializer,
     RecruiterListSerializer,
-    JobPostSerializer
+    JobPostSerializer,
+    RecruiterJobPostSerializer
 )
 from .permissions import IsRecruiter, IsAdmin, IsRecruiterOwner
+from .pagination import InvalidCursor, get_page_size, paginate_keyset
+from .search import get_search_backend
+from .filters import filter_public_jobs, public_job_facets
+from .matching import rank_candidates
+from .exports import APPLICATION_COLUMNS, application_export_rows
+from .applications import MAX_BULK_APPLICATIONS, bulk_update_status
+from .approvals import ACTIONS, MAX_BULK_RECRUITERS, bulk_set_approval
+from .notifications import COMPANY_VERIFICATION_MESSAGES, notify_company_verification, notify_recruiter_approval
+from .candidate_search import (
+    DEFAULT_SORT, SORT_FIELDS, filter_candidates
+)
+from admin_management.response_cache import cache_public_response
+from job_portal.exports import CONTENT_TYPES, streaming_export
+
+# Applications per column on the first load of a job pipeline
+PIPELINE_PAGE_SIZE = 10
 
 @api_view(['GET', 'POST', 'PUT'])
 @permission_classes([IsRecruiter])
@@ -288,19 +305,14 @@ def admin_verify_company_view(request, profile_id):
         profile = serializer.save()
         response_serializer = AdminCompanyProfileSerializer(profile)
         
-        # Send notification to recruiter (can be implemented later)
         verification_status = profile.verification_status
-        status_message = {
-            'verified': 'Company profile has been verified! You can now post jobs.',
-            'rejected': 'Company profile has been rejected. Please check the notes and resubmit.',
-            'pending': 'Company profile is under review.'
-        }
+        notify_company_verification(profile)
         
         return Response({
             'success': True,
             'message': f'Company profile {verification_status} successfully',
             'profile': response_serializer.data,
-            'notification_message': status_message.get(verification_status, '')
+            'notification_message': COMPANY_VERIFICATION_MESSAGES.get(verification_status, '')
         }, status=status.HTTP_200_OK)
     
     return Response({
@@ -420,7 +432,7 @@ def admin_recruiters_list_view(request):
     Admin view to get all recruiters with their approval status
     """
     # Get all recruiters
-    recruiters = User.objects.filter(role='recruiter').order_by('-created_at')
+    recruiters = User.objects.filter(role='recruiter').select_related('company_profile').order_by('-created_at')
     
     # Filter by approval status if provided
     status_filter = request.GET.get('status')
@@ -495,6 +507,7 @@ def admin_approve_recruiter_view(request, recruiter_id):
             company_profile.save()
     except RecruiterCompanyProfile.DoesNotExist:
         pass
+    notify_recruiter_approval([recruiter.id], 'approve')
     
     serializer = RecruiterApprovalSerializer(recruiter)
     
@@ -526,6 +539,7 @@ def admin_reject_recruiter_view(request, recruiter_id):
         company_profile.save()
     except RecruiterCompanyProfile.DoesNotExist:
         pass
+    notify_recruiter_approval([recruiter.id], 'reject', rejection_reason)
     
     serializer = RecruiterApprovalSerializer(recruiter)
     
@@ -536,6 +550,53 @@ def admin_reject_recruiter_view(request, recruiter_id):
         'rejection_reason': rejection_reason
     }, status=status.HTTP_200_OK)
 
+@api_view(['POST'])
+@permission_classes([IsAdmin])
+def admin_bulk_recruiter_approval_view(request):
+    """
+    Admin endpoint to approve or reject many recruiters at once
+    Body: {"recruiter_ids": [1, 2, 3], "action": "approve" | "reject", "reason": "..."}
+    Recruiters that are not found, or cannot be approved because their
+    profile is incomplete, are reported per id in 'errors'.
+    """
+    action = request.data.get('action')
+    reason = request.data.get('reason', '')
+    recruiter_ids = request.data.get('recruiter_ids')
+    
+    if action not in ACTIONS:
+        return Response({
+            'success': False,
+            'message': 'action must be approve or reject'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # A string is iterable too: "12" must not become ids 1 and 2
+        if not isinstance(recruiter_ids, list):
+            raise TypeError
+        recruiter_ids = list(dict.fromkeys(int(recruiter_id) for recruiter_id in recruiter_ids))
+    except (TypeError, ValueError):
+        return Response({
+            'success': False,
+            'message': 'recruiter_ids must be a list of recruiter ids'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    if not recruiter_ids or len(recruiter_ids) > MAX_BULK_RECRUITERS:
+        return Response({
+            'success': False,
+            'message': f'Provide between 1 and {MAX_BULK_RECRUITERS} recruiter ids'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    updated, errors = bulk_set_approval(recruiter_ids, action, reason)
+    verb = 'approved' if action == 'approve' else 'rejected'
+    
+    return Response({
+        'success': True,
+        'message': f'{len(updated)} recruiters {verb}',
+        'action': action,
+        'updated': updated,
+        'errors': errors,
+        'reason': reason
+    }, status=status.HTTP_200_OK)
+
 # ============================================================================
 # JOB POSTING ACCESS GUARD
 # ============================================================================
@@ -591,8 +652,8 @@ def my_jobs_view(request):
     Get all jobs posted by the logged-in recruiter
     """
     recruiter = request.user
-    jobs = JobPost.objects.filter(recruiter=recruiter).order_by('-created_at')
-    serializer = JobPostSerializer(jobs, many=True)
+    jobs = JobPost.objects.filter(recruiter=recruiter).with_company().order_by('-created_at')
+    serializer = RecruiterJobPostSerializer(jobs, many=True)
     
     return Response({
         'success': True,
@@ -609,7 +670,7 @@ def job_detail_view(request, job_id):
     """
     try:
         job = JobPost.objects.get(id=job_id, recruiter=request.user)
-        serializer = JobPostSerializer(job)
+        serializer = RecruiterJobPostSerializer(job)
         return Response({
             'success': True,
             'job': serializer.data
@@ -621,6 +682,118 @@ def job_detail_view(request, job_id):
         }, status=status.HTTP_404_NOT_FOUND)
 
 
+@api_view(['GET'])
+@permission_classes([IsRecruiter])
+def job_matches_view(request, job_id):
+    """
+    Rank active candidates against one of the recruiter's jobs
+    Scores weigh skill overlap, experience fit and location (0-100).
+      ?limit=N&offset=M       page through the ranked candidates
+    """
+    try:
+        job = JobPost.objects.get(id=job_id, recruiter=request.user)
+    except JobPost.DoesNotExist:
+        return Response({
+            'success': False,
+            'message': 'Job not found or access denied'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    try:
+        offset = max(0, int(request.GET.get('offset', 0)))
+    except ValueError:
+        offset = 0
+    limit = get_page_size(request)
+    
+    ranked = rank_candidates(job)
+    page = ranked[offset:offset + limit]
+    candidates = User.objects.in_bulk([candidate_id for candidate_id, _, _ in page])
+    
+    matches = []
+    for candidate_id, score, matched_skills in page:
+        candidate = candidates.get(candidate_id)
+        if candidate is None:
+            continue
+        matches.append({
+            'id': candidate.id,
+            'name': candidate.full_name,
+            'email': candidate.email,
+            'location': f"{candidate.city or ''}, {candidate.state or ''}".strip(', '),
+            'skills': candidate.get_skills_list() if candidate.skills else [],
+            'experience': candidate.experience or '',
+            'score': score,
+            'matchedSkills': matched_skills,
+        })
+    
+    return Response({
+        'success': True,
+        'job_id': job.id,
+        'count': len(ranked),
+        'matches': matches,
+        'has_more': offset + limit < len(ranked)
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsRecruiter])
+def job_pipeline_view(request, job_id):
+    """
+    Applications to one of the recruiter's jobs as pipeline columns, one per status.
+    Each column has its count (from the job's application counters), a first
+    page of applications newest first, and its own cursor.
+      ?limit=N                       applications per column
+      ?status=X&cursor=C             next page of a single column
+    """
+    try:
+        job = JobPost.objects.get(id=job_id, recruiter=request.user)
+    except JobPost.DoesNotExist:
+        return Response({
+            'success': False,
+            'message': 'Job not found or access denied'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    statuses = JobApplication.STATUS_CHOICES
+    status_filter = request.GET.get('status')
+    if status_filter:
+        statuses = [choice for choice in statuses if choice[0] == status_filter]
+        if not statuses:
+            return Response({
+                'success': False,
+                'message': 'Invalid status'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    limit = get_page_size(request, default=PIPELINE_PAGE_SIZE)
+    
+    columns = []
+    for value, label in statuses:
+        # Each column is one range scan of job_apps_job_status_idx
+        try:
+            page, next_cursor = paginate_keyset(
+                JobApplication.objects.filter(job=job, status=value).with_company(),
+                cursor=request.GET.get('cursor') if status_filter else None,
+                limit=limit,
+                field='applied_at'
+            )
+        except InvalidCursor:
+            return Response({
+                'success': False,
+                'message': 'Invalid cursor'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        columns.append({
+            'status': value,
+            'label': label,
+            'count': getattr(job, application_count_field(value)),
+            'applications': JobApplicationSerializer(page, many=True).data,
+            'next': next_cursor,
+            'has_more': next_cursor is not None
+        })
+    
+    return Response({
+        'success': True,
+        'job_id': job.id,
+        'total': job.applications_count,
+        'columns': columns
+    }, status=status.HTTP_200_OK)
+
+
 @api_view(['PUT'])
 @permission_classes([IsRecruiter])
 def update_job_view(request, job_id):
@@ -652,37 +825,95 @@ def update_job_view(request, job_id):
         }, status=status.HTTP_404_NOT_FOUND)
 
 
+@cache_public_response('jobs')
 @api_view(['GET'])
 @permission_classes([])  # No authentication required for public jobs
 def public_jobs_view(request):
     """
-    Get all published jobs for candidates (public endpoint)
+    Get published jobs for candidates (public endpoint)
+    Cursor paginated, newest first:
+      ?limit=N        page size (default 20, max 100)
+      ?cursor=TOKEN   the 'next' token from the previous page
+      ?has_more=true  skip the total count; clients rely on 'has_more'/'next'
+      ?facets=true    include per-filter counts (job_type, work_mode,
+                      experience_level, location, salary bands)
+    Filters: job_type, work_mode, experience_level, location, salary_band
     """
     # Only show published jobs
-    jobs = JobPost.objects.filter(is_published=True).select_related('recruiter').order_by('-created_at')
+    published_jobs = JobPost.objects.filter(is_published=True)
+    jobs = filter_public_jobs(published_jobs.with_company(), request.GET)
     
-    # Optional filters
-    job_type = request.GET.get('job_type')
-    work_mode = request.GET.get('work_mode')
-    location = request.GET.get('location')
+    try:
+        page, next_cursor = paginate_keyset(
+            jobs,
+            cursor=request.GET.get('cursor'),
+            limit=get_page_size(request)
+        )
+    except InvalidCursor:
+        return Response({
+            'success': False,
+            'message': 'Invalid cursor'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    serializer = JobPostSerializer(page, many=True)
+    
+    response_data = {
+        'success': True,
+        'jobs': serializer.data,
+        'next': next_cursor,
+        'has_more': next_cursor is not None
+    }
+    if request.GET.get('has_more', '').lower() not in ('1', 'true'):
+        response_data['count'] = jobs.count()
+    if request.GET.get('facets', '').lower() in ('1', 'true'):
+        response_data['facets'] = public_job_facets(published_jobs, request.GET)
     
-    if job_type:
-        jobs = jobs.filter(job_type=job_type)
-    if work_mode:
-        jobs = jobs.filter(work_mode=work_mode)
-    if location:
-        jobs = jobs.filter(location__icontains=location)
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([])  # Public endpoint
+def search_jobs_view(request):
+    """
+    Full-text search over published jobs, ranked by relevance
+    Matches job title, description, department and required skills.
+      ?q=TEXT                 search text (required)
+      ?limit=N&offset=M       page through the ranked results
+    Accepts the same filters as /api/jobs/public
+    """
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return Response({
+            'success': False,
+            'message': 'Search query (q) is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    serializer = JobPostSerializer(jobs, many=True)
+    try:
+        offset = max(0, int(request.GET.get('offset', 0)))
+    except ValueError:
+        offset = 0
+    limit = get_page_size(request)
+    
+    # The backend ranks, pages and counts within published jobs passing the filters
+    jobs = filter_public_jobs(JobPost.objects.filter(is_published=True), request.GET)
+    backend = get_search_backend()
+    page_ids = backend.search(query, jobs, limit=limit, offset=offset)
+    total = backend.count(query, jobs)
+    
+    jobs_by_id = JobPost.objects.with_company().in_bulk(page_ids)
+    page = [jobs_by_id[job_id] for job_id in page_ids if job_id in jobs_by_id]
+    
+    serializer = JobPostSerializer(page, many=True)
     
     return Response({
         'success': True,
-        'count': jobs.count(),
-        'jobs': serializer.data
+        'query': query,
+        'count': total,
+        'jobs': serializer.data,
+        'has_more': offset + limit < total
     }, status=status.HTTP_200_OK)
 
 
-
 # ============================================================================
 # JOB APPLICATION VIEWS - LinkedIn-style Flow
 # ============================================================================
@@ -791,7 +1022,7 @@ def my_applications_view(request):
     
     applications = JobApplication.objects.filter(
         candidate=request.user
-    ).select_related('job', 'job__recruiter').order_by('-applied_at')
+    ).with_company().order_by('-applied_at')
     
     serializer = JobApplicationSerializer(applications, many=True)
     
@@ -834,19 +1065,13 @@ def check_application_status_view(request, job_id):
     }, status=status.HTTP_200_OK)
 
 
-@api_view(['GET'])
-@permission_classes([IsRecruiter])
-def recruiter_applications_view(request):
-    """
-    Get all applications for recruiter's jobs
-    """
+def filter_recruiter_applications(request):
+    """Applications to the requesting recruiter's jobs, with the ?status and ?job_id filters"""
     # Get all jobs posted by this recruiter
     recruiter_jobs = JobPost.objects.filter(recruiter=request.user)
     
     # Get all applications for these jobs
-    applications = JobApplication.objects.filter(
-        job__in=recruiter_jobs
-    ).select_related('job', 'candidate').order_by('-applied_at')
+    applications = JobApplication.objects.filter(job__in=recruiter_jobs)
     
     # Optional filters
     status_filter = request.GET.get('status')
@@ -856,6 +1081,16 @@ def recruiter_applications_view(request):
         applications = applications.filter(status=status_filter)
     if job_id:
         applications = applications.filter(job_id=job_id)
+    return applications
+
+
+@api_view(['GET'])
+@permission_classes([IsRecruiter])
+def recruiter_applications_view(request):
+    """
+    Get all applications for recruiter's jobs
+    """
+    applications = filter_recruiter_applications(request).with_company().order_by('-applied_at')
     
     serializer = JobApplicationSerializer(applications, many=True)
     
@@ -866,6 +1101,29 @@ def recruiter_applications_view(request):
     }, status=status.HTTP_200_OK)
 
 
+@api_view(['GET'])
+@permission_classes([IsRecruiter])
+def export_applications_view(request, export_format):
+    """
+    Stream the recruiter's applications as a CSV or NDJSON download
+    (applications/recruiter/export.csv or export.ndjson).
+    Supports the same ?status and ?job_id filters as the applications list.
+    """
+    if export_format not in CONTENT_TYPES:
+        return Response({
+            'success': False,
+            'message': 'Export format must be csv or ndjson'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    applications = filter_recruiter_applications(request).order_by('-applied_at', '-id')
+    return streaming_export(
+        export_format,
+        list(APPLICATION_COLUMNS),
+        application_export_rows(applications),
+        filename=f'applications-{timezone.now():%Y%m%d}'
+    )
+
+
 @api_view(['PUT'])
 @permission_classes([IsRecruiter])
 def update_application_status_view(request, application_id):
@@ -873,10 +1131,10 @@ def update_application_status_view(request, application_id):
     Update application status (recruiter only)
     """
     try:
-        application = JobApplication.objects.get(id=application_id)
+        application = JobApplication.objects.with_company().get(id=application_id)
         
         # Security check: Only job owner can update application
-        if application.job.recruiter.id != request.user.id:
+        if application.job.recruiter_id != request.user.id:
             return Response({
                 'success': False,
                 'message': 'Access denied'
@@ -910,6 +1168,50 @@ def update_application_status_view(request, application_id):
             'message': 'Application not found'
         }, status=status.HTTP_404_NOT_FOUND)
 
+@api_view(['POST'])
+@permission_classes([IsRecruiter])
+def bulk_update_application_status_view(request):
+    """
+    Update the status of many applications at once (recruiter only)
+    Body: {"application_ids": [1, 2, 3], "status": "shortlisted", "recruiter_notes": "..."}
+    Applications not found or belonging to another recruiter's jobs are
+    reported per id in 'errors'; the rest are updated.
+    """
+    new_status = request.data.get('status')
+    recruiter_notes = request.data.get('recruiter_notes', '')
+    application_ids = request.data.get('application_ids')
+    
+    if new_status not in dict(JobApplication.STATUS_CHOICES):
+        return Response({
+            'success': False,
+            'message': 'Invalid status'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # A string is iterable too: "12" must not become ids 1 and 2
+        if not isinstance(application_ids, list):
+            raise TypeError
+        application_ids = list(dict.fromkeys(int(application_id) for application_id in application_ids))
+    except (TypeError, ValueError):
+        return Response({
+            'success': False,
+            'message': 'application_ids must be a list of application ids'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    if not application_ids or len(application_ids) > MAX_BULK_APPLICATIONS:
+        return Response({
+            'success': False,
+            'message': f'Provide between 1 and {MAX_BULK_APPLICATIONS} application ids'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    updated, errors = bulk_update_status(request.user, application_ids, new_status, recruiter_notes)
+    
+    return Response({
+        'success': True,
+        'message': f'{len(updated)} applications updated',
+        'updated': updated,
+        'errors': errors
+    }, status=status.HTTP_200_OK)
+
 @api_view(['GET'])
 @permission_classes([IsRecruiter])
 def candidate_profile_view(request, candidate_id):
@@ -921,15 +1223,6 @@ def candidate_profile_view(request, candidate_id):
         # Get the specific candidate
         candidate = get_object_or_404(User, id=candidate_id, role='candidate', is_active=True)
         
-        # Calculate experience years (simplified)
-        experience_years = 0
-        if candidate.experience:
-            # Try to extract years from experience text
-            import re
-            years_match = re.search(r'(\d+)\s*(?:year|yr)', candidate.experience.lower())
-            if years_match:
-                experience_years = int(years_match.group(1))
-        
         # Format skills
         skills = candidate.get_skills_list() if candidate.skills else []
         
@@ -941,7 +1234,7 @@ def candidate_profile_view(request, candidate_id):
             'phone': candidate.phone or '',
             'location': f"{candidate.city or ''}, {candidate.state or ''}".strip(', '),
             'skills': skills,
-            'experience': str(experience_years),
+            'experience': str(candidate.experience_years or 0),
             'jobRole': skills[0] if skills else 'Professional',  # Use first skill as job role
             'currentCompany': 'Available',  # Default since we don't have current company field
             'availability': 'Available',  # Default availability
@@ -952,7 +1245,7 @@ def candidate_profile_view(request, candidate_id):
             'github': candidate.github_url or '',
             'portfolio': candidate.portfolio_url or '',
             'resumeFile': candidate.resume_file_name or '',
-            'profileCompletion': calculate_profile_completion(candidate),
+            'profileCompletion': candidate.profile_completion,
             'joinedDate': candidate.created_at.strftime('%Y-%m-%d') if candidate.created_at else '',
             'profilePhoto': None,  # Add profile photo URL if available
         }
@@ -976,94 +1269,81 @@ def candidate_profile_view(request, candidate_id):
 @permission_classes([IsRecruiter])
 def resume_database_view(request):
     """
-    Resume Database API - Get all candidate profiles for recruiters
-    Returns candidate data for the resume database search functionality
+    Resume Database API - Search candidate profiles for recruiters
+    Filtered and sorted by the database on the candidate search table:
+      ?skills=a,b  ?skill=a   candidates having every listed skill
+      ?location=X             city or state
+      ?min_experience=N       years
+      ?min_completion=N       percent
+      ?active_within=N        days since the profile was last updated
+      ?sort=last_active|joined|experience|completion   (descending)
+      ?limit=N&cursor=TOKEN   cursor pagination, as on /api/jobs/public
+      ?has_more=true          skip the total count
     """
     
-    try:
-        # Get all candidates (users with role='candidate')
-        candidates = User.objects.filter(role='candidate', is_active=True)
-        
-        # Format candidate data for frontend
-        candidate_data = []
-        for candidate in candidates:
-            # Calculate experience years (simplified)
-            experience_years = 0
-            if candidate.experience:
-                # Try to extract years from experience text
-                import re
-                years_match = re.search(r'(\d+)\s*(?:year|yr)', candidate.experience.lower())
-                if years_match:
-                    experience_years = int(years_match.group(1))
-            
-            # Format skills
-            skills = candidate.get_skills_list() if candidate.skills else []
-            
-            # Create candidate profile data
-            candidate_profile = {
-                'id': candidate.id,
-                'name': candidate.full_name,
-                'email': candidate.email,
-                'phone': candidate.phone or '',
-                'location': f"{candidate.city or ''}, {candidate.state or ''}".strip(', '),
-                'skills': skills,
-                'experience': str(experience_years),
-                'jobRole': skills[0] if skills else 'Professional',  # Use first skill as job role
-                'currentCompany': 'Available',  # Default since we don't have current company field
-                'availability': 'Available',  # Default availability
-                'lastActive': candidate.updated_at.strftime('%Y-%m-%d') if candidate.updated_at else '',
-                'bio': candidate.bio or '',
-                'education': candidate.education or '',
-                'linkedin': candidate.linkedin_url or '',
-                'github': candidate.github_url or '',
-                'portfolio': candidate.portfolio_url or '',
-                'resumeFile': candidate.resume_file_name or '',
-                'profileCompletion': calculate_profile_completion(candidate),
-                'joinedDate': candidate.created_at.strftime('%Y-%m-%d') if candidate.created_at else '',
-            }
-            
-            candidate_data.append(candidate_profile)
-        
+    sort = request.GET.get('sort', DEFAULT_SORT)
+    if sort not in SORT_FIELDS:
         return Response({
-            'success': True,
-            'message': f'Found {len(candidate_data)} candidates',
-            'candidates': candidate_data,
-            'total': len(candidate_data)
-        }, status=status.HTTP_200_OK)
-        
-    except Exception as e:
-        print(f"Error in resume_database_view: {str(e)}")
+            'success': False,
+            'message': f"Invalid sort. Use one of: {', '.join(SORT_FIELDS)}"
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    params = request.GET.copy()
+    if params.get('skill') and not params.get('skills'):
+        params['skills'] = params['skill']
+    profiles = filter_candidates(
+        CandidateSearchProfile.objects.filter(candidate__is_active=True),
+        params
+    ).select_related('candidate')
+    
+    try:
+        page, next_cursor = paginate_keyset(
+            profiles,
+            cursor=request.GET.get('cursor'),
+            limit=get_page_size(request),
+            field=SORT_FIELDS[sort]
+        )
+    except InvalidCursor:
         return Response({
             'success': False,
-            'message': 'Failed to load candidates',
-            'error': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-
-def calculate_profile_completion(user):
-    """Calculate profile completion percentage for a candidate"""
-    fields_to_check = [
-        'first_name', 'last_name', 'email', 'phone', 'city', 'state',
-        'bio', 'skills', 'experience', 'education'
-    ]
-    
-    completed_fields = 0
-    total_fields = len(fields_to_check)
-    
-    for field in fields_to_check:
-        value = getattr(user, field, None)
-        if value and str(value).strip():
-            completed_fields += 1
-    
-    # Add bonus for social links
-    social_links = [user.linkedin_url, user.github_url, user.portfolio_url]
-    if any(link for link in social_links if link):
-        completed_fields += 1
-        total_fields += 1
-    
-    # Add bonus for resume
-    if user.resume_file_name or user.resume_file_path:
-        completed_fields += 1
-        total_fields += 1
-    
-    return int((completed_fields / total_fields) * 100) if total_fields > 0 else 0
\ No newline at end of file
+            'message': 'Invalid cursor'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Format candidate data for frontend
+    candidate_data = []
+    for profile in page:
+        candidate = profile.candidate
+        skills = candidate.get_skills_list() if candidate.skills else []
+        candidate_data.append({
+            'id': candidate.id,
+            'name': candidate.full_name,
+            'email': candidate.email,
+            'phone': candidate.phone or '',
+            'location': f"{candidate.city or ''}, {candidate.state or ''}".strip(', '),
+            'skills': skills,
+            'experience': str(profile.experience_years),
+            'jobRole': skills[0] if skills else 'Professional',  # Use first skill as job role
+            'currentCompany': 'Available',  # Default since we don't have current company field
+            'availability': 'Available',  # Default availability
+            'lastActive': profile.last_active.strftime('%Y-%m-%d'),
+            'bio': candidate.bio or '',
+            'education': candidate.education or '',
+            'linkedin': candidate.linkedin_url or '',
+            'github': candidate.github_url or '',
+            'portfolio': candidate.portfolio_url or '',
+            'resumeFile': candidate.resume_file_name or '',
+            'profileCompletion': profile.profile_completion,
+            'joinedDate': profile.joined_at.strftime('%Y-%m-%d'),
+        })
+    
+    response_data = {
+        'success': True,
+        'message': f'Found {len(candidate_data)} candidates',
+        'candidates': candidate_data,
+        'next': next_cursor,
+        'has_more': next_cursor is not None
+    }
+    if request.GET.get('has_more', '').lower() not in ('1', 'true'):
+        response_data['total'] = profiles.count()
+    
+    return Response(response_data, status=status.HTTP_200_OK)
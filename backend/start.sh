@@ -0,0 +1,7 @@
+#!/bin/sh
+# Render start command. A Render service runs one process and its disk is
+# not shared with other services, so the background jobs run next to
+# gunicorn here, on the same SQLite database and MEDIA_ROOT. The loop
+# restarts the job runner if it ever exits.
+(while true; do python manage.py run_background_jobs; sleep 5; done) &
+exec gunicorn job_portal.wsgi:application --bind 0.0.0.0:$PORT
@@ -36,6 +36,8 @@ function JobListing({ jobType }) {
     sortBy: 'latest'
   });
   const [isFilterOpen, setIsFilterOpen] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchJobs();
@@ -88,10 +90,15 @@ function JobListing({ jobType }) {
     return () => window.removeEventListener('refreshContent', handleRefresh);
   }, []);
 
-  const fetchJobs = async () => {
+  // Without a cursor loads the first page; with one appends the next page
+  const fetchJobs = async (cursor = null) => {
     try {
-      // Fetch from public jobs API endpoint
-      const response = await fetch(`${import.meta.env.VITE_API_BASE_URL || 'http://localhost:5010'}/api/jobs/public`);
+      // Fetch from public jobs API endpoint (cursor paginated, newest first)
+      const params = new URLSearchParams({ has_more: 'true' });
+      if (cursor) {
+        params.set('cursor', cursor);
+      }
+      const response = await fetch(`${import.meta.env.VITE_API_BASE_URL || 'http://localhost:5010'}/api/jobs/public?${params}`);
       
       if (response.ok) {
         const data = await response.json();
@@ -99,24 +106,34 @@ function JobListing({ jobType }) {
         
         // Filter by job type if needed (government vs private)
         // For now, show all published jobs
-        setJobs(jobsData);
-        setFilteredJobs(jobsData);
+        setJobs(prevJobs => (cursor ? [...prevJobs, ...jobsData] : jobsData));
+        setNextCursor(data.next || null);
         
         console.log(`Loaded ${jobsData.length} real jobs from database`);
       } else {
         console.error('Failed to fetch jobs:', response.status);
         // Don't use dummy data - show empty state
-        setJobs([]);
-        setFilteredJobs([]);
+        if (!cursor) {
+          setJobs([]);
+          setNextCursor(null);
+        }
       }
     } catch (error) {
       console.error('Error fetching jobs:', error);
       // Don't use dummy data - show empty state
-      setJobs([]);
-      setFilteredJobs([]);
+      if (!cursor) {
+        setJobs([]);
+        setNextCursor(null);
+      }
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    await fetchJobs(nextCursor);
+    setLoadingMore(false);
+  };
+
   useEffect(() => {
     // Apply filters and search
     let filtered = [...jobs];
@@ -325,6 +342,16 @@ function JobListing({ jobType }) {
               </div>
             )}
           </div>
+          
+          {nextCursor && (
+            <button
+              className="load-more-jobs"
+              onClick={handleLoadMore}
+              disabled={loadingMore}
+            >
+              {loadingMore ? 'Loading...' : 'Load more jobs'}
+            </button>
+          )}
         </div>
       </div>
 